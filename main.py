@@ -7,38 +7,41 @@
 # ///
 
 import asyncio
+import logging
 import random
 import sys
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
 import pygame
 
 from src import support
+from src.boot import BootTimer
 from src.enums import GameState
 from src.events import DIALOG_ADVANCE, DIALOG_SHOW, OPEN_INVENTORY
 from src.groups import AllSprites
 from src.gui.interface.dialog import DialogueManager
+from src.gui.menu.abstract_menu import AbstractMenu
 from src.gui.setup import setup_gui
+from src.map_registry import TmxMapRegistry
+from src.overlay.blur import Blur
 from src.overlay.fast_forward import FastForward
 from src.savefile import SaveFile
-from src.screens.inventory import InventoryMenu, prepare_checkmark_for_buttons
-from src.screens.level import Level
 from src.screens.menu_main import MainMenu
-from src.screens.menu_pause import PauseMenu
-from src.screens.menu_round_end import RoundMenu
-from src.screens.menu_settings import SettingsMenu
-from src.screens.player_task import PlayerTask
-from src.screens.shop import ShopMenu
-from src.screens.switch_to_outgroup_menu import OutgroupMenu
 from src.settings import (
     EMOTE_SIZE,
+    PAUSED_BACKGROUND_DIM,
     RANDOM_SEED,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     AniFrames,
-    MapDict,
     SoundDict,
 )
-from src.sprites.setup import setup_entity_assets
+
+if TYPE_CHECKING:
+    from src.screens.level import Level
+
+logger = logging.getLogger(__name__)
 
 # set random seed. It has to be set first before any other random function is called.
 random.seed(RANDOM_SEED)
@@ -51,10 +54,37 @@ _COSMETIC_SUBSURF_AREAS = {
     "necklace": pygame.Rect(0, 16, 21, 22),
     "hat": pygame.Rect(24, 16, 20, 11),
 }
+# shown behind the main menu until the level has been set up, same as the
+# background of the world
+_BOOT_BACKGROUND_COLOR = (130, 168, 132)
 
 
 class Game:
+    """
+    The game is set up in stages. Only the main menu is set up before the first
+    frame is shown; all other stages are run one per frame while the main menu
+    is shown, or all at once as soon as the main menu is left. All menus other
+    than the main menu are only created once they are first shown.
+
+    The gameplay modules (and with them pathfinding) are only imported by those
+    later stages, so that they do not delay the first frame either.
+
+    Attributes:
+        boot_timer: timings of all stages the game has been set up in
+        level: the Level, None until its stage has been run
+        menus: all menus that have been created so far, by the state they are
+               shown in
+    """
+
+    boot_timer: BootTimer
+    level: "Level | None"
+    menus: dict[GameState, AbstractMenu]
+
+    _boot_steps: Iterator[None] | None
+
     def __init__(self):
+        self.boot_timer = BootTimer()
+
         # main setup
         pygame.init()
         screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -66,10 +96,12 @@ class Game:
         self.overlay_frames: dict[str, pygame.Surface] | None = None
         self.cosmetic_frames: dict[str, pygame.Surface] = {}
         self.frames: dict[str, dict] | None = None
-        self.previous_frame = ""
+        # last frame before the game was paused, shown behind the menus
+        self.previous_frame: pygame.Surface | None = None
         self.fast_forward = FastForward()
+        self.goggles_blur = Blur()
         # assets
-        self.tmx_maps: MapDict | None = None
+        self.tmx_maps: TmxMapRegistry | None = None
 
         self.emotes: AniFrames | None = None
 
@@ -81,129 +113,245 @@ class Game:
         # main setup
         self.running = True
         self.clock = pygame.time.Clock()
-        self.load_assets()
 
         # screens
-        self.level = Level(
-            self.switch_state,
-            self.tmx_maps,
-            self.frames,
-            self.sounds,
-            self.save_file,
-            self.clock,
-        )
-        self.player = self.level.player
+        self.level = None
+        self.player = None
 
         self.token_status = False
-        self.main_menu = MainMenu(self.switch_state)
-        self.pause_menu = PauseMenu(self.switch_state)
-        self.task_menu = PlayerTask(self.switch_state, self.level)
-        self.settings_menu = SettingsMenu(
-            self.switch_state, self.sounds, self.player.controls
-        )
-        self.shop_menu = ShopMenu(self.player, self.switch_state, self.font)
-        self.inventory_menu = InventoryMenu(
-            self.player,
-            self.frames,
-            self.switch_state,
-            self.player.assign_tool,
-            self.player.assign_seed,
-        )
-        self.round_menu = RoundMenu(self.switch_state, self.player)
-        self.outgroup_menu = OutgroupMenu(
-            self.player,
-            self.switch_state,
-        )
+        with self.boot_timer.timed("main menu"):
+            self.main_menu = MainMenu(self.switch_state)
 
         # dialog
         self.all_sprites = AllSprites()
-        self.dialogue_manager = DialogueManager(self.all_sprites)
+        self.dialogue_manager = None
 
         # timer(s)
         self.round_end_timer = 0.0
         self.ROUND_END_TIME_IN_MINUTES = 15
 
         # screens
-        self.menus = {
-            GameState.MAIN_MENU: self.main_menu,
-            GameState.PAUSE: self.pause_menu,
-            GameState.SETTINGS: self.settings_menu,
-            GameState.SHOP: self.shop_menu,
-            GameState.INVENTORY: self.inventory_menu,
-            GameState.PLAYER_TASK: self.task_menu,
-            GameState.ROUND_END: self.round_menu,
-            GameState.OUTGROUP_MENU: self.outgroup_menu,
-        }
+        self.menus = {GameState.MAIN_MENU: self.main_menu}
         self.current_state = GameState.MAIN_MENU
 
         # intro to in-group msg.
         self.intro_txt_shown = False
 
+        # everything else is set up once the main menu is shown
+        self._boot_steps = self.boot()
+
+    def boot(self) -> Iterator[None]:
+        """
+        Set up everything that is not needed to show the main menu.
+        :return: Iterator that has to be exhausted to set up the game. Every
+                 step runs a single stage
+        """
+        timed = self.boot_timer.timed
+
+        with timed("imports"):
+            # the gameplay modules are only imported now, so that importing
+            # them does not delay the first frame
+            from src.screens.level import Level
+
+        yield
+
+        yield from self.load_assets()
+
+        with timed("level"):
+            self.level = Level(
+                self.switch_state,
+                self.tmx_maps,
+                self.frames,
+                self.sounds,
+                self.save_file,
+                self.clock,
+            )
+            self.player = self.level.player
+            self.dialogue_manager = DialogueManager(self.all_sprites)
+
+        # everything that is imported on startup has been cached by now
+        with timed("asset cache"):
+            support.asset_cache.save()
+
+    def continue_boot(self):
+        """
+        Run the next stage of setting up the game, if any stages are left.
+        """
+        if self._boot_steps is None:
+            return
+
+        if next(self._boot_steps, StopIteration) is StopIteration:
+            self._boot_steps = None
+            logger.info("Game set up in:\n%s", self.boot_timer.get_report())
+
+    def finish_boot(self):
+        """
+        Run all stages of setting up the game that are left.
+        """
+        while self._boot_steps is not None:
+            self.continue_boot()
+
+    def get_menu(self, state: GameState) -> AbstractMenu:
+        """
+        :return: The menu that is shown in the given state. Menus are created
+                 the first time they are needed
+        """
+        menu = self.menus.get(state)
+        if menu is None:
+            with self.boot_timer.timed(f"{state.name.lower()} menu"):
+                menu = self.menus[state] = self._create_menu(state)
+        return menu
+
+    def _create_menu(self, state: GameState) -> AbstractMenu:
+        # the menus depend on the gameplay modules, which are only imported once
+        # the game has been set up
+        from src.screens.inventory import InventoryMenu
+        from src.screens.menu_pause import PauseMenu
+        from src.screens.menu_round_end import RoundMenu
+        from src.screens.menu_settings import SettingsMenu
+        from src.screens.player_task import PlayerTask
+        from src.screens.shop import ShopMenu
+        from src.screens.switch_to_outgroup_menu import OutgroupMenu
+
+        match state:
+            case GameState.PAUSE:
+                return PauseMenu(self.switch_state)
+            case GameState.SETTINGS:
+                return SettingsMenu(
+                    self.switch_state, self.sounds, self.player.controls
+                )
+            case GameState.SHOP:
+                return ShopMenu(self.player, self.switch_state, self.font)
+            case GameState.INVENTORY:
+                return InventoryMenu(
+                    self.player,
+                    self.frames,
+                    self.switch_state,
+                    self.player.assign_tool,
+                    self.player.assign_seed,
+                )
+            case GameState.PLAYER_TASK:
+                return PlayerTask(self.switch_state, self.level)
+            case GameState.ROUND_END:
+                return RoundMenu(self.switch_state, self.player)
+            case GameState.OUTGROUP_MENU:
+                return OutgroupMenu(self.player, self.switch_state)
+        raise ValueError(f"No menu is shown in state {state}")
+
     def switch_state(self, state: GameState):
+        # leaving the main menu requires everything to be set up
+        self.finish_boot()
+
+        was_paused = self.game_paused()
         self.current_state = state
         if self.current_state == GameState.SAVE_AND_RESUME:
             self.save_file.set_soil_data(*self.level.soil_manager.all_soil_sprites())
             self.level.player.save()
             self.current_state = GameState.PLAY
         if self.current_state == GameState.INVENTORY:
-            self.inventory_menu.refresh_buttons_content()
+            self.get_menu(GameState.INVENTORY).refresh_buttons_content()
         if self.current_state == GameState.ROUND_END:
-            self.round_menu.reset_menu()
-            self.round_menu.generate_items()
+            round_menu = self.get_menu(GameState.ROUND_END)
+            round_menu.reset_menu()
+            round_menu.generate_items()
         if self.game_paused():
             self.player.blocked = True
             self.player.direction.update((0, 0))
+            if not was_paused:
+                self.capture_paused_frame()
         else:
             self.player.blocked = False
 
-    def load_assets(self):
-        self.tmx_maps = support.tmx_importer("data/maps")
+    def capture_paused_frame(self):
+        """
+        Take a snapshot of the current frame, which will be shown behind the
+        menus for as long as the game is paused.
+        """
+        self.previous_frame = self.display_surface.copy()
+        if PAUSED_BACKGROUND_DIM:
+            self.previous_frame.fill(
+                (PAUSED_BACKGROUND_DIM,) * 3, special_flags=pygame.BLEND_RGB_SUB
+            )
+
+    def load_assets(self) -> Iterator[None]:
+        """
+        Load all assets, one category per step.
+        """
+        from src.screens.inventory import prepare_checkmark_for_buttons
+        from src.sprites.setup import setup_entity_assets
+
+        timed = self.boot_timer.timed
+
+        with timed("maps"):
+            self.tmx_maps = support.tmx_importer("data/maps")
+
+        yield
 
         # frames
-        self.emotes = support.animation_importer(
-            "images/ui/emotes/sprout_lands", frame_size=EMOTE_SIZE, resize=EMOTE_SIZE
-        )
-
-        self.level_frames = {
-            "animations": support.animation_importer("images", "animations"),
-            "soil": support.import_folder_dict("images/soil"),
-            "soil water": support.import_folder_dict("images/soil water"),
-            "tomato": support.import_folder("images/plants/tomato"),
-            "corn": support.import_folder("images/plants/corn"),
-            "rain drops": support.import_folder("images/rain/drops"),
-            "rain floor": support.import_folder("images/rain/floor"),
-            "objects": support.import_folder_dict("images/objects"),
-            "drops": support.import_folder_dict("images/drops"),
-        }
-        self.overlay_frames = support.import_folder_dict("images/overlay")
-        cosmetic_surf = pygame.image.load(
-            support.resource_path("images/cosmetics.png")
-        ).convert_alpha()
-        for cosmetic in _COSMETICS:
-            self.cosmetic_frames[cosmetic] = pygame.transform.scale_by(
-                cosmetic_surf.subsurface(_COSMETIC_SUBSURF_AREAS[cosmetic]),
-                _COSMETIC_SCALE_FACTORS[cosmetic],
+        with timed("emotes"):
+            self.emotes = support.animation_importer(
+                "images/ui/emotes/sprout_lands",
+                frame_size=EMOTE_SIZE,
+                resize=EMOTE_SIZE,
+                pack=True,
+            )
+        yield
+
+        with timed("level frames"):
+            self.level_frames = {
+                "animations": support.animation_importer("images", "animations"),
+                "soil": support.import_folder_dict("images/soil", pack=True),
+                "soil water": support.import_folder_dict(
+                    "images/soil water", pack=True
+                ),
+                "tomato": support.import_folder("images/plants/tomato", pack=True),
+                "corn": support.import_folder("images/plants/corn", pack=True),
+                "rain drops": support.import_folder("images/rain/drops", pack=True),
+                "rain floor": support.import_folder("images/rain/floor", pack=True),
+                "objects": support.import_folder_dict("images/objects", pack=True),
+                "drops": support.import_folder_dict("images/drops", pack=True),
+            }
+        yield
+
+        with timed("overlay frames"):
+            self.overlay_frames = support.import_folder_dict(
+                "images/overlay", pack=True
             )
-        self.frames = {
-            "emotes": self.emotes,
-            "level": self.level_frames,
-            "overlay": self.overlay_frames,
-            "cosmetics": self.cosmetic_frames,
-            "checkmark": pygame.transform.scale_by(
-                pygame.image.load(
-                    support.resource_path("images/checkmark.png")
-                ).convert_alpha(),
-                4,
-            ),
-        }
-        prepare_checkmark_for_buttons(self.frames["checkmark"])
-
-        setup_entity_assets()
-
-        setup_gui()
+            cosmetic_surf = pygame.image.load(
+                support.resource_path("images/cosmetics.png")
+            ).convert_alpha()
+            for cosmetic in _COSMETICS:
+                self.cosmetic_frames[cosmetic] = pygame.transform.scale_by(
+                    cosmetic_surf.subsurface(_COSMETIC_SUBSURF_AREAS[cosmetic]),
+                    _COSMETIC_SCALE_FACTORS[cosmetic],
+                )
+            self.frames = {
+                "emotes": self.emotes,
+                "level": self.level_frames,
+                "overlay": self.overlay_frames,
+                "cosmetics": self.cosmetic_frames,
+                "checkmark": pygame.transform.scale_by(
+                    pygame.image.load(
+                        support.resource_path("images/checkmark.png")
+                    ).convert_alpha(),
+                    4,
+                ),
+            }
+            prepare_checkmark_for_buttons(self.frames["checkmark"])
+        yield
+
+        with timed("entities"):
+            setup_entity_assets()
+        yield
+
+        with timed("gui"):
+            setup_gui()
+
+        yield
 
         # sounds
-        self.sounds = support.sound_importer("audio", default_volume=0.25)
+        with timed("sounds"):
+            self.sounds = support.sound_importer("audio", default_volume=0.25)
 
         self.font = support.import_font(30, "font/LycheeSoda.ttf")
 
@@ -224,7 +372,7 @@ class Game:
                 continue
 
             if self.game_paused():
-                if self.menus[self.current_state].handle_event(event):
+                if self.get_menu(self.current_state).handle_event(event):
                     continue
 
             if self.level.handle_event(event):
@@ -253,9 +401,34 @@ class Game:
             return True
         return False
 
+    async def run_boot(self, mouse: pygame.Surface):
+        """
+        Show the main menu while the game is set up, running one stage of the
+        setup per frame. Returns once the game has been set up completely.
+        :param mouse: Cursor to draw on top of the main menu
+        """
+        while self.running and self.level is None:
+            dt = self.clock.tick() / 1000
+
+            for event in pygame.event.get():
+                if self.handle_event(event):
+                    continue
+                self.main_menu.handle_event(event)
+
+            self.display_surface.fill(_BOOT_BACKGROUND_COLOR)
+            self.main_menu.update(dt)
+            self.display_surface.blit(mouse, pygame.mouse.get_pos())
+            pygame.display.update()
+            self.boot_timer.mark_first_frame()
+
+            self.continue_boot()
+            await asyncio.sleep(0)
+
     async def run(self):
         pygame.mouse.set_visible(False)
         mouse = pygame.image.load(support.resource_path("images/overlay/cursor.png"))
+        await self.run_boot(mouse)
+
         is_first_frame = True
         while self.running:
             dt = self.clock.tick() / 1000
@@ -273,7 +446,7 @@ class Game:
 
             if self.game_paused() and not is_first_frame:
                 self.display_surface.blit(self.previous_frame, (0, 0))
-                self.menus[self.current_state].update(dt)
+                self.get_menu(self.current_state).update(dt)
             else:
                 self.round_end_timer += dt
                 if self.round_end_timer > self.ROUND_END_TIME_IN_MINUTES * 60:
@@ -293,19 +466,29 @@ class Game:
 
             # Apply blur effect only if the player has goggles equipped
             if self.player.has_goggles and self.current_state == GameState.PLAY:
-                surface = pygame.transform.box_blur(self.display_surface, 2)
-                self.display_surface.blit(surface, (0, 0))
+                self.goggles_blur.apply()
 
             self.show_intro_msg()
             mouse_pos = pygame.mouse.get_pos()
-            if not self.game_paused() or is_first_frame:
-                self.previous_frame = self.display_surface.copy()
+            if is_first_frame and self.game_paused():
+                self.capture_paused_frame()
+                self.display_surface.blit(self.previous_frame, (0, 0))
+                self.get_menu(self.current_state).update(dt)
+
+            # keep the area below the cursor, so that the frame can be restored
+            # without the cursor in case the game gets paused before the next one
+            cursor_rect = mouse.get_rect(topleft=mouse_pos).clip(
+                self.display_surface.get_rect()
+            )
+            below_cursor = self.display_surface.subsurface(cursor_rect).copy()
             self.display_surface.blit(mouse, mouse_pos)
             is_first_frame = False
             pygame.display.update()
+            self.display_surface.blit(below_cursor, cursor_rect)
             await asyncio.sleep(0)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     game = Game()
     asyncio.run(game.run())
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Callable
+
+import pygame
+
+# Bump whenever the format of the cached frames changes, to discard old caches
+_CACHE_VERSION = 1
+_MANIFEST_NAME = "manifest.json"
+
+
+class AssetCache:
+    """
+    Persistent on-disk cache of image frames, so that source images do not have
+    to be decoded, scaled and sliced again on every launch.
+
+    Each entry holds all frames that were built from a single source image,
+    stored as zlib-compressed raw pixel data. Entries are keyed on the path of
+    the source image and a variant describing how the frames were built from
+    it (e.g. the scale factor). An entry is rebuilt once the modification time
+    of its source image changes.
+
+    Frames loaded from the cache are converted to the display format, so the
+    display mode has to be set before the cache is used.
+
+    Attributes:
+        hits: number of entries that could be loaded from the cache
+        misses: number of entries that had to be built from their source image
+    """
+
+    cache_dir: str
+    enabled: bool
+    hits: int
+    misses: int
+
+    _entries: dict[str, dict]
+    _dirty: bool
+
+    def __init__(self, cache_dir: str, enabled: bool = True):
+        """
+        :param cache_dir: directory the cached frames and their manifest are
+                          stored in, created when the cache is first written to
+        :param enabled: whether the cache should be used. When disabled, all
+                        frames are built from their source images
+        """
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = self._load_manifest() if enabled else {}
+        self._dirty = False
+
+    def _load_manifest(self) -> dict[str, dict]:
+        try:
+            with open(os.path.join(self.cache_dir, _MANIFEST_NAME), "r") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("version") != _CACHE_VERSION:
+            return {}
+        return manifest["entries"]
+
+    def save(self):
+        """
+        Write the manifest of all cached entries to disk, if any entry has been
+        rebuilt since it was last written.
+        """
+        if not self._dirty:
+            return
+
+        manifest = {"version": _CACHE_VERSION, "entries": self._entries}
+        try:
+            self._write_file(_MANIFEST_NAME, json.dumps(manifest).encode())
+        except OSError:
+            return
+        self._dirty = False
+
+    def is_stale(self, source_path: str, variant: str) -> bool:
+        """
+        :return: Whether the frames have to be built from the source image,
+                 because there is no up-to-date entry for them in the cache
+        """
+        if not self.enabled:
+            return True
+
+        entry = self._entries.get(f"{source_path}|{variant}")
+        return entry is None or entry["mtime"] != os.stat(source_path).st_mtime_ns
+
+    def get(
+        self,
+        source_path: str,
+        variant: str,
+        build: Callable[[], list[pygame.Surface]],
+    ) -> list[pygame.Surface]:
+        """
+        :param source_path: path of the image the frames are built from
+        :param variant: description of how the frames are built from the source
+                        image. Has to change whenever build would return
+                        different frames for the same source image
+        :param build: callable building the frames from the source image, used
+                      when there is no up-to-date entry in the cache
+        :return: frames built from the source image
+        """
+        if not self.enabled:
+            return build()
+
+        key = f"{source_path}|{variant}"
+        mtime = os.stat(source_path).st_mtime_ns
+        entry = self._entries.get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            frames = self._read_entry(entry)
+            if frames is not None:
+                self.hits += 1
+                return frames
+
+        self.misses += 1
+        frames = build()
+        self._write_entry(key, mtime, frames)
+        return frames
+
+    def _read_entry(self, entry: dict) -> list[pygame.Surface] | None:
+        try:
+            with open(os.path.join(self.cache_dir, entry["file"]), "rb") as file:
+                data = zlib.decompress(file.read())
+        except (OSError, zlib.error):
+            return None
+
+        frames = []
+        offset = 0
+        for width, height, alpha in entry["frames"]:
+            size = width * height * (4 if alpha else 3)
+            if offset + size > len(data):
+                return None
+
+            surf = pygame.image.frombytes(
+                data[offset : offset + size],
+                (width, height),
+                "RGBA" if alpha else "RGB",
+            )
+            frames.append(surf.convert_alpha() if alpha else surf.convert())
+            offset += size
+        return frames
+
+    def _write_entry(self, key: str, mtime: int, frames: list[pygame.Surface]):
+        file_name = f"{hashlib.sha1(key.encode()).hexdigest()}.bin"
+
+        frame_info = []
+        pixels = []
+        for frame in frames:
+            alpha = bool(frame.get_flags() & pygame.SRCALPHA)
+            frame_info.append((*frame.get_size(), alpha))
+            pixels.append(pygame.image.tobytes(frame, "RGBA" if alpha else "RGB"))
+
+        try:
+            self._write_file(file_name, zlib.compress(b"".join(pixels), 1))
+        except OSError:
+            return
+
+        self._entries[key] = {"mtime": mtime, "file": file_name, "frames": frame_info}
+        self._dirty = True
+
+    def _write_file(self, file_name: str, data: bytes):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, file_name)
+        # written to a temporary file first, so that an interrupted write can
+        # never leave a truncated file behind
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(data)
+        os.replace(f"{path}.tmp", path)
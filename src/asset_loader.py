@@ -0,0 +1,45 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class AssetLoader:
+    """
+    Runs the decoding of asset files in a bounded pool of worker threads.
+    pygame decodes images and sounds in C code that releases the GIL, so the
+    decodes of multiple files can overlap.
+
+    Only the decoding should be submitted to the loader. Everything that
+    depends on the display (e.g. Surface.convert_alpha) or modifies shared
+    state should stay on the main thread.
+    """
+
+    _max_workers: int
+    _executor: ThreadPoolExecutor | None
+
+    def __init__(self, max_workers: int):
+        """
+        :param max_workers: maximum number of worker threads. With 0 workers,
+                            all tasks are run on the thread submitting them
+        """
+        self._max_workers = max_workers
+        self._executor = None
+
+    def submit[T](self, fn: Callable[..., T], *args) -> Future[T]:
+        """
+        Schedule fn to be called with the given arguments in a worker thread.
+        :return: Future of the result of the call
+        """
+        if not self._max_workers:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exception:
+                future.set_exception(exception)
+            return future
+
+        # workers are only started once there is something to load
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="asset-loader"
+            )
+        return self._executor.submit(fn, *args)
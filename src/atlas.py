@@ -0,0 +1,153 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import pygame
+
+
+@dataclass
+class _Shelf:
+    y: int
+    height: int
+    x: int = 0
+
+
+@dataclass
+class _Page:
+    size: tuple[int, int]
+    shelves: list[_Shelf]
+    rects: dict[str, pygame.Rect]
+
+    def get_used_size(self) -> tuple[int, int]:
+        return (
+            max(rect.right for rect in self.rects.values()),
+            max(rect.bottom for rect in self.rects.values()),
+        )
+
+    def insert(self, name: str, size: tuple[int, int]) -> bool:
+        """
+        Reserve space for a rect of the given size on this page, on the first
+        shelf it fits on. A new shelf is opened below all others if needed.
+        :return: Whether there was enough space left on this page
+        """
+        width, height = size
+        for shelf in self.shelves:
+            if height <= shelf.height and shelf.x + width <= self.size[0]:
+                self.rects[name] = pygame.Rect(shelf.x, shelf.y, width, height)
+                shelf.x += width
+                return True
+
+        y = self.shelves[-1].y + self.shelves[-1].height if self.shelves else 0
+        if y + height > self.size[1] or width > self.size[0]:
+            return False
+
+        self.shelves.append(_Shelf(y, height, width))
+        self.rects[name] = pygame.Rect(0, y, width, height)
+        return True
+
+
+class TextureAtlas:
+    """
+    Packs many small Surfaces into a few large pages, so that fewer separate
+    Surfaces have to be allocated, and Surfaces of the same asset family lie
+    next to each other in memory.
+
+    Packed Surfaces are replaced by subsurfaces of the pages, which can be
+    looked up by the name they were packed under. The pages are shared by all
+    subsurfaces, so the subsurfaces must not be modified.
+
+    Attributes:
+        name: name of the atlas, used in the occupancy report
+        page_size: maximum width and height of a single page. Surfaces that
+                   are larger than that get a page of their own
+        pages: all pages of the atlas, sized to fit the Surfaces packed onto them
+    """
+
+    name: str
+    page_size: int
+    pages: list[pygame.Surface]
+
+    _subsurfaces: dict[str, pygame.Surface]
+    _used_area: list[int]
+
+    def __init__(self, name: str, page_size: int):
+        self.name = name
+        self.page_size = page_size
+        self.pages = []
+
+        self._subsurfaces = {}
+        self._used_area = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._subsurfaces
+
+    def __len__(self) -> int:
+        return len(self._subsurfaces)
+
+    def get(self, name: str) -> pygame.Surface:
+        """
+        :return: The subsurface of the Surface that was packed under this name
+        """
+        return self._subsurfaces[name]
+
+    def pack(self, surfaces: Mapping[str, pygame.Surface]) -> dict[str, pygame.Surface]:
+        """
+        Pack the given Surfaces onto new pages.
+        The Surfaces are copied exactly, including their per-pixel alpha.
+        :param surfaces: Surfaces to pack, mapped to their names
+        :return: The subsurfaces replacing the given Surfaces, mapped to their
+                 names
+        """
+        # Shelf packing wastes the least space when tall Surfaces come first
+        names = sorted(
+            surfaces,
+            key=lambda name: (surfaces[name].get_height(), surfaces[name].get_width()),
+            reverse=True,
+        )
+
+        layout: list[_Page] = []
+        for name in names:
+            size = surfaces[name].get_size()
+            if not any(page.insert(name, size) for page in layout):
+                page_size = (max(self.page_size, size[0]), max(self.page_size, size[1]))
+                page = _Page(page_size, [], {})
+                page.insert(name, size)
+                layout.append(page)
+
+        for page in layout:
+            surf = pygame.Surface(page.get_used_size(), pygame.SRCALPHA)
+            surf = surf.convert_alpha()
+            used_area = 0
+            for name, rect in page.rects.items():
+                # blending the Surfaces onto the (transparent) page would alter
+                # the colour of all partially transparent pixels
+                surf.blit(surfaces[name], rect, special_flags=pygame.BLEND_RGBA_MAX)
+                self._subsurfaces[name] = surf.subsurface(rect)
+                used_area += rect.width * rect.height
+
+            self.pages.append(surf)
+            self._used_area.append(used_area)
+
+        return {name: self._subsurfaces[name] for name in surfaces}
+
+    def get_occupancy(self) -> list[float]:
+        """
+        :return: The share of each page's area (0 - 1) that is covered by
+                 packed Surfaces
+        """
+        return [
+            used_area / (page.get_width() * page.get_height())
+            for page, used_area in zip(self.pages, self._used_area, strict=True)
+        ]
+
+    def get_report(self) -> str:
+        """
+        :return: Human-readable summary of the pages of this atlas and how much
+                 of them is occupied
+        """
+        lines = [f"{self.name}: {len(self)} surfaces on {len(self.pages)} page(s)"]
+        for index, (page, occupancy) in enumerate(
+            zip(self.pages, self.get_occupancy(), strict=True)
+        ):
+            width, height = page.get_size()
+            lines.append(f"  page {index}: {width}x{height}, {occupancy:.1%} occupied")
+        return "\n".join(lines)
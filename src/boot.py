@@ -0,0 +1,61 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class BootTimer:
+    """
+    Measures how long each stage of setting up the game takes, and how long it
+    takes until the first frame is shown.
+
+    Attributes:
+        stages: time (in seconds) each stage took, in the order the stages were
+                run in
+        first_frame: time (in seconds) from the creation of the timer until the
+                     first frame was shown, None until then
+    """
+
+    stages: dict[str, float]
+    first_frame: float | None
+
+    _start: float
+
+    def __init__(self):
+        self.stages = {}
+        self.first_frame = None
+
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """
+        Measure how long the given stage takes.
+        Repeated measurements of the same stage are added up.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[stage] = self.stages.get(stage, 0) + elapsed
+
+    def mark_first_frame(self):
+        """
+        Record that the first frame has been shown, unless it has been recorded
+        already.
+        """
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self._start
+
+    def get_report(self) -> str:
+        """
+        :return: Human-readable summary of the time each stage took
+        """
+        lines = [
+            f"{stage}: {elapsed * 1000:.1f} ms"
+            for stage, elapsed in self.stages.items()
+        ]
+        if self.first_frame is not None:
+            lines.append(f"first frame after: {self.first_frame * 1000:.1f} ms")
+        lines.append(f"total: {(time.perf_counter() - self._start) * 1000:.1f} ms")
+        return "\n".join(lines)
@@ -1,3 +1,4 @@
+import math
 import warnings
 
 import pygame
@@ -35,6 +36,13 @@ class Camera:
         self._quake_vec: pygame.Vector2 | None = None
         self.state = pygame.Rect(0, 0, width, height)
 
+        # area of the screen that is visible when zoomed in, and the buffer the
+        # world is rendered to before it is scaled up to fill the screen
+        self._zoom = 1
+        self._zoom_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._zoom_buffer: pygame.Surface | None = None
+        self._zoom_surface: pygame.Surface | None = None
+
     def change_size(self, width: int, height: int):
         if width <= 0:
             warnings.warn(
@@ -57,16 +65,78 @@ class Camera:
     def set_quake_vec(self, vec: pygame.Vector2 | None):
         self._quake_vec = vec
 
-    def apply(self, target: Sprite):
-        ret = target.rect.move(self.state.topleft)
+    def set_zoom(self, zoom_factor: float):
+        """
+        :param zoom_factor: How much the camera should zoom in, in addition to
+                            the regular scale (0 means no zoom)
+        """
+        self._zoom = zoom_factor + 1
+        width = math.ceil(SCREEN_WIDTH / self._zoom)
+        height = math.ceil(SCREEN_HEIGHT / self._zoom)
+        self._zoom_rect.update(
+            ((SCREEN_WIDTH - width) // 2, (SCREEN_HEIGHT - height) // 2),
+            (width, height),
+        )
+
+    @property
+    def zoomed(self) -> bool:
+        return self._zoom != 1
+
+    def get_render_surface(self, display_surface: pygame.Surface) -> pygame.Surface:
+        """
+        :return: Surface the world should be rendered to. When zoomed in, this
+                 is a buffer which only covers the area that remains visible
+                 after zooming, and has to be scaled up with Camera.present
+        """
+        if not self.zoomed:
+            return display_surface
+
+        if self._zoom_buffer is None:
+            self._zoom_buffer = pygame.Surface(
+                display_surface.get_size(), 0, display_surface
+            )
+        self._zoom_surface = self._zoom_buffer.subsurface((0, 0), self._zoom_rect.size)
+        return self._zoom_surface
+
+    def present(self, display_surface: pygame.Surface):
+        """
+        Scale the world rendered to the zoom buffer up onto display_surface.
+        Does nothing if the camera is not zoomed in.
+        """
+        if not self.zoomed or self._zoom_surface is None:
+            return
+
+        pygame.transform.scale(
+            self._zoom_surface, display_surface.get_size(), display_surface
+        )
+
+    def get_offset(self) -> tuple[float, float]:
+        """
+        :return: offset that has to be added to a position on the map to get
+                 its position on the render surface
+        """
+        left, top = self.state.topleft
+        if self.zoomed:
+            left -= self._zoom_rect.left
+            top -= self._zoom_rect.top
         if self._quake_vec is not None:
-            ret.move_ip(self._quake_vec)
-        return ret
+            left += self._quake_vec.x
+            top += self._quake_vec.y
+        return left, top
+
+    def apply(self, target: Sprite):
+        return target.rect.move(self.get_offset())
 
     @property
     def size(self):
         return self._width, self._height
 
+    @property
+    def viewport(self) -> pygame.FRect:
+        """The area of the map that is currently visible on screen."""
+        offset_x, offset_y = self.get_offset()
+        return pygame.FRect((-offset_x, -offset_y), self._zoom_rect.size)
+
     def _complex_camera(self, target_rect: pygame.Rect):
         left, top = target_rect.topleft
         w, h = self.size
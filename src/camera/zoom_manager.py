@@ -1,8 +1,6 @@
 import warnings
 from typing import Iterable
 
-import pygame
-
 from src.enums import ZoomState
 from src.exceptions import CameraWarning, InvalidMapError
 from src.gui.scene_animation import SceneAnimation
@@ -83,10 +81,3 @@ class ZoomManager:
             return
 
         self._zoom_progress(dt, (self.zoom_state == ZoomState.ZOOMING_OUT))
-
-    def apply_zoom(self):
-        surf = pygame.display.get_surface()
-        surf_rect = surf.get_frect()
-        zoomed_area = pygame.transform.scale_by(surf, self.zoom_factor + 1)
-        zoomed_rect = zoomed_area.get_frect(center=surf_rect.center)
-        surf.blit(zoomed_area, zoomed_rect)
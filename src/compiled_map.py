@@ -0,0 +1,307 @@
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pygame
+
+# Compiled maps start with the magic bytes, the format version and the length of
+# the JSON metadata. Everything after this header is zlib-compressed
+MAP_MAGIC = b"PDVM"
+# Bump whenever the format of compiled maps changes, to discard old compiled maps
+MAP_FORMAT_VERSION = 1
+MAP_HEADER = struct.Struct("<4sHI")
+
+# bits of the tile flags stored for each image
+FLIPPED_HORIZONTALLY = 1
+FLIPPED_VERTICALLY = 2
+FLIPPED_DIAGONALLY = 4
+
+
+@dataclass
+class CompiledObject:
+    """
+    Object of an object layer, as defined in Tiled.
+    Positions and sizes are not scaled up by SCALE_FACTOR.
+    """
+
+    id: int
+    name: str | None
+    x: float
+    y: float
+    width: float
+    height: float
+    gid: int
+    properties: dict[str, Any]
+
+
+@dataclass(repr=False)
+class CompiledObjectGroup:
+    name: str
+    properties: dict[str, Any]
+    objects: list[CompiledObject]
+
+    def __iter__(self) -> Iterator[CompiledObject]:
+        return iter(self.objects)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: "{self.name}">'
+
+
+@dataclass(repr=False)
+class CompiledTileLayer:
+    """
+    Attributes:
+        gids: gid of each tile of the layer, row by row. Empty tiles have gid 0
+    """
+
+    name: str
+    properties: dict[str, Any]
+    width: int
+    height: int
+    gids: array
+    _images: list[pygame.Surface | None]
+
+    def tiles(self) -> Iterator[tuple[int, int, pygame.Surface]]:
+        """
+        :return: Iterator of (x, y, image) of all non-empty tiles of the layer
+        """
+        for index, gid in enumerate(self.gids):
+            if gid:
+                yield index % self.width, index // self.width, self._images[gid]
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: "{self.name}">'
+
+
+@dataclass(repr=False)
+class CompiledOtherLayer:
+    """
+    Layer of a kind that is not supported by the game (e.g. an Image layer),
+    which is only kept so that it can be reported.
+
+    Attributes:
+        kind: class name of the layer, as loaded from the TMX file
+    """
+
+    name: str
+    kind: str
+
+
+@dataclass
+class CompiledMap:
+    """
+    Map loaded from its compiled binary form, see map_compiler.compile_map.
+    Provides the parts of the pytmx.TiledMap interface that the game uses.
+
+    Maps are loaded without touching the display, so that they can be loaded in
+    a background thread. Their tile images have to be converted to the display
+    format on the main thread (see convert) before the map is used.
+
+    Attributes:
+        width: width of the map (tile-scale)
+        height: height of the map (tile-scale)
+        layers: all layers of the map, in the order they are drawn in
+        images: tile image of each gid, None for gids without an image
+        pf_matrix: pathfinding matrix with all static colliders of the map.
+                   1 marks walkable tiles, 0 non-walkable tiles
+        converted: whether the tile images have been converted to the display
+                   format
+    """
+
+    width: int
+    height: int
+    properties: dict[str, Any]
+    layers: list[CompiledTileLayer | CompiledObjectGroup | CompiledOtherLayer]
+    images: list[pygame.Surface | None] = field(repr=False)
+    pf_matrix: list[list[int]] = field(repr=False)
+
+    _colliders: dict[int, list[pygame.FRect]] = field(repr=False)
+    _colorkeys: list[str | None] = field(repr=False)
+    converted: bool = False
+
+    def convert(self):
+        """
+        Convert all tile images to the display format, unless they have been
+        converted already. Has to be called on the main thread, once the display
+        mode has been set.
+        """
+        if self.converted:
+            return
+
+        # the images are replaced in place, as the tile layers share the list
+        for gid, image in enumerate(self.images):
+            if image is not None:
+                self.images[gid] = _convert_tile(image, self._colorkeys[gid])
+        self.converted = True
+
+    @property
+    def layernames(self) -> dict[str, Any]:
+        return {layer.name: layer for layer in self.layers}
+
+    def get_tile_colliders(self) -> Iterator[tuple[int, list[pygame.FRect]]]:
+        """
+        :return: Iterator of (gid, colliders) of all tiles with colliders.
+                 Colliders are relative to their tile and not scaled up by
+                 SCALE_FACTOR
+        """
+        return iter(self._colliders.items())
+
+    def get_tile_image_by_gid(self, gid: int) -> pygame.Surface | None:
+        return self.images[gid]
+
+
+def _convert_tile(tile: pygame.Surface, colorkey: str | None) -> pygame.Surface:
+    # same conversion as pytmx.util_pygame.smart_convert, so that compiled maps
+    # look exactly like the maps loaded by pytmx
+    if colorkey:
+        tile = tile.convert()
+        tile.set_colorkey(pygame.Color(f"#{colorkey}"), pygame.RLEACCEL)
+        return tile
+
+    width, height = tile.get_size()
+    if pygame.mask.from_surface(tile, 254).count() == width * height:
+        return tile.convert()
+    return tile.convert_alpha()
+
+
+def _load_images(
+    map_dir: str, image_files: list[str], descriptions: list[list | None]
+) -> tuple[list[pygame.Surface | None], list[str | None]]:
+    """
+    Load the tile images, without converting them to the display format.
+    :return: Tile image and colorkey of each gid
+    """
+    sources: dict[int, pygame.Surface] = {}
+
+    images = []
+    colorkeys = []
+    for description in descriptions:
+        if description is None:
+            images.append(None)
+            colorkeys.append(None)
+            continue
+
+        file_index, colorkey, rect, flags = description
+        source = sources.get(file_index)
+        if source is None:
+            source = pygame.image.load(os.path.join(map_dir, image_files[file_index]))
+            sources[file_index] = source
+
+        tile = source.subsurface(rect) if rect else source.copy()
+        if flags & FLIPPED_DIAGONALLY:
+            tile = pygame.transform.flip(
+                pygame.transform.rotate(tile, 270), True, False
+            )
+        if flags & (FLIPPED_HORIZONTALLY | FLIPPED_VERTICALLY):
+            tile = pygame.transform.flip(
+                tile,
+                bool(flags & FLIPPED_HORIZONTALLY),
+                bool(flags & FLIPPED_VERTICALLY),
+            )
+        images.append(tile)
+        colorkeys.append(colorkey)
+    return images, colorkeys
+
+
+def _is_up_to_date(map_dir: str, sources: dict[str, int]) -> bool:
+    for source, mtime in sources.items():
+        try:
+            if os.stat(os.path.join(map_dir, source)).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def load_compiled_map(data: bytes, map_dir: str) -> CompiledMap | None:
+    """
+    Build a map from its compiled binary form. Safe to call from a background
+    thread, as the tile images are not converted to the display format yet (see
+    CompiledMap.convert).
+    :param data: compiled map, as returned by map_compiler.compile_map
+    :param map_dir: directory of the TMX file the map has been compiled from.
+                    Paths of the source files are relative to it
+    :return: The compiled map, or None if data is no valid compiled map or if
+             any of the files it has been compiled from has changed since
+    """
+    if len(data) < MAP_HEADER.size:
+        return None
+    magic, version, meta_size = MAP_HEADER.unpack_from(data)
+    if magic != MAP_MAGIC or version != MAP_FORMAT_VERSION:
+        return None
+
+    try:
+        payload = zlib.decompress(data[MAP_HEADER.size :])
+    except zlib.error:
+        return None
+    meta = json.loads(payload[:meta_size])
+    if not _is_up_to_date(map_dir, meta["sources"]):
+        return None
+
+    width, height = meta["width"], meta["height"]
+    offset = meta_size
+
+    def read_array(typecode: str) -> array:
+        nonlocal offset
+        values = array(typecode)
+        size = width * height * values.itemsize
+        values.frombytes(payload[offset : offset + size])
+        offset += size
+        # arrays are always stored in little-endian byte order
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    images, colorkeys = _load_images(map_dir, meta["image_files"], meta["images"])
+
+    layers = []
+    for layer in meta["layers"]:
+        match layer["kind"]:
+            case "tiles":
+                layers.append(
+                    CompiledTileLayer(
+                        layer["name"],
+                        layer["properties"],
+                        width,
+                        height,
+                        read_array(meta["gid_typecode"]),
+                        images,
+                    )
+                )
+            case "objects":
+                layers.append(
+                    CompiledObjectGroup(
+                        layer["name"],
+                        layer["properties"],
+                        [CompiledObject(*row) for row in layer["objects"]],
+                    )
+                )
+            case kind:
+                layers.append(CompiledOtherLayer(layer["name"], kind))
+
+    pf_values = read_array("B")
+    pf_matrix = [
+        pf_values[row : row + width].tolist() for row in range(0, len(pf_values), width)
+    ]
+
+    colliders = {
+        int(gid): [pygame.FRect(collider) for collider in gid_colliders]
+        for gid, gid_colliders in meta["colliders"].items()
+    }
+
+    return CompiledMap(
+        width,
+        height,
+        meta["properties"],
+        layers,
+        images,
+        pf_matrix,
+        colliders,
+        colorkeys,
+    )
@@ -9,6 +9,12 @@ class ZoomState(IntEnum):
     ZOOM = auto()
 
 
+class BlurQuality(IntEnum):
+    LOW = 0
+    MEDIUM = auto()
+    HIGH = auto()
+
+
 class PlayerState(IntEnum):
     IDLE = 0
     WALK = 1
@@ -1,7 +1,14 @@
+import heapq
+import weakref
+from collections.abc import Iterator
+from itertools import count
+
 import pygame
 
 from src.camera import Camera
 from src.enums import Layer
+from src.settings import SCALED_TILE_SIZE
+from src.sprites.base import Sprite
 
 
 class PersistentSpriteGroup(pygame.sprite.Group):
@@ -36,25 +43,274 @@ class PersistentSpriteGroup(pygame.sprite.Group):
         super().empty()
 
 
+type _CellRange = tuple[int, int, int, int]
+type _SortKey = tuple[int, float, int]
+
+# Sprites on any other z (e.g. hidden Sprites with a z of -1) are not drawn
+_DRAWN_LAYERS = frozenset(Layer)
+
+
+class SpatialGrid:
+    """
+    Uniform grid spatial index, which maps each cell of the grid to all Sprites
+    whose rect overlaps it.
+    Sprites that move have to be passed to SpatialGrid.update to stay indexed
+    in the right cells.
+    """
+
+    cell_size: int
+
+    _cells: dict[tuple[int, int], set[pygame.sprite.Sprite]]
+    _sprite_cells: dict[pygame.sprite.Sprite, _CellRange]
+
+    def __init__(self, cell_size: int):
+        """
+        :param cell_size: width and height of a single cell (pixel-scale)
+        """
+        self.cell_size = cell_size
+
+        self._cells = {}
+        self._sprite_cells = {}
+
+    def _get_cell_range(self, rect: pygame.Rect | pygame.FRect) -> _CellRange:
+        return (
+            int(rect.left // self.cell_size),
+            int(rect.top // self.cell_size),
+            int(rect.right // self.cell_size),
+            int(rect.bottom // self.cell_size),
+        )
+
+    @staticmethod
+    def _iter_cells(cell_range: _CellRange) -> Iterator[tuple[int, int]]:
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                yield x, y
+
+    def insert(self, sprite: pygame.sprite.Sprite):
+        cell_range = self._get_cell_range(sprite.rect)
+        self._sprite_cells[sprite] = cell_range
+        for cell in self._iter_cells(cell_range):
+            self._cells.setdefault(cell, set()).add(sprite)
+
+    def remove(self, sprite: pygame.sprite.Sprite):
+        cell_range = self._sprite_cells.pop(sprite, None)
+        if cell_range is None:
+            return
+
+        for cell in self._iter_cells(cell_range):
+            sprites = self._cells[cell]
+            sprites.discard(sprite)
+            if not sprites:
+                del self._cells[cell]
+
+    def update(self, sprite: pygame.sprite.Sprite):
+        """
+        Move the Sprite to the cells its rect currently overlaps.
+        Sprites that are not part of the grid are ignored.
+        """
+        cell_range = self._sprite_cells.get(sprite)
+        if cell_range is None or cell_range == self._get_cell_range(sprite.rect):
+            return
+
+        self.remove(sprite)
+        self.insert(sprite)
+
+    def query(self, rect: pygame.Rect | pygame.FRect) -> set[pygame.sprite.Sprite]:
+        """
+        :return: all Sprites whose rect overlaps rect
+        """
+        sprites = set()
+        for cell in self._iter_cells(self._get_cell_range(rect)):
+            sprites.update(self._cells.get(cell, ()))
+
+        return {sprite for sprite in sprites if sprite.rect.colliderect(rect)}
+
+
 # TODO : we could replace this with pygame.sprite.LayeredUpdates, as that
 #  is a subclass of pygame.sprite.Group that natively supports layers
 
 
 class AllSprites(PersistentSpriteGroup):
+    """
+    Group of all Sprites that are drawn in the world.
+    Only Sprites that are visible through the camera are drawn; all others are
+    culled, using a spatial index of the Sprites' rects.
+
+    Sprites that overwrite Sprite.update are considered dynamic. Only dynamic
+    Sprites are updated, and they are re-indexed every frame. Sprites that move
+    without an update method of their own should be added with
+    AllSprites.add_dynamic.
+    Sprites that are drawn in screen space instead of world space should set
+    their cullable attribute to False, so that they are never culled.
+
+    Sprites are drawn ordered by their Layer first, then by the bottom of their
+    hitbox, then by the order they were added in. The sort keys of static
+    Sprites are only computed once, so each frame only the dynamic Sprites
+    have to be sorted again before both are merged into a single draw queue.
+
+    Sprites are blitted in batches with a single Surface.fblits call. Sprites
+    that overwrite Sprite.draw fall back to their own draw method, which is
+    called in between batches to keep the draw order intact.
+
+    Attributes:
+        culled_sprites: number of Sprites that were culled in the last frame
+    """
+
+    culled_sprites: int
+
+    _grid: SpatialGrid
+    _dynamic_sprites: set[pygame.sprite.Sprite]
+    _updated_sprites: dict[pygame.sprite.Sprite, None]
+    _registered_dynamic_sprites: weakref.WeakSet[pygame.sprite.Sprite]
+    _unindexed_sprites: set[pygame.sprite.Sprite]
+    _uncullable_sprites: set[pygame.sprite.Sprite]
+    _custom_draw_sprites: set[pygame.sprite.Sprite]
+    _insertion_order: dict[pygame.sprite.Sprite, int]
+    _sort_keys: dict[pygame.sprite.Sprite, _SortKey]
+
     def __init__(self, *sprites):
+        self._grid = SpatialGrid(SCALED_TILE_SIZE * 4)
+        self._dynamic_sprites = set()
+        # dict instead of set, so Sprites are updated in the order they were added
+        self._updated_sprites = {}
+        # Sprites stay registered when they are removed, so that they are still
+        # dynamic when they are added back (e.g. when re-entering a cached map)
+        self._registered_dynamic_sprites = weakref.WeakSet()
+        self._unindexed_sprites = set()
+        self._uncullable_sprites = set()
+        self._custom_draw_sprites = set()
+        self._insertion_order = {}
+        self._sort_keys = {}
+        self._insertion_counter = count()
+        self.culled_sprites = 0
+
         super().__init__(*sprites)
         self.display_surface = pygame.display.get_surface()
         self.offset = pygame.Vector2()
         self.cam_surf = pygame.Surface(self.display_surface.get_size())
 
+    def add_dynamic(self, *sprites: pygame.sprite.Sprite):
+        """
+        Add Sprites that can move or change their rect without having an
+        update method, so that they are re-indexed every frame.
+        """
+        self._registered_dynamic_sprites.update(sprites)
+        self.add(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer=None):
+        super().add_internal(sprite, layer)
+        # Sprites with the same bottom are drawn in the order they were added
+        self._insertion_order[sprite] = next(self._insertion_counter)
+
+        if type(sprite).update is not pygame.sprite.Sprite.update or hasattr(
+            sprite, "update_blocked"
+        ):
+            self._updated_sprites[sprite] = None
+            self._dynamic_sprites.add(sprite)
+        elif sprite in self._registered_dynamic_sprites:
+            self._dynamic_sprites.add(sprite)
+
+        if type(sprite).draw is not Sprite.draw:
+            self._custom_draw_sprites.add(sprite)
+
+        # Sprites are added to their groups before their rect is set up, so
+        # they can only be indexed once they are about to be drawn
+        self._unindexed_sprites.add(sprite)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite):
+        super().remove_internal(sprite)
+        del self._insertion_order[sprite]
+        self._sort_keys.pop(sprite, None)
+        self._dynamic_sprites.discard(sprite)
+        self._updated_sprites.pop(sprite, None)
+        self._unindexed_sprites.discard(sprite)
+        self._uncullable_sprites.discard(sprite)
+        self._custom_draw_sprites.discard(sprite)
+        self._grid.remove(sprite)
+
+    def update(self, *args, **kwargs):
+        # Sprites that do not overwrite Sprite.update are skipped
+        for sprite in list(self._updated_sprites):
+            sprite.update(*args, **kwargs)
+
     def update_blocked(self, dt: float):
-        for sprite in self:
+        for sprite in list(self._updated_sprites):
             getattr(sprite, "update_blocked", sprite.update)(dt)
 
-    def draw(self, camera: Camera):
-        sorted_sprites = sorted(self.sprites(), key=lambda spr: spr.hitbox_rect.bottom)
+    def get_visible_sprites(self, camera: Camera) -> set[pygame.sprite.Sprite]:
+        """
+        :return: all Sprites that are visible through the given camera
+        """
+        for sprite in self._unindexed_sprites:
+            if sprite not in self._dynamic_sprites:
+                self._sort_keys[sprite] = self._get_sort_key(sprite)
+
+            if getattr(sprite, "cullable", True):
+                self._grid.insert(sprite)
+            else:
+                self._uncullable_sprites.add(sprite)
+        self._unindexed_sprites.clear()
+
+        for sprite in self._dynamic_sprites:
+            self._grid.update(sprite)
+
+        visible_sprites = self._grid.query(camera.viewport)
+        visible_sprites.update(self._uncullable_sprites)
+        return visible_sprites
+
+    def _get_sort_key(self, sprite: pygame.sprite.Sprite) -> _SortKey:
+        return sprite.z, sprite.hitbox_rect.bottom, self._insertion_order[sprite]
+
+    def get_draw_queue(
+        self, sprites: set[pygame.sprite.Sprite]
+    ) -> Iterator[pygame.sprite.Sprite]:
+        """
+        :return: the given Sprites of this Group, in the order they should be
+                 drawn in
+        """
+        static_sprites = []
+        dynamic_sprites = []
+        for sprite in sprites:
+            if sprite.z not in _DRAWN_LAYERS:
+                continue
+
+            if sprite in self._dynamic_sprites:
+                self._sort_keys[sprite] = self._get_sort_key(sprite)
+                dynamic_sprites.append(sprite)
+            else:
+                static_sprites.append(sprite)
+
+        static_sprites.sort(key=self._sort_keys.__getitem__)
+        dynamic_sprites.sort(key=self._sort_keys.__getitem__)
+        return heapq.merge(
+            static_sprites, dynamic_sprites, key=self._sort_keys.__getitem__
+        )
+
+    def draw(self, camera: Camera, surface: pygame.Surface | None = None):
+        """
+        :param camera: Camera through which the Sprites should be drawn
+        :param surface: Surface to draw on, defaults to the display surface
+        """
+        if surface is None:
+            surface = self.display_surface
+
+        visible_sprites = self.get_visible_sprites(camera)
+        self.culled_sprites = len(self) - len(visible_sprites)
+
+        offset_x, offset_y = camera.get_offset()
+        blit_list = []
+        for sprite in self.get_draw_queue(visible_sprites):
+            if sprite in self._custom_draw_sprites:
+                # everything queued so far has to be drawn below this Sprite
+                if blit_list:
+                    surface.fblits(blit_list)
+                    blit_list = []
+                sprite.draw(surface, camera.apply(sprite), camera)
+            else:
+                blit_list.append(
+                    (sprite.image, (sprite.rect.x + offset_x, sprite.rect.y + offset_y))
+                )
 
-        for layer in Layer:
-            for sprite in sorted_sprites:
-                if sprite.z == layer:
-                    sprite.draw(self.display_surface, camera.apply(sprite), camera)
+        if blit_list:
+            surface.fblits(blit_list)
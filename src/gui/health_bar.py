@@ -53,16 +53,28 @@ class HealthProgressBar:
             "Green": pygame.Color(201, 255, 117),
         }
 
-    def render(self, screen):
-        health_percent = self.hp / self.max_hp
+        # rendered health bar, which covers the health, its frame and all cats
+        self._surf_rect = self.health_bar_rect.union(self.hp_rect).unionall(
+            [rect for _, rect in self.cat_imgs]
+        )
+        self._surf = pygame.Surface(self._surf_rect.size, pygame.SRCALPHA)
+        self._render_key = None
+
+    def _get_offset(self) -> tuple[float, float]:
         # shake
-        if health_percent <= 0.3:
-            offset = (
+        if self.hp / self.max_hp <= 0.3:
+            return (
                 random.uniform(-1, 1) * self.SHAKE_INTENSITY,
                 random.uniform(-1, 1) * self.SHAKE_INTENSITY,
             )
-        else:
-            offset = (0, 0)
+        return 0, 0
+
+    def _get_surface(self) -> pygame.Surface:
+        """
+        :return: Surface of the health bar, which is only re-rendered when the
+                 width of the health (in whole pixels) or the cat image change
+        """
+        health_percent = self.hp / self.max_hp
 
         # cat img changing.
         if health_percent > 0.5:
@@ -72,24 +84,52 @@ class HealthProgressBar:
         else:
             self.curr_cat = 2
 
+        # the color follows the width in whole pixels, so that small changes in
+        # health (e.g. its decay every frame) do not re-render the health bar
+        self.hp_rect.width = int(health_percent * self.health_bar_rect.width)
+        self.change_color()
+
+        render_key = (self.hp_rect.width, self.curr_cat)
+        if render_key == self._render_key:
+            return self._surf
+        self._render_key = render_key
+
         # drawing
+        self._surf.fill((0, 0, 0, 0))
         # health
-        self.hp_rect.width = health_percent * self.health_bar_rect.width
         pygame.draw.rect(
-            screen,
+            self._surf,
             self.color,
-            self.hp_rect.move(offset[0], offset[1]),
+            self.hp_rect.move(-self._surf_rect.x, -self._surf_rect.y),
             border_top_right_radius=12,
             border_bottom_right_radius=12,
         )
         # frame
-        screen.blit(
+        self._surf.blit(
             self.health_bar,
-            (self.health_bar_rect.x + offset[0], self.health_bar_rect.y + offset[1]),
+            (
+                self.health_bar_rect.x - self._surf_rect.x,
+                self.health_bar_rect.y - self._surf_rect.y,
+            ),
         )
         # emote
         cat_img, cat_rect = self.cat_imgs[self.curr_cat]
-        screen.blit(cat_img, (cat_rect.x + offset[0], cat_rect.y + offset[1]))
+        self._surf.blit(
+            cat_img, (cat_rect.x - self._surf_rect.x, cat_rect.y - self._surf_rect.y)
+        )
+        return self._surf
+
+    def get_blit(self) -> tuple[pygame.Surface, tuple[float, float]]:
+        """
+        :return: Surface of the health bar and the position it should be
+                 blitted at, as can be passed to Surface.fblits
+        """
+        surf = self._get_surface()
+        offset = self._get_offset()
+        return surf, (self._surf_rect.x + offset[0], self._surf_rect.y + offset[1])
+
+    def render(self, screen):
+        screen.blit(*self.get_blit())
 
     def apply_damage(self, intensity):
         self.hp = pygame.math.clamp(self.hp - intensity, 0, self.max_hp)
@@ -98,7 +138,7 @@ class HealthProgressBar:
         self.hp = pygame.math.clamp(self.hp + intensity, 0, self.max_hp)
 
     def change_color(self):
-        t = self.hp / self.max_hp
+        t = self.hp_rect.width / self.health_bar_rect.width
         if t >= 0.5:
             factor = 1 - (t - 0.5) * 2
             self.color = self.colors["Green"].lerp(self.colors["Yellow"], factor**1.5)
@@ -106,11 +146,13 @@ class HealthProgressBar:
             factor = t * 2
             self.color = self.colors["Red"].lerp(self.colors["Yellow"], factor)
 
-    def draw(self, screen):
-        self.change_color()
-        self.render(screen)
+    def handle_debug_keys(self):
         keys = pygame.key.get_pressed()
         if keys[pygame.K_2]:
             self.apply_health(1)
         elif keys[pygame.K_1]:
             self.apply_damage(1)
+
+    def draw(self, screen):
+        self.render(screen)
+        self.handle_debug_keys()
@@ -7,7 +7,7 @@ from src import utils
 from src.enums import Layer
 from src.settings import CHARS_PER_LINE, SCREEN_HEIGHT, SCREEN_WIDTH, TB_SIZE
 from src.sprites.base import Sprite
-from src.support import resource_path
+from src.support import import_font, render_text, resource_path
 from src.timer import Timer
 
 
@@ -21,8 +21,12 @@ class TextBox(Sprite):
     _TXT_SURF_REGULAR_AREA: pygame.Rect = pygame.Rect(14, 0, 1, 202)
     _CNAME_SURF_RECT: pygame.Rect = pygame.Rect(8, 0, 212, 67)
     _TXT_SURF_RECT: pygame.Rect = pygame.Rect(0, 64, TB_SIZE[0], TB_SIZE[1] - 64)
+    _TXT_POS: tuple[int, int] = (15, 78)
     _TB_IMAGE: pygame.Surface | None = None
 
+    # TextBoxes are drawn in screen space, so they should never be culled
+    cullable: bool = False
+
     @classmethod
     def prepare_base_tb_image(
         cls, cname_surf: pygame.Surface, txt_surf: pygame.Surface
@@ -54,20 +58,29 @@ class TextBox(Sprite):
         self.font: pygame.Font = font
         self.name: str = character_name
         self.text: str = textwrap.fill(text, width=CHARS_PER_LINE)
-        self.image: pygame.Surface = pygame.Surface(TB_SIZE, flags=pygame.SRCALPHA)
-        self.__prepare_image()
-        self._tmp_img: pygame.Surface = self._TB_IMAGE.copy()
-        cname: pygame.Surface = self.font.render(
-            character_name, True, color=pygame.Color("black")
+        # Start index, content and position of each line of the text
+        self._lines: list[tuple[int, str, tuple[int, int]]] = []
+        line_start = 0
+        for i, line in enumerate(self.text.split("\n")):
+            line_pos = (
+                self._TXT_POS[0],
+                self._TXT_POS[1] + i * self.font.get_linesize(),
+            )
+            self._lines.append((line_start, line, line_pos))
+            line_start += len(line) + 1
+
+        # The text is typed onto this image one character at a time, so that
+        # only the newly revealed characters have to be rendered
+        self.image: pygame.Surface = self._TB_IMAGE.copy()
+        cname: pygame.Surface = render_text(
+            self.font, character_name, True, color=pygame.Color("black")
         )
         cname_rect: pygame.Rect = cname.get_rect(center=self._CNAME_SURF_RECT.center)
-        self._tmp_img.blit(cname, cname_rect)
-        self._fin_img: pygame.Surface = self.image
+        self.image.blit(cname, cname_rect)
         self.timer: Timer = Timer(50, True, autostart=False, func=self._advance_by_one)
-        self.image = self._tmp_img.copy()
         self._finished_advancing: bool = False
-        self._txt_needs_rerender: bool = True
         self._chr_index: int = 1
+        self._rendered_chr_index: int = 0
 
         super().__init__(
             (
@@ -96,39 +109,31 @@ class TextBox(Sprite):
         self._chr_index += 1
         if self._chr_index >= len(self.text):
             self._finished_advancing = True
-        else:
-            self._txt_needs_rerender = True
 
-    def _prerender_text_ani(self):
-        text_surf = self.font.render(
-            self.text[: self._chr_index], True, color=pygame.Color("black")
-        )
-        text_rect = text_surf.get_rect(topleft=(15, 78))
-        blit_list = [(self._tmp_img, (0, 0)), (text_surf, text_rect)]
+    def _render_revealed_text(self):
+        """Render the characters revealed since the last call onto the image,
+        line by line, next to the characters that are already shown."""
+        blit_list = []
+        for line_start, line, (x, y) in self._lines:
+            start = max(self._rendered_chr_index, line_start)
+            end = min(self._chr_index, line_start + len(line))
+            if start >= end:
+                continue
+            text_surf = self.font.render(
+                self.text[start:end], True, color=pygame.Color("black")
+            )
+            x += self.font.size(self.text[line_start:start])[0]
+            blit_list.append((text_surf, (x, y)))
         self.image.fblits(blit_list)
-        self._txt_needs_rerender = False
+        self._rendered_chr_index = self._chr_index
 
     def update(self, *args, **kwargs):
         if not self.timer:
             self.timer.activate()
         self.timer.update()
         # Keeping variable args tuple and keyword arguments dict syntax for compatibility with base method
-        if self._finished_advancing and self.image is not self._fin_img:
-            self.image = self._fin_img
-        elif not self._finished_advancing and self._txt_needs_rerender:
-            self._prerender_text_ani()
-
-    def __prepare_image(self):
-        cname = self.font.render(self.name, True, color=pygame.Color("black"))
-        cname_rect = cname.get_rect(center=self._CNAME_SURF_RECT.center)
-        text_surf = self.font.render(self.text, True, color=pygame.Color("black"))
-        text_rect = text_surf.get_rect(topleft=(15, 78))
-        blit_list = [
-            (self._TB_IMAGE, (0, 0)),
-            (cname, cname_rect),
-            (text_surf, text_rect),
-        ]
-        self.image.fblits(blit_list)
+        if self._rendered_chr_index < self._chr_index:
+            self._render_revealed_text()
 
     def draw(self, display_surface: pygame.Surface, rect: pygame.Rect, camera):
         display_surface.blit(self.image, self.rect)
@@ -150,33 +155,31 @@ class DialogueManager:
             self.dialogues: dict[str, list[list[str, str]]] = utils.json_loads(
                 dialogue_file.read()
             )
-        self._tb_list: list[TextBox] = []
+        # The parts of the current dialogue, as (character name, text) pairs.
+        # Their text boxes are only created once they are shown
+        self._dialogue_parts: list[tuple[str, str]] = []
+        self._current_tb: TextBox | None = None
         self._msg_index: int = 0
         self._showing_dialogue: bool = False
-        self.font: pygame.Font = pygame.font.Font(
-            resource_path("font/LycheeSoda.ttf"), 20
-        )
+        self.font: pygame.Font = import_font(20, "font/LycheeSoda.ttf")
 
     showing_dialogue = property(attrgetter("_showing_dialogue"))
 
     def _purge_tb_list(self):
-        for tb in self._tb_list:
-            tb.kill()
-        self._tb_list.clear()
+        if self._current_tb is not None:
+            self._current_tb.kill()
+            self._current_tb = None
+        self._dialogue_parts.clear()
         self._msg_index = 0
 
-    def _create_tb(self, cname: str, txt: str):
-        self._tb_list.append(TextBox(cname, txt, self.font))
-
     def _push_current_tb_to_foreground(self):
-        if not self._msg_index:
-            self._tb_list[0].add(self.spr_grp)
-            return
-        self._tb_list[self._msg_index - 1].kill()
-        self._tb_list[self._msg_index].add(self.spr_grp)
+        if self._current_tb is not None:
+            self._current_tb.kill()
+        self._current_tb = TextBox(*self._dialogue_parts[self._msg_index], self.font)
+        self._current_tb.add(self.spr_grp)
 
     def _get_current_tb(self):
-        return self._tb_list[self._msg_index]
+        return self._current_tb
 
     def open_dialogue(self, dial: str):
         """Opens a text box with the current dialogue ID's first text showed on-screen.
@@ -196,8 +199,7 @@ class DialogueManager:
 
         self._showing_dialogue = True
 
-        for cname, portion in dial_info:
-            self._create_tb(cname, portion)
+        self._dialogue_parts.extend((cname, portion) for cname, portion in dial_info)
 
         self._push_current_tb_to_foreground()
 
@@ -211,7 +213,7 @@ class DialogueManager:
             self._get_current_tb().finished_advancing = True
             return
         self._msg_index += 1
-        if self._msg_index >= len(self._tb_list):
+        if self._msg_index >= len(self._dialogue_parts):
             # Reached the end of the dialogue, clear everything away to make space for the next dialogue
             self._purge_tb_list()
             self._showing_dialogue = False
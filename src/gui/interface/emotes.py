@@ -17,6 +17,10 @@ from src.timer import Timer
 class EmoteBox(EmoteBoxBase):
     EMOTE_DIALOG_BOX = None
 
+    # Emote frames mapped to the speech bubble with the frame drawn onto it.
+    # Bubbles are shared by all EmoteBoxes and must not be modified
+    _bubble_frames: dict[pygame.Surface, pygame.Surface] = {}
+
     def __init__(
         self,
         pos: tuple[int, int],
@@ -60,6 +64,24 @@ class EmoteBox(EmoteBoxBase):
             func=self._ani_next_frame,
         )
 
+    @classmethod
+    def _get_bubble_frame(cls, frame: pygame.Surface) -> pygame.Surface:
+        """
+        :return: The speech bubble with the given Emote frame drawn onto it.
+                 It is only composited the first time it is requested.
+        """
+        if frame not in cls._bubble_frames:
+            bubble = cls.EMOTE_DIALOG_BOX.copy()
+            bubble.blit(
+                frame,
+                (
+                    cls.EMOTE_DIALOG_BOX.width / 2 - frame.width / 2,
+                    cls.EMOTE_DIALOG_BOX.height / 2 - frame.height / 2 - 8,
+                ),
+            )
+            cls._bubble_frames[frame] = bubble
+        return cls._bubble_frames[frame]
+
     @property
     def pos(self):
         return self._pos
@@ -86,17 +108,7 @@ class EmoteBox(EmoteBoxBase):
         self._current_emote_image = self.emote[self._ani_cframe % self._ani_frame_count]
 
         # update image
-        self.image = EmoteBox.EMOTE_DIALOG_BOX.copy()
-        self.image.blit(
-            self._current_emote_image,
-            (
-                EmoteBox.EMOTE_DIALOG_BOX.width / 2
-                - self._current_emote_image.width / 2,
-                EmoteBox.EMOTE_DIALOG_BOX.height / 2
-                - self._current_emote_image.height / 2
-                - 8,
-            ),
-        )
+        self.image = self._get_bubble_frame(self._current_emote_image)
 
     def update(self, *args, **kwargs):
         if not self.timer:
@@ -167,9 +179,15 @@ class EmoteManager(EmoteManagerBase, ABC):
         del self[obj_id]
 
     def _clear_emote_boxes(self):
-        for obj_id in self._emote_boxes.keys():
+        for obj_id in list(self._emote_boxes):
             self._remove_emote_box(obj_id)
 
+    def clear(self):
+        """
+        Removes all Emotes that are currently attached to any object.
+        """
+        self._clear_emote_boxes()
+
     def __setitem__(self, obj: object, value: EmoteBox):
         if isinstance(obj, int):
             self._emote_boxes[obj] = value
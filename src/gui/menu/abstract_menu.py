@@ -6,7 +6,7 @@ from pygame.mouse import get_pressed as mouse_buttons
 
 from src.events import post_event
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
-from src.support import resource_path
+from src.support import import_font, render_text
 
 _SCREEN_CENTER = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
@@ -22,7 +22,7 @@ class AbstractMenu(ABC):
         self.size = size
         self.center = center
         self.buttons_surface = pygame.Surface(size, flags=pygame.SRCALPHA)
-        self.font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), 30)
+        self.font = import_font(30, "font/LycheeSoda.ttf")
         self.display_surface = pygame.display.get_surface()
 
         self.buttons = []
@@ -98,7 +98,7 @@ class AbstractMenu(ABC):
 
     # draw
     def draw_title(self):
-        text_surf = self.font.render(self.title, False, "Black")
+        text_surf = render_text(self.font, self.title, False, "Black")
         midtop = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 20)
         text_rect = text_surf.get_frect(midtop=midtop)
 
@@ -12,7 +12,7 @@ from src.colors import (
     SL_ORANGE_MEDIUM,
 )
 from src.controls import Control
-from src.support import resource_path
+from src.support import import_font, render_text
 
 
 class Component:
@@ -148,7 +148,7 @@ class AbstractButton(Component, ABC):
 
     def draw_disabled(self, surface):
         pygame.draw.rect(surface, self.disabled_color, self.rect)
-        text_surf = self.font.render(self._content, True, "Gray")
+        text_surf = render_text(self.font, self._content, True, "Gray")
         surface.blit(text_surf, text_surf.get_rect(center=self.rect.center))
 
 
@@ -169,7 +169,7 @@ class Button(AbstractButton):
 
         # Setup
         super().__init__(content, rect, font)
-        self.content = font.render(self._content, False, "black")
+        self.content = render_text(font, self._content, False, "black")
         self._content_rect = self.content.get_frect(center=self.rect.center)
 
     @property
@@ -201,7 +201,7 @@ class ArrowButton(AbstractButton):
 
     def __init__(self, content: str, rect: pygame.Rect, font: pygame.font.Font):
         super().__init__(content, rect, font)
-        self.content: pygame.Surface = font.render(self._content, False, "black")
+        self.content: pygame.Surface = render_text(font, self._content, False, "black")
         self._content_rect = self.content.get_frect(center=self.rect.center)
         self.color = SL_ORANGE_DARK
 
@@ -261,7 +261,7 @@ class KeySetup(Component):
         self.unicode = unicode
 
         # design
-        self.font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), 30)
+        self.font = import_font(30, "font/LycheeSoda.ttf")
         self.hover_active = False
         self.bg_color = "grey"
 
@@ -284,7 +284,7 @@ class KeySetup(Component):
 
     # draw
     def draw_key_name(self):
-        text_surf = self.font.render(self.title, False, "Black")
+        text_surf = render_text(self.font, self.title, False, "Black")
         midleft = (self.rect.left + 10, self.rect.centery)
         text_rect = text_surf.get_frect(midleft=midleft)
         rect = text_rect.inflate(10, 10)
@@ -292,7 +292,7 @@ class KeySetup(Component):
         self.surface.blit(text_surf, text_rect)
 
     def draw_symbol(self):
-        text_surf = self.font.render(self.unicode, False, "White")
+        text_surf = render_text(self.font, self.unicode, False, "White")
         text_rect = text_surf.get_frect(center=self.symbol_image_rect.center)
         self.surface.blit(self.symbol_image, self.symbol_image_rect)
         self.surface.blit(text_surf, text_rect)
@@ -318,7 +318,7 @@ class Slider:
 
         # sounds
         self.sounds = sounds
-        self.font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), 30)
+        self.font = import_font(30, "font/LycheeSoda.ttf")
 
         # knob
         self.knob_radius = 10
@@ -354,7 +354,7 @@ class Slider:
 
     # draw
     def draw_value(self):
-        text_surf = self.font.render(str(int(self.value)), False, "Black")
+        text_surf = render_text(self.font, str(int(self.value)), False, "Black")
         midtop = (self.rect.centerx, self.rect.bottom + 10)
         text_rect = text_surf.get_frect(midtop=midtop)
         self.surface.blit(text_surf, text_rect)
@@ -413,7 +413,7 @@ class InputField:
         else:
             border_color = self.border_color_passive
         pygame.draw.rect(self.surface, border_color, self.rect, 4, 4)
-        text_surf = self.font.render(self.input_text, True, SL_ORANGE_BRIGHTEST)
+        text_surf = render_text(self.font, self.input_text, True, SL_ORANGE_BRIGHTEST)
         self.surface.blit(
             text_surf,
             (
@@ -5,7 +5,14 @@ from pygame.math import Vector2 as vector
 
 from src.controls import Controls
 from src.gui.menu.components import Button, KeySetup, Slider
-from src.support import load_data, resource_path, save_data
+from src.support import (
+    import_font,
+    import_resized_image,
+    load_data,
+    render_text,
+    resource_path,
+    save_data,
+)
 
 
 class Description:
@@ -20,7 +27,7 @@ class Description:
         self.setup()
 
         # font
-        self.font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), 30)
+        self.font = import_font(30, "font/LycheeSoda.ttf")
 
     # setup
     def setup(self):
@@ -129,8 +136,7 @@ class KeybindsDescription(Description):
             unicode = self.value_to_unicode(control.control_value)
             path = self.get_path(control.control_value)
 
-            image = pygame.image.load(path)
-            image = pygame.transform.scale(image, (40, 40))
+            image = import_resized_image(path, (40, 40))
 
             topleft = (10, 10 + 60 * index)
             key_setup_button = KeySetup(name, control, unicode, topleft, image)
@@ -221,8 +227,7 @@ class KeybindsDescription(Description):
         return False
 
     def update_key_value(self, path: str, value: int, unicode: str | None):
-        image = pygame.image.load(path)
-        image = pygame.transform.scale(image, (40, 40))
+        image = import_resized_image(path, (40, 40))
 
         k_unicode = unicode if self.is_generic(unicode) else None
         self.selection_key.unicode = k_unicode
@@ -360,7 +365,7 @@ class VolumeDescription(Description):
 
     # draw
     def draw_text(self, text, pos):
-        text = self.font.render(text, True, "black", "white")
+        text = render_text(self.font, text, True, "black", "white")
         self.description_slider_surface.blit(text, pos)
 
     def draw_slider(self):
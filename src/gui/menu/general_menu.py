@@ -8,6 +8,7 @@ from src.enums import GameState
 from src.gui.menu.abstract_menu import AbstractMenu
 from src.gui.menu.components import Button
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.support import render_text
 
 _SCREEN_CENTER = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
@@ -65,7 +66,7 @@ class GeneralMenu(AbstractMenu):
         if self.input_active:
             label_font = self.font
             label_text = "Please enter token:"
-            label_surface = label_font.render(label_text, True, text_color)
+            label_surface = render_text(label_font, label_text, True, text_color)
 
             # Position the label slightly above the input box
             label_rect = label_surface.get_rect(
@@ -83,7 +84,7 @@ class GeneralMenu(AbstractMenu):
 
         # Render the current text inside the input box
         font = self.font
-        text_surface = font.render(self.input_text, True, text_color)
+        text_surface = render_text(font, self.input_text, True, text_color)
         text_rect = text_surface.get_rect(
             midleft=(self.input_box.x + 10, self.input_box.centery)
         )
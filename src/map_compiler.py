@@ -0,0 +1,237 @@
+"""
+Compiles TMX maps into the binary format loaded by compiled_map.load_compiled_map,
+so that the game does not have to parse the XML of maps and tilesets.
+
+Maps are compiled automatically once they are needed and their compiled form is
+missing or out of date. To compile all maps ahead of time (e.g. before packaging
+the game), run from the root of the repository:
+    python -m src.map_compiler
+"""
+
+import argparse
+import json
+import os
+import sys
+import zlib
+from array import array
+from typing import Any
+from xml.etree import ElementTree
+
+import pytmx
+
+from src.compiled_map import (
+    FLIPPED_DIAGONALLY,
+    FLIPPED_HORIZONTALLY,
+    FLIPPED_VERTICALLY,
+    MAP_FORMAT_VERSION,
+    MAP_HEADER,
+    MAP_MAGIC,
+)
+from src.enums import SpecialObjectLayer
+from src.npc.utils import pf_add_matrix_collision
+from src.settings import COMPILED_MAP_DIR, TILE_SIZE
+
+
+def _record_image_loader(filename: str, colorkey: str | None, **kwargs):
+    # instead of loading the tile images, pytmx is made to return where each of
+    # them can be found, so that only those references end up in compiled maps
+    def load(rect=None, flags=None):
+        return filename, colorkey, rect, flags
+
+    return load
+
+
+def _get_flags(flags: pytmx.TileFlags | None) -> int:
+    if not flags:
+        return 0
+    return (
+        FLIPPED_HORIZONTALLY * flags.flipped_horizontally
+        | FLIPPED_VERTICALLY * flags.flipped_vertically
+        | FLIPPED_DIAGONALLY * flags.flipped_diagonally
+    )
+
+
+def _get_tile_size(tilemap: pytmx.TiledMap, gid: int) -> tuple[float, float]:
+    _, _, rect, flags = tilemap.images[gid]
+    if rect is None:
+        # tiles of image collection tilesets each have their own image
+        props = tilemap.get_tile_properties_by_gid(gid)
+        return float(props["width"]), float(props["height"])
+
+    if _get_flags(flags) & FLIPPED_DIAGONALLY:
+        return rect[3], rect[2]
+    return rect[2], rect[3]
+
+
+def _build_pf_matrix(tilemap: pytmx.TiledMap) -> list[list[int]]:
+    """
+    :return: Pathfinding matrix with all colliders that GameMap creates from the
+             map: tiles of the Border layer, rectangles of the Collisions layer
+             and objects with colliders on all other object layers
+    """
+    matrix = [[1] * tilemap.width for _ in range(tilemap.height)]
+    # trees are set up like the objects of all other object layers
+    special_layers = set(SpecialObjectLayer) - {SpecialObjectLayer.TREES}
+
+    for layer in tilemap.layers:
+        if isinstance(layer, pytmx.TiledTileLayer) and layer.name == "Border":
+            for x, y, gid in layer.iter_data():
+                if gid:
+                    pos = (x * TILE_SIZE, y * TILE_SIZE)
+                    pf_add_matrix_collision(matrix, pos, _get_tile_size(tilemap, gid))
+
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            if layer.name == SpecialObjectLayer.COLLISIONS:
+                for obj in layer:
+                    pf_add_matrix_collision(
+                        matrix, (obj.x, obj.y), (obj.width, obj.height)
+                    )
+            elif layer.name not in special_layers:
+                for obj in layer:
+                    props = tilemap.get_tile_properties_by_gid(obj.gid) or {}
+                    colliders = props.get("colliders")
+                    if colliders:
+                        hitbox = colliders[0]
+                        pf_add_matrix_collision(
+                            matrix,
+                            (obj.x + hitbox.x, obj.y + hitbox.y),
+                            (hitbox.width, hitbox.height),
+                        )
+
+    return matrix
+
+
+def _get_object_properties(obj: pytmx.TiledObject) -> dict[str, Any]:
+    # pytmx adds the properties of their tile to tile objects, including the
+    # colliders of the tile. Those are stored once per gid instead
+    return {key: value for key, value in obj.properties.items() if key != "colliders"}
+
+
+def _get_tileset_sources(tmx_path: str) -> list[str]:
+    tree = ElementTree.parse(tmx_path)
+    return [
+        tileset.get("source")
+        for tileset in tree.getroot().iter("tileset")
+        if tileset.get("source")
+    ]
+
+
+def compile_map(tmx_path: str) -> bytes:
+    """
+    Compile a TMX map into its binary form. The compiled map holds the gids of
+    all tile layers, the objects of all object layers with their properties,
+    references to the tile images within their tileset images, the colliders
+    of all tiles and the pathfinding matrix of the map.
+    :param tmx_path: path of the TMX file
+    :return: The compiled map
+    """
+    tilemap = pytmx.TiledMap(tmx_path, image_loader=_record_image_loader)
+    map_dir = os.path.dirname(tmx_path)
+
+    sources = {}
+    for source in [os.path.basename(tmx_path), *_get_tileset_sources(tmx_path)]:
+        sources[source] = os.stat(os.path.join(map_dir, source)).st_mtime_ns
+
+    image_files: dict[str, int] = {}
+    images = []
+    for image in tilemap.images:
+        if image is None:
+            images.append(None)
+            continue
+
+        filename, colorkey, rect, flags = image
+        filename = os.path.relpath(filename, map_dir)
+        file_index = image_files.setdefault(filename, len(image_files))
+        images.append([file_index, colorkey, rect, _get_flags(flags)])
+
+    gid_typecode = "H" if len(images) <= 0xFFFF else "I"
+    arrays = []
+    layers = []
+    for layer in tilemap.layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            layers.append(
+                {"kind": "tiles", "name": layer.name, "properties": layer.properties}
+            )
+            arrays.append(
+                array(gid_typecode, [gid for row in layer.data for gid in row])
+            )
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            objects = [
+                [
+                    obj.id,
+                    obj.name,
+                    obj.x,
+                    obj.y,
+                    obj.width,
+                    obj.height,
+                    obj.gid,
+                    _get_object_properties(obj),
+                ]
+                for obj in layer
+            ]
+            layers.append(
+                {
+                    "kind": "objects",
+                    "name": layer.name,
+                    "properties": layer.properties,
+                    "objects": objects,
+                }
+            )
+        else:
+            layers.append({"kind": layer.__class__.__name__, "name": layer.name})
+    arrays.append(
+        array("B", [value for row in _build_pf_matrix(tilemap) for value in row])
+    )
+
+    colliders = {
+        gid: [[c.x, c.y, c.width, c.height] for c in gid_colliders]
+        for gid, gid_colliders in tilemap.get_tile_colliders()
+    }
+
+    meta = json.dumps(
+        {
+            "sources": sources,
+            "width": tilemap.width,
+            "height": tilemap.height,
+            "properties": tilemap.properties,
+            "image_files": list(image_files),
+            "images": images,
+            "colliders": colliders,
+            "gid_typecode": gid_typecode,
+            "layers": layers,
+        }
+    ).encode()
+
+    payload = [meta]
+    for values in arrays:
+        # arrays are always stored in little-endian byte order
+        if sys.byteorder == "big":
+            values.byteswap()
+        payload.append(values.tobytes())
+
+    header = MAP_HEADER.pack(MAP_MAGIC, MAP_FORMAT_VERSION, len(meta))
+    return header + zlib.compress(b"".join(payload), 6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile all TMX maps of the game")
+    parser.add_argument("--maps", default="data/maps", help="folder of the TMX files")
+    parser.add_argument(
+        "--output", default=COMPILED_MAP_DIR, help="folder to write compiled maps to"
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for file_name in sorted(os.listdir(args.maps)):
+        name, extension = os.path.splitext(file_name)
+        if extension != ".tmx":
+            continue
+
+        data = compile_map(os.path.join(args.maps, file_name))
+        with open(os.path.join(args.output, f"{name}.map"), "wb") as file:
+            file.write(data)
+        print(f"{file_name} -> {name}.map ({len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,32 @@
+import weakref
 from dataclasses import dataclass
 
 import pygame
-from pytmx import TiledMap
 
+from src.compiled_map import CompiledMap
 from src.settings import SCALE_FACTOR
 
+# Tile images scaled up by SCALE_FACTOR, keyed on their unscaled image.
+# Maps share the same image between all tiles with the same gid, so this holds
+# one scaled image per gid of every map that is loaded. Entries are dropped
+# once their map has been evicted from the map registry and is no longer used
+_scaled_tile_images: weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_scaled_tile_image(image: pygame.Surface) -> pygame.Surface:
+    """
+    :param image: Unscaled tile image, as loaded with its map
+    :return: The tile image scaled up by SCALE_FACTOR. It is shared by all
+             tiles with the same gid, so it must not be modified.
+    """
+    scaled_image = _scaled_tile_images.get(image)
+    if scaled_image is None:
+        scaled_image = pygame.transform.scale_by(image, SCALE_FACTOR)
+        _scaled_tile_images[image] = scaled_image
+    return scaled_image
+
 
 @dataclass
 class MapObjectType:
@@ -17,9 +39,9 @@ class MapObjectType:
 class MapObjects:
     _objects: dict[int, MapObjectType]
 
-    _tilemap: TiledMap
+    _tilemap: CompiledMap
 
-    def __init__(self, tilemap: TiledMap):
+    def __init__(self, tilemap: CompiledMap):
         self._tilemap = tilemap
 
         self._objects = {}
@@ -0,0 +1,186 @@
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.compiled_map import CompiledMap, load_compiled_map
+
+
+class TmxMapRegistry(Mapping[str, CompiledMap]):
+    """
+    Registry of all TMX maps in a folder, keyed on their file name without
+    extension. A map is only loaded the first time it is accessed.
+
+    Maps are loaded from their compiled form (see map_compiler), which is
+    stored in compiled_path. Maps whose compiled form is missing or out of date
+    are compiled from their TMX file first.
+
+    Maps that are likely to be needed soon can be prefetched, in which case they
+    are loaded in a background thread. Their tile images are only converted to
+    the display format once the map is accessed, as that has to happen on the
+    main thread. Only the max_loaded most recently
+    visited or prefetched maps are kept in memory; all others are evicted and
+    loaded again the next time they are accessed.
+
+    Attributes:
+        max_loaded: maximum number of loaded maps kept in memory
+        compiled_path: path of the folder compiled maps are stored in. When
+                       None, maps are compiled every time they are loaded
+    """
+
+    max_loaded: int
+    compiled_path: str | None
+
+    _paths: dict[str, str]
+    _maps: OrderedDict[str, CompiledMap]
+    _pending: dict[str, Future[CompiledMap]]
+    _executor: ThreadPoolExecutor | None
+    _last_accessed: str | None
+
+    def __init__(
+        self,
+        tmx_path: str,
+        max_loaded: int,
+        background_loading: bool = True,
+        compiled_path: str | None = None,
+    ):
+        """
+        :param tmx_path: path of the folder the TMX files are in
+        :param max_loaded: maximum number of loaded maps kept in memory
+        :param background_loading: whether maps can be prefetched in a
+                                   background thread. When disabled, maps are
+                                   only loaded once they are accessed
+        :param compiled_path: path of the folder compiled maps are stored in
+        """
+        self.max_loaded = max_loaded
+        self.compiled_path = compiled_path
+
+        self._paths = {}
+        for folder_path, _, file_names in os.walk(tmx_path):
+            for file_name in file_names:
+                name, extension = os.path.splitext(file_name)
+                if extension == ".tmx":
+                    self._paths[name] = os.path.join(folder_path, file_name)
+
+        self._maps = OrderedDict()
+        self._pending = {}
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="tmx-prefetch")
+            if background_loading
+            else None
+        )
+        self._last_accessed = None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __getitem__(self, name: str) -> CompiledMap:
+        if name not in self._paths:
+            raise KeyError(name)
+
+        self._collect_prefetched()
+        tilemap = self._maps.get(name)
+        if tilemap is None:
+            future = self._pending.pop(name, None)
+            # a map that is still being prefetched is waited for, instead of
+            # being loaded a second time
+            tilemap = future.result() if future else self._load(name)
+            self._maps[name] = tilemap
+        # maps are loaded without touching the display, which is only safe to do
+        # on the main thread
+        tilemap.convert()
+
+        self._maps.move_to_end(name)
+        self._last_accessed = name
+        self._evict()
+        return tilemap
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        :return: Whether the map has been loaded and is kept in memory
+        """
+        self._collect_prefetched()
+        return name in self._maps
+
+    def is_loading(self, name: str) -> bool:
+        """
+        :return: Whether the map is currently being prefetched
+        """
+        self._collect_prefetched()
+        return name in self._pending
+
+    def prefetch(self, names: Iterable[str]):
+        """
+        Load the given maps in a background thread, unless they are already
+        loaded. Names that do not belong to any map are ignored.
+        """
+        if self._executor is None:
+            return
+
+        self._collect_prefetched()
+        for name in names:
+            if (
+                name in self._paths
+                and name not in self._maps
+                and name not in self._pending
+            ):
+                self._pending[name] = self._executor.submit(self._load, name)
+
+    def _load(self, name: str) -> CompiledMap:
+        tmx_path = self._paths[name]
+        map_dir = os.path.dirname(tmx_path)
+        compiled_file = (
+            os.path.join(self.compiled_path, f"{name}.map")
+            if self.compiled_path
+            else None
+        )
+
+        if compiled_file:
+            try:
+                with open(compiled_file, "rb") as file:
+                    tilemap = load_compiled_map(file.read(), map_dir)
+            except OSError:
+                tilemap = None
+            if tilemap is not None:
+                return tilemap
+
+        # pytmx is only needed when a map has to be compiled
+        from src.map_compiler import compile_map
+
+        data = compile_map(tmx_path)
+        if compiled_file:
+            try:
+                os.makedirs(self.compiled_path, exist_ok=True)
+                # written to a temporary file first, so that an interrupted
+                # write can never leave a truncated file behind
+                with open(f"{compiled_file}.tmp", "wb") as file:
+                    file.write(data)
+                os.replace(f"{compiled_file}.tmp", compiled_file)
+            except OSError:
+                pass
+        return load_compiled_map(data, map_dir)
+
+    def _collect_prefetched(self):
+        for name, future in list(self._pending.items()):
+            if not future.done():
+                continue
+
+            del self._pending[name]
+            # maps that failed to load are loaded again once they are accessed,
+            # so that the error is raised where the map is needed
+            if future.exception() is None:
+                self._maps[name] = future.result()
+        self._evict()
+
+    def _evict(self):
+        for name in list(self._maps):
+            if len(self._maps) <= self.max_loaded:
+                return
+            if name != self._last_accessed:
+                del self._maps[name]
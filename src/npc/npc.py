@@ -177,11 +177,12 @@ class NPC(NPCBase):
         # set "dead" image, this could be a tombstone or a dead body, for example
         if self.study_group == StudyGroup.OUTGROUP:
             skin_state = EntityState(f"outgroup_{self.state.value}")
-            self.image = self.assets[skin_state][self.facing_direction].get_frame(0)
+            frame = self.assets[skin_state][self.facing_direction].get_frame(0)
         else:
-            self.image = self.assets[self.state][self.facing_direction].get_frame(0)
+            frame = self.assets[self.state][self.facing_direction].get_frame(0)
+        # the frame is shared with other NPCs, so only the rotated copy is modified
+        self.image = pygame.transform.rotate(frame, 90)
         self.image.set_alpha(130)
-        self.image = pygame.transform.rotate(self.image, 90)
 
         # remove from collision sprites so doesn't prevent farming or block other characters
         self.remove(self.collision_sprites)
@@ -195,7 +196,7 @@ class NPC(NPCBase):
             self.hp -= int(self.die_rate * dt)
             self.speed = self.hp
             self.image_alpha = 30 + int(150 * (self.hp / 100))
-            self.image.set_alpha(self.image_alpha)
+            self.frame_alpha = self.image_alpha
             if self.hp <= 0:
                 self.die()
 
@@ -24,7 +24,12 @@ class AIData:
         pathfinding_matrix: list[list[int]],
         player: Player,
         moving_collideable_objects: list[Entity] = None,
+        grid: Grid = None,
     ) -> None:
+        """
+        :param grid: [Optional] Grid of the given pathfinding matrix, which is
+                     reused instead of creating a new one
+        """
         if not cls.setup:
             NPCBase.pf_finder = AStarFinder()
             ChickenBase.pf_finder = AStarFinder(
@@ -37,7 +42,7 @@ class AIData:
             cls.setup = True
 
         cls.Matrix = pathfinding_matrix
-        cls.Grid = Grid(matrix=cls.Matrix)
+        cls.Grid = grid if grid is not None else Grid(matrix=cls.Matrix)
 
         for ai in (NPCBase, ChickenBase, CowBase):
             ai.pf_matrix = cls.Matrix
@@ -0,0 +1,69 @@
+import pygame
+
+from src.enums import BlurQuality
+from src.settings import GOGGLES_BLUR_QUALITY
+
+# factor by which the screen is scaled down before being blurred, and the blur
+# radius used on the scaled down screen, for each quality level. The downscaled
+# levels are the closest to the full resolution blur (HIGH) their scale allows
+_BLUR_QUALITY_SETTINGS: dict[BlurQuality, tuple[int, int]] = {
+    BlurQuality.LOW: (4, 0),
+    BlurQuality.MEDIUM: (2, 1),
+    BlurQuality.HIGH: (1, 2),
+}
+
+
+class Blur:
+    """
+    Post-processing effect that blurs the whole display surface.
+    Depending on the quality, the display is scaled down before it is blurred
+    and scaled back up afterwards, which smooths it out as well. All
+    intermediate Surfaces are allocated once, when the quality is set.
+    """
+
+    quality: BlurQuality
+
+    _scale: int
+    _radius: int
+    _scaled_surf: pygame.Surface | None
+    _blurred_surf: pygame.Surface | None
+
+    def __init__(self, quality: BlurQuality = GOGGLES_BLUR_QUALITY):
+        self.display_surface = pygame.display.get_surface()
+        self.set_quality(quality)
+
+    def set_quality(self, quality: BlurQuality):
+        self.quality = quality
+        self._scale, self._radius = _BLUR_QUALITY_SETTINGS[quality]
+
+        width, height = self.display_surface.get_size()
+        size = (width // self._scale, height // self._scale)
+
+        self._scaled_surf = None
+        if self._scale > 1:
+            self._scaled_surf = pygame.Surface(size, 0, self.display_surface)
+
+        self._blurred_surf = None
+        if self._radius:
+            self._blurred_surf = pygame.Surface(size, 0, self.display_surface)
+
+    def apply(self):
+        surf = self.display_surface
+        if self._scaled_surf:
+            pygame.transform.smoothscale(
+                surf, self._scaled_surf.get_size(), self._scaled_surf
+            )
+            surf = self._scaled_surf
+
+        if self._blurred_surf:
+            pygame.transform.box_blur(
+                surf, self._radius, dest_surface=self._blurred_surf
+            )
+            surf = self._blurred_surf
+
+        if self._scaled_surf:
+            pygame.transform.smoothscale(
+                surf, self.display_surface.get_size(), self.display_surface
+            )
+        else:
+            self.display_surface.blit(surf, (0, 0))
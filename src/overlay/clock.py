@@ -5,7 +5,7 @@ import pygame
 from src.enums import ClockVersion
 from src.overlay.game_time import GameTime
 from src.settings import OVERLAY_POSITIONS
-from src.support import import_font
+from src.support import import_font, render_text
 
 
 class Clock:
@@ -23,32 +23,47 @@ class Clock:
         # analog
         if clock_ver == ClockVersion.ANALOG:
             width, height = 80, 80
-            self.center = pygame.math.Vector2(
-                self.left + width / 2, self.top + height / 2
-            )
+            self.center = pygame.math.Vector2(width / 2, height / 2)
             self.hand_length = width / 3
 
             self.rect = pygame.Rect(self.left, self.top, width, height)
-            self.display = self.display_analog
+            self.render = self.render_analog
 
         elif clock_ver == ClockVersion.DIGITAL:
             width, height = 100, 50
             self.font = import_font(40, "font/LycheeSoda.ttf")
 
             self.rect = pygame.Rect(self.left, self.top, width, height)
-            self.display = self.display_digital
+            self.render = self.render_digital
 
         self.rect.topright = OVERLAY_POSITIONS["clock"]
 
-    def display_analog(self):
-        # get time
+        # the clock is only re-rendered when the displayed time changes
+        self._surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._rendered_time = None
+
+    def get_surface(self) -> pygame.Surface:
+        """
+        :return: Surface of the clock, which has to be blitted at Clock.rect
+        """
         time = self.game_time.get_time()
+        if time != self._rendered_time:
+            self._rendered_time = time
+            self._surf.fill((0, 0, 0, 0))
+            self.render(self._surf, time)
+        return self._surf
+
+    def display(self):
+        self.display_surface.blit(self.get_surface(), self.rect)
+
+    def render_analog(self, surface: pygame.Surface, time: tuple[int, int]):
         hour = time[0] % 12
         minute = time[1]
+        rect = surface.get_rect()
 
         # frame
-        pygame.draw.rect(self.display_surface, "White", self.rect, 0, 10)
-        pygame.draw.rect(self.display_surface, "Black", self.rect, 5, 10)
+        pygame.draw.rect(surface, "White", rect, 0, 10)
+        pygame.draw.rect(surface, "Black", rect, 5, 10)
 
         # hands position
         hour_hand_angle = 2 * pi * (hour * 60 + minute) / (12 * 60) - pi / 2
@@ -61,14 +76,11 @@ class Clock:
         )
 
         # draw hands
-        pygame.draw.line(self.display_surface, "Black", self.center, minute_vector, 5)
-        pygame.draw.line(self.display_surface, "Black", self.center, hour_vector, 5)
-        pygame.draw.circle(self.display_surface, "Black", self.center, 4)
-
-    def display_digital(self):
-        # get time
-        time = self.game_time.get_time()
+        pygame.draw.line(surface, "Black", self.center, minute_vector, 5)
+        pygame.draw.line(surface, "Black", self.center, hour_vector, 5)
+        pygame.draw.circle(surface, "Black", self.center, 4)
 
+    def render_digital(self, surface: pygame.Surface, time: tuple[int, int]):
         # if hours are less than 10, add a 0 to stay in the hh:mm format
         hours = str(time[0]).rjust(2, "0")
 
@@ -76,26 +88,25 @@ class Clock:
         minutes = str(time[1]).rjust(2, "0")
 
         # rects and surfs
+        rect = surface.get_rect()
         pady = 2
 
-        colon_surf = self.font.render(":", False, "Black")
-        colon_rect = colon_surf.get_frect(
-            center=(self.rect.centerx, self.rect.centery + pady)
-        )
+        colon_surf = render_text(self.font, ":", False, "Black")
+        colon_rect = colon_surf.get_frect(center=(rect.centerx, rect.centery + pady))
 
-        hour_surf = self.font.render(hours, False, "Black")
+        hour_surf = render_text(self.font, hours, False, "Black")
         hour_rect = hour_surf.get_frect(
-            midright=(self.rect.centerx - colon_rect.width, self.rect.centery + pady)
+            midright=(rect.centerx - colon_rect.width, rect.centery + pady)
         )
 
-        minute_surf = self.font.render(minutes, False, "Black")
+        minute_surf = render_text(self.font, minutes, False, "Black")
         minute_rect = minute_surf.get_frect(
-            midleft=(self.rect.centerx + colon_rect.width, self.rect.centery + pady)
+            midleft=(rect.centerx + colon_rect.width, rect.centery + pady)
         )
 
         # display
-        pygame.draw.rect(self.display_surface, "White", self.rect, 0, 4)
-        pygame.draw.rect(self.display_surface, "Black", self.rect, 4, 4)
-        self.display_surface.blit(colon_surf, colon_rect)
-        self.display_surface.blit(hour_surf, hour_rect)
-        self.display_surface.blit(minute_surf, minute_rect)
+        pygame.draw.rect(surface, "White", rect, 0, 4)
+        pygame.draw.rect(surface, "Black", rect, 4, 4)
+        surface.blit(colon_surf, colon_rect)
+        surface.blit(hour_surf, hour_rect)
+        surface.blit(minute_surf, minute_rect)
@@ -2,6 +2,8 @@ import os
 
 import pygame
 
+from src.support import import_font
+
 
 class FastForward:
     def __init__(self) -> None:
@@ -14,7 +16,7 @@ class FastForward:
                 self.sprites.append(img)
                 self.current_frame = 0
                 self.total_frame = 10
-                self.font = pygame.font.Font("font/LycheeSoda.ttf", 30)
+                self.font = import_font(30, "font/LycheeSoda.ttf")
                 self.text_surface = self.font.render(
                     "R_Shift to Fast Forward", True, (255, 255, 255)
                 )
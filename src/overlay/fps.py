@@ -1,7 +1,7 @@
 import pygame
 
 from src.settings import OVERLAY_POSITIONS
-from src.support import import_font
+from src.support import import_font, render_text
 
 
 class FPS:
@@ -21,25 +21,39 @@ class FPS:
 
         self.rect.bottomright = OVERLAY_POSITIONS["FPS"]
 
+        # the FPS are only re-rendered when their rounded value changes
+        self._surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._rendered_fps = None
+
+    def get_surface(self) -> pygame.Surface:
+        """
+        :return: Surface of the FPS display, which has to be blitted at FPS.rect
+        """
+        fps = round(self.clock.get_fps())
+        if fps != self._rendered_fps:
+            self._rendered_fps = fps
+            self._surf.fill((0, 0, 0, 0))
+            self.render(self._surf, fps)
+        return self._surf
+
     def display(self):
-        # get FPS
-        fps = self.clock.get_fps()
+        self.display_surface.blit(self.get_surface(), self.rect)
 
+    def render(self, surface: pygame.Surface, fps: int):
         # rects and surfs
+        rect = surface.get_rect()
         pad_y = 2
 
-        label_surf = self.font.render("FPS:", False, "Black")
+        label_surf = render_text(self.font, "FPS:", False, "Black")
         label_rect = label_surf.get_frect(
-            midleft=(self.rect.left + 20, self.rect.centery + pad_y)
+            midleft=(rect.left + 20, rect.centery + pad_y)
         )
 
-        fps_surf = self.font.render(f"{fps:5.1f}", False, "Black")
-        fps_rect = fps_surf.get_frect(
-            midright=(self.rect.right - 20, self.rect.centery + pad_y)
-        )
+        fps_surf = render_text(self.font, f"{fps:3d}", False, "Black")
+        fps_rect = fps_surf.get_frect(midright=(rect.right - 20, rect.centery + pad_y))
 
         # display
-        pygame.draw.rect(self.display_surface, "White", self.rect, 0, 4)
-        pygame.draw.rect(self.display_surface, "Black", self.rect, 4, 4)
-        self.display_surface.blit(label_surf, label_rect)
-        self.display_surface.blit(fps_surf, fps_rect)
+        pygame.draw.rect(surface, "White", rect, 0, 4)
+        pygame.draw.rect(surface, "Black", rect, 4, 4)
+        surface.blit(label_surf, label_rect)
+        surface.blit(fps_surf, fps_rect)
@@ -0,0 +1,117 @@
+import pygame
+
+from src.overlay.sky import Sky
+from src.overlay.transition import Transition
+
+_WHITE = (255, 255, 255)
+_BLACK = (0, 0, 0)
+
+# Level from which the volcanic atmosphere is shown on top of the sky
+_VOLCANIC_LEVEL = 7
+
+
+class Lighting:
+    """
+    Compositor for all full-screen lighting effects of the Level: the Sky tint,
+    the volcanic atmosphere and Transitions.
+
+    All multiply and alpha passes of the sky are fused into a single tint (plus
+    a single additive pass for the volcanic atmosphere), and all active
+    Transitions into another one. Tints are only recomputed when the game time
+    or the progress of a Transition changes, and are skipped entirely when they
+    would not change the screen.
+    """
+
+    sky: Sky
+    transitions: tuple[Transition, ...]
+
+    _sky_state: tuple | None
+    _sky_tint: tuple[int, int, int]
+    _sky_offset: tuple[int, int, int]
+    _transition_colors: tuple | None
+    _transition_tint: tuple[int, int, int]
+
+    def __init__(self, sky: Sky, *transitions: Transition):
+        self.display_surface = pygame.display.get_surface()
+        self.sky = sky
+        self.transitions = transitions
+
+        self._sky_state = None
+        self._sky_tint = _WHITE
+        self._sky_offset = _BLACK
+
+        self._transition_colors = None
+        self._transition_tint = _WHITE
+
+    def _update_sky_tint(self, level: int, passes: int):
+        state = (self.sky.game_time.get_time(), level >= _VOLCANIC_LEVEL, passes)
+        if state == self._sky_state:
+            return
+        self._sky_state = state
+
+        self.sky.color = self.sky.get_color()
+        *volcanic_color, volcanic_alpha = self.sky.volcanic_color
+        volcanic_alpha /= 255
+
+        # every pass maps each channel value x to x * multiplier + offset
+        multiplier = [1.0, 1.0, 1.0]
+        offset = [0.0, 0.0, 0.0]
+        for _ in range(passes):
+            for i, value in enumerate(self.sky.color):
+                multiplier[i] *= value / 255
+                offset[i] *= value / 255
+
+            if level >= _VOLCANIC_LEVEL:
+                for i, value in enumerate(volcanic_color):
+                    multiplier[i] *= 1 - volcanic_alpha
+                    offset[i] = (
+                        offset[i] * (1 - volcanic_alpha) + value * volcanic_alpha
+                    )
+
+        self._sky_tint = tuple(round(value * 255) for value in multiplier)
+        self._sky_offset = tuple(round(value) for value in offset)
+
+    def display_sky(self, level: int, passes: int = 1):
+        """
+        Tint the display surface according to the current game time.
+        :param level: current level, decides whether the volcanic atmosphere
+                      should be shown
+        :param passes: how many times the sky should be applied
+        """
+        self._update_sky_tint(level, passes)
+
+        if self._sky_tint != _WHITE:
+            self.display_surface.fill(
+                self._sky_tint, special_flags=pygame.BLEND_RGB_MULT
+            )
+        if self._sky_offset != _BLACK:
+            self.display_surface.fill(
+                self._sky_offset, special_flags=pygame.BLEND_RGB_ADD
+            )
+
+    def _update_transition_tint(self):
+        colors = tuple(
+            tuple(transition.curr_color)[:3]
+            for transition in self.transitions
+            if transition
+        )
+        if colors == self._transition_colors:
+            return
+        self._transition_colors = colors
+
+        tint = [1.0, 1.0, 1.0]
+        for color in colors:
+            for i, value in enumerate(color):
+                tint[i] *= value / 255
+        self._transition_tint = tuple(round(value * 255) for value in tint)
+
+    def display_transitions(self):
+        """
+        Fade the display surface according to all active Transitions.
+        """
+        self._update_transition_tint()
+
+        if self._transition_tint != _WHITE:
+            self.display_surface.fill(
+                self._transition_tint, special_flags=pygame.BLEND_RGB_MULT
+            )
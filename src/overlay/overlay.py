@@ -27,22 +27,32 @@ class Overlay:
         self.clock = Clock(game_time, ClockVersion.DIGITAL)
         self.FPS = FPS(clock)
 
+        # blits of the seed and tool icons, which only change with the selection
+        self._icon_blits = {}
+
+    def _get_icon_blit(
+        self, frame_name: str, position: str
+    ) -> tuple[pygame.Surface, pygame.FRect]:
+        key = (frame_name, position)
+        if key not in self._icon_blits:
+            surf = self.overlay_frames[frame_name]
+            rect = surf.get_frect(midbottom=OVERLAY_POSITIONS[position])
+            self._icon_blits[key] = (surf, rect)
+        return self._icon_blits[key]
+
     def display(self):
         if not self.visible:
             return
 
-        # seeds
-        seed_surf = self.overlay_frames[self.player.get_current_seed_string()]
-        seed_rect = seed_surf.get_frect(midbottom=OVERLAY_POSITIONS["seed"])
-        self.display_surface.blit(seed_surf, seed_rect)
-
-        # tool
-        tool_surf = self.overlay_frames[self.player.get_current_tool_string()]
-        tool_rect = tool_surf.get_frect(midbottom=OVERLAY_POSITIONS["tool"])
-        self.display_surface.blit(tool_surf, tool_rect)
-
-        self.clock.display()
-        self.FPS.display()
-
-        # health bar
-        self.health_bar.draw(self.display_surface)
+        # every widget retains its rendered Surface and only re-renders it when
+        # the values it displays change, so the whole HUD is a single fblits call
+        self.display_surface.fblits(
+            (
+                self._get_icon_blit(self.player.get_current_seed_string(), "seed"),
+                self._get_icon_blit(self.player.get_current_tool_string(), "tool"),
+                (self.clock.get_surface(), self.clock.rect),
+                (self.FPS.get_surface(), self.FPS.rect),
+                self.health_bar.get_blit(),
+            )
+        )
+        self.health_bar.handle_debug_keys()
@@ -1,24 +1,18 @@
 import random
 
-import pygame
-
 from src.enums import Layer
 from src.overlay.game_time import GameTime
-from src.settings import (
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
 from src.sprites.water_drop import WaterDrop
 
 
 class Sky:
+    """
+    Sky colors depending on the time of the day. The colors are applied to the
+    screen by the Lighting compositor.
+    """
+
     def __init__(self, game_time: GameTime):
-        self.display_surface = pygame.display.get_surface()
         self.game_time = game_time
-        self.full_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.volcanic_surf = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-        )
         # color
         self.colors = {
             "6": (160, 187, 255),
@@ -69,18 +63,6 @@ class Sky:
 
         return color
 
-    def display(self, level):
-        # draw
-        self.color = self.get_color()
-        self.full_surf.fill(self.color)
-        self.display_surface.blit(
-            self.full_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
-        )
-
-        if level >= 7:
-            self.volcanic_surf.fill(self.volcanic_color)
-            self.display_surface.blit(self.volcanic_surf, (0, 0))
-
 
 class Rain:
     def __init__(self, all_sprites, level_frames, map_size=None):
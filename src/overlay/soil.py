@@ -2,8 +2,8 @@ from collections.abc import Callable
 from random import choice
 
 import pygame
-from pytmx import TiledTileLayer
 
+from src.compiled_map import CompiledTileLayer
 from src.enums import FarmingTool, InventoryResource, Layer, SeedType, StudyGroup
 from src.groups import AllSprites
 from src.settings import SCALED_TILE_SIZE
@@ -123,7 +123,7 @@ class Tile(Sprite):
 
 
 class SoilArea:
-    all_sprites: pygame.sprite.Group
+    all_sprites: AllSprites
     level_frames: dict
 
     soil_sprites: pygame.sprite.Group
@@ -135,7 +135,7 @@ class SoilArea:
 
     raining: bool
 
-    def __init__(self, all_sprites: pygame.sprite.Group, frames: dict):
+    def __init__(self, all_sprites: AllSprites, frames: dict):
         self.all_sprites = all_sprites
         self.level_frames = frames
 
@@ -248,7 +248,7 @@ class SoilArea:
     #     self.plant_sprites.empty()
 
     def create_soil_tiles(
-        self, layer: TiledTileLayer, previous_soil_data: dict | None = None
+        self, layer: CompiledTileLayer, previous_soil_data: dict | None = None
     ):
         if self.tiles:
             self.all_sprites.add(
@@ -283,7 +283,9 @@ class SoilArea:
             seed_name = plant_info.plant_type.as_plant_name()
             frames = self.level_frames[seed_name]
             plant = Plant(plant_info.plant_type, (), tile, frames)
-            plant.add(self.all_sprites, self.plant_sprites)
+            plant.add(self.plant_sprites)
+            # plants change their rect when growing
+            self.all_sprites.add_dynamic(plant)
 
     def update_tile_image(self, tile, pos):
         for dx, dy in self.neighbor_directions:
@@ -366,8 +368,9 @@ class SoilArea:
 
             seed_name = seed_type.as_plant_name()
             frames = self.level_frames[seed_name]
-            groups = (self.all_sprites, self.plant_sprites)
-            tile.plant = Plant(seed_type, groups, tile, frames)
+            tile.plant = Plant(seed_type, self.plant_sprites, tile, frames)
+            # plants change their rect when growing
+            self.all_sprites.add_dynamic(tile.plant)
             return True
 
         return False
@@ -465,7 +468,7 @@ class SoilManager:
     def load_area(
         self,
         study_group: StudyGroup,
-        layer: TiledTileLayer,
+        layer: CompiledTileLayer,
         previous_soil_data: dict | None = None,
     ):
         self.get_area(study_group).create_soil_tiles(
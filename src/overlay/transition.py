@@ -1,30 +1,48 @@
-from collections.abc import Callable
+import gc
+import time
+from collections.abc import Callable, Iterator
 
 import pygame
 
-from src import settings
+from src.settings import TRANSITION_FRAME_BUDGET
 from src.support import oscilating_lerp
 from src.timer import Timer
 
 
 class Transition:
+    """
+    Fades the screen to black and back again, calling reset once the screen is
+    black. If reset returns an Iterator, its steps are spread across multiple
+    frames, taking up at most TRANSITION_FRAME_BUDGET milliseconds per frame,
+    and the screen stays black until all steps are done. Automatic garbage
+    collection is paused meanwhile, as a full collection on top of the frame
+    budget would cause the very hitch the steps are meant to avoid. It is
+    restored once the steps are done, have failed or have been abandoned by
+    activating the transition again.
+
+    Attributes:
+        resetting: whether the steps of reset are still being worked through
+    """
+
+    resetting: bool
+
+    _reset_steps: Iterator | None
+    _gc_was_enabled: bool
+
     def __init__(
-        self, reset: Callable[[], None], finish_reset: Callable[[], None], dur: int
+        self,
+        reset: Callable[[], Iterator | None],
+        finish_reset: Callable[[], None],
+        dur: int,
     ):
         # setup
-        self.display_surface = pygame.display.get_surface()
         self.reset = reset
         self.peaked = False
         self.timer = Timer(dur, func=finish_reset)
         self.finish_reset = finish_reset
-
-        # overlay image
-        self.image = pygame.Surface(
-            (
-                settings.SCREEN_WIDTH,
-                settings.SCREEN_HEIGHT,
-            )
-        )
+        self.resetting = False
+        self._reset_steps = None
+        self._gc_was_enabled = False
 
         # color
         self.start_color = pygame.Color(255, 255, 255)
@@ -35,24 +53,59 @@ class Transition:
         return bool(self.timer)
 
     def activate(self):
+        # the steps of a previous reset that are still left are abandoned
+        self._stop_reset()
         self.timer.activate()
         self.peaked = False
 
+    def _start_reset(self, steps: Iterator):
+        self._reset_steps = steps
+        self.resetting = True
+        self._gc_was_enabled = gc.isenabled()
+        gc.disable()
+        self._continue_reset()
+
+    def _continue_reset(self):
+        deadline = time.perf_counter() + TRANSITION_FRAME_BUDGET / 1000
+        done = True
+        try:
+            for _ in self._reset_steps:
+                if time.perf_counter() >= deadline:
+                    done = False
+                    # hold the transition at its peak until all steps are done
+                    self.timer.start_time = (
+                        pygame.time.get_ticks() - self.timer.duration // 2
+                    )
+                    break
+        finally:
+            # a step that raises ends the reset as well
+            if done:
+                self._stop_reset()
+
+    def _stop_reset(self):
+        if not self.resetting:
+            return
+
+        close = getattr(self._reset_steps, "close", None)
+        if close is not None:
+            close()
+        self._reset_steps = None
+        self.resetting = False
+        if self._gc_was_enabled:
+            gc.enable()
+
     def update(self):
+        if self.resetting:
+            self._continue_reset()
         self.timer.update()
         if self.timer:
             t = self.timer.get_progress()
             # call reset
             if not self.peaked and t > 0.5:
-                self.reset()
+                steps = self.reset()
                 self.peaked = True
+                if steps is not None:
+                    self._start_reset(steps)
             # interpolate colors
             t = oscilating_lerp(0, 1, pygame.math.smoothstep(0, 1, t))
             self.curr_color = self.start_color.lerp(self.target_color, t)
-
-    def draw(self):
-        if self.timer:
-            self.image.fill(self.curr_color)
-            self.display_surface.blit(
-                self.image, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
-            )
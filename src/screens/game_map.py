@@ -1,15 +1,19 @@
-import copy
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Iterator
 from typing import Any
 
 import pygame
 from pathfinding.core.grid import Grid
-from pytmx import TiledElement, TiledMap, TiledObject, TiledObjectGroup, TiledTileLayer
 
 from src.camera.camera_target import CameraTarget
 from src.camera.zoom_area import ZoomArea
 from src.camera.zoom_manager import ZoomManager
+from src.compiled_map import (
+    CompiledMap,
+    CompiledObject,
+    CompiledObjectGroup,
+    CompiledTileLayer,
+)
 from src.enums import (
     FarmingTool,
     InventoryResource,
@@ -22,7 +26,7 @@ from src.exceptions import GameMapWarning, InvalidMapError
 from src.groups import AllSprites, PersistentSpriteGroup
 from src.gui.interface.emotes import NPCEmoteManager, PlayerEmoteManager
 from src.gui.scene_animation import SceneAnimation
-from src.map_objects import MapObjects, MapObjectType
+from src.map_objects import MapObjects, MapObjectType, get_scaled_tile_image
 from src.npc.bases.animal import Animal
 from src.npc.behaviour.chicken_behaviour_tree import (
     ChickenBehaviourTree,
@@ -47,9 +51,11 @@ from src.settings import (
     SCALE_FACTOR,
     SCALED_TILE_SIZE,
     SETUP_PATHFINDING,
+    STATIC_CHUNK_SIZE,
     TEST_ANIMALS,
+    TILE_SIZE,
 )
-from src.sprites.base import AnimatedSprite, CollideableMapObject, Sprite
+from src.sprites.base import CollideableMapObject, SharedAnimation, Sprite
 from src.sprites.drops import DropsManager
 from src.sprites.entities.character import Character
 from src.sprites.entities.player import Player
@@ -59,26 +65,80 @@ from src.sprites.setup import ENTITY_ASSETS
 
 
 def _setup_tile_layer(
-    layer: TiledTileLayer, func: Callable[[tuple[int, int], pygame.Surface], None]
-):
+    layer: CompiledTileLayer, func: Callable[[tuple[int, int], pygame.Surface], None]
+) -> Iterator[None]:
     """
-    Calls func for each tile found in layer
-    :param layer: TiledTileLayer
+    Calls func for each tile found in layer, yielding after each row of tiles
+    :param layer: CompiledTileLayer
     :param func: function(pos, image)
     """
+    row = None
     for x, y, image in layer.tiles():
+        if y != row:
+            if row is not None:
+                yield
+            row = y
         x = x * SCALED_TILE_SIZE
         y = y * SCALED_TILE_SIZE
         pos = (x, y)
         func(pos, image)
 
 
+def _bake_static_chunks(
+    tiles: list[tuple[tuple[int, int], pygame.Surface]],
+    map_size: tuple[int, int],
+) -> Iterator[tuple[tuple[int, int], pygame.Surface]]:
+    """
+    Pre-renders tiles into chunk Surfaces of STATIC_CHUNK_SIZE x STATIC_CHUNK_SIZE
+    tiles. Tiles are blitted in the same order AllSprites.draw would render them
+    as separate Sprites (by their bottom position), so the baked chunks look
+    exactly like the individual tiles would.
+    :param tiles: list of (pos, image) tuples, where pos is the (pixel-scale)
+                  position of the tile and image its unscaled Surface
+    :param map_size: size of the map (tile-scale)
+    :return: Iterator of (pos, surf) of all chunks, where pos is the
+             (pixel-scale) position of the chunk and surf its scaled Surface.
+             Each chunk is only rendered once it is requested
+    """
+    chunk_size = STATIC_CHUNK_SIZE * TILE_SIZE
+    map_width, map_height = map_size[0] * TILE_SIZE, map_size[1] * TILE_SIZE
+
+    chunk_tiles: dict[tuple[int, int], list[tuple[pygame.Surface, tuple]]] = {}
+    for pos, image in sorted(
+        tiles, key=lambda tile: tile[0][1] + tile[1].get_height() * SCALE_FACTOR
+    ):
+        x, y = pos[0] // SCALE_FACTOR, pos[1] // SCALE_FACTOR
+        width, height = image.get_size()
+
+        # tiles with oversized images may overlap multiple chunks
+        for chunk_x in range(x // chunk_size, (x + width - 1) // chunk_size + 1):
+            for chunk_y in range(y // chunk_size, (y + height - 1) // chunk_size + 1):
+                chunk_tiles.setdefault((chunk_x, chunk_y), []).append(
+                    (image, (x - chunk_x * chunk_size, y - chunk_y * chunk_size))
+                )
+
+    for (chunk_x, chunk_y), blits in chunk_tiles.items():
+        chunk = pygame.Surface(
+            (
+                max(min(chunk_size, map_width - chunk_x * chunk_size), 1),
+                max(min(chunk_size, map_height - chunk_y * chunk_size), 1),
+            ),
+            pygame.SRCALPHA,
+        )
+        chunk.blits(blits, doreturn=False)
+        yield (
+            (chunk_x * chunk_size * SCALE_FACTOR, chunk_y * chunk_size * SCALE_FACTOR),
+            pygame.transform.scale_by(chunk, SCALE_FACTOR),
+        )
+
+
 def _setup_object_layer(
-    layer: TiledObjectGroup, func: Callable[[tuple[float, float], TiledObject], Any]
-):
+    layer: CompiledObjectGroup,
+    func: Callable[[tuple[float, float], CompiledObject], Any],
+) -> Generator[None, None, list]:
     """
-    Calls func for each tile found in layer
-    :param layer: TiledTileLayer
+    Calls func for each tile found in layer, yielding after each object
+    :param layer: CompiledTileLayer
     :param func: function(pos, object) -> object instance
     :return: All object instances
     """
@@ -88,17 +148,20 @@ def _setup_object_layer(
         y = obj.y * SCALE_FACTOR
         pos = (x, y)
         objects.append(func(pos, obj))
+        yield
     return objects
 
 
 def _setup_animal_ranges(
-    interaction_sprites: PersistentSpriteGroup, animals: list[Animal]
-) -> None:
-    if AIData.Matrix is None:
-        raise InvalidMapError("AI Pathfinding Matrix is not defined")
-
-    range_matrix_cows = [row.copy() for row in AIData.Matrix]
-    range_matrix_chickens = [row.copy() for row in AIData.Matrix]
+    pf_matrix: list[list[int]], interaction_sprites: PersistentSpriteGroup
+) -> Iterator[Grid]:
+    """
+    :param pf_matrix: pathfinding matrix of the map
+    :return: Iterator of the Grids of the areas cows and chickens are allowed
+             to wander in. Each Grid is only created once it is requested
+    """
+    range_matrix_cows = [row.copy() for row in pf_matrix]
+    range_matrix_chickens = [row.copy() for row in pf_matrix]
 
     for sprite in interaction_sprites:
         if sprite.name in ["L_RANGE_BLOCKAGE", "R_RANGE_BLOCKAGE"]:
@@ -121,11 +184,11 @@ def _setup_animal_ranges(
                 (rect.width / SCALE_FACTOR, rect.height / SCALE_FACTOR),
             )
 
-    CowIndividualContext.range_grid = Grid(matrix=range_matrix_cows)
-    ChickenIndividualContext.range_grid = Grid(matrix=range_matrix_chickens)
+    yield Grid(matrix=range_matrix_cows)
+    yield Grid(matrix=range_matrix_chickens)
 
 
-def _setup_camera_layer(layer: TiledObjectGroup):
+def _setup_camera_layer(layer: CompiledObjectGroup):
     # BEWARE! THIS FUNCTION IS A GENERATOR!
     # DO NOT TRY TO USE THIS AS A LIST!
     """Sets up all camera targets for a cutscene using the layer objects."""
@@ -167,7 +230,7 @@ def _setup_camera_layer(layer: TiledObjectGroup):
         )
 
 
-def _setup_zoom_layer(layer: TiledObjectGroup):
+def _setup_zoom_layer(layer: CompiledObjectGroup):
     """Setup the zoom areas from an object group."""
     for area_id, obj in enumerate(layer):
         covered_surface = pygame.FRect(
@@ -199,7 +262,7 @@ def _setup_zoom_layer(layer: TiledObjectGroup):
 
 
 def _get_element_property(
-    element: TiledElement,
+    element: CompiledTileLayer | CompiledObjectGroup,
     property_name: str,
     callback: Callable[[str], Any],
     default: Any,
@@ -229,10 +292,13 @@ def _get_element_property(
 
 class GameMap:
     """
-    Class representing a single game map
+    Class representing a single game map.
+    Creating a GameMap does not create any Sprites yet. The map has to be built
+    with build and activated before it can be played on.
 
     Attributes:
-        _tilemap: loaded map as pytmx.TiledMap
+        _selected_map: map this GameMap is built for
+        _tilemap: map loaded from its compiled form
         _tilemap_size: size of the current map (tile-scale)
         _tilemap_scaled_size: size of the current map (pixel-scale)
 
@@ -240,7 +306,16 @@ class GameMap:
                       TODO: This should probably be reworked to only load on
                        game start, as all maps are loaded on game start as well
 
-        _pf_matrix: pathfinding matrix
+        _static_tiles: tiles of all static tile layers, grouped by Layer.
+                       They are baked into chunks once all layers are set up
+
+        _pf_matrix: pathfinding matrix, with all static colliders of the map
+        _pf_grid: pathfinding Grid of _pf_matrix, created when the map is built
+        _range_grids: Grids of the areas cows and chickens are allowed to
+                      wander in, created when the map is built
+
+        _camera_target_layers: layers with the camera targets of the map
+        _zoom_area_layers: layers with the zoom areas of the map
 
         player_spawnpoint: default spawnpoint for the player
         player_entry_warps: warps where the player should enter the map,
@@ -250,18 +325,28 @@ class GameMap:
 
         npcs: list of all NPCs on the map
         animals: list of all Animals on the map
+
+        water_animation: animation shared by all water tiles on the map
     """
 
-    _tilemap: TiledMap
+    _selected_map: Map
+    _tilemap: CompiledMap
     _tilemap_size: tuple[int, int]
     _tilemap_scaled_size: tuple[int, int]
 
     _map_objects: MapObjects
 
-    minigame_layer: TiledObjectGroup | None
+    _static_tiles: dict[Layer, list[tuple[tuple[int, int], pygame.Surface]]]
+
+    minigame_layer: CompiledObjectGroup | None
 
     # pathfinding
     _pf_matrix: list[list[int]]
+    _pf_grid: Grid | None
+    _range_grids: list[Grid]
+
+    _camera_target_layers: list[CompiledObjectGroup]
+    _zoom_area_layers: list[CompiledObjectGroup]
 
     # map warp points
     player_spawnpoint: tuple[int, int] | None
@@ -272,13 +357,12 @@ class GameMap:
     npcs: list[NPC]
     animals: list[Animal]
 
+    water_animation: SharedAnimation
+
     def __init__(
         self,
         selected_map: Map,
-        tilemap: TiledMap,
-        save_file: SaveFile,
-        scene_ani: SceneAnimation,
-        zoom_man: ZoomManager,
+        tilemap: CompiledMap,
         # Sprite groups
         all_sprites: AllSprites,
         collision_sprites: PersistentSpriteGroup,
@@ -299,6 +383,7 @@ class GameMap:
         # assets
         frames: dict,
     ):
+        self._selected_map = selected_map
         self._tilemap = tilemap
 
         if "Player" not in self._tilemap.layernames:
@@ -331,16 +416,21 @@ class GameMap:
             self._tilemap_size[1] * SCALED_TILE_SIZE,
         )
 
-        # pathfinding
+        # pathfinding. All static colliders of the map have already been added
+        # to the matrix when the map was compiled
         self._pf_matrix = [
-            [1 for _ in range(self._tilemap_size[0])]
-            for _ in range(self._tilemap_size[1])
-            if SETUP_PATHFINDING
+            row.copy() for row in self._tilemap.pf_matrix if SETUP_PATHFINDING
         ]
+        self._pf_grid = None
+        self._range_grids = []
 
         self._map_objects = MapObjects(self._tilemap)
 
+        self._static_tiles = {}
+
         self.minigame_layer = None
+        self._camera_target_layers = []
+        self._zoom_area_layers = []
 
         self.player_spawnpoint = None
         self.player_entry_warps = {}
@@ -348,20 +438,99 @@ class GameMap:
         self.npcs = []
         self.animals = []
 
-        self._setup_layers(save_file, selected_map, scene_ani, zoom_man)
+        self.water_animation = SharedAnimation(
+            self.frames["level"]["animations"]["water"]
+        )
+
+    @property
+    def size(self):
+        return self._tilemap_scaled_size
+
+    def build(self, save_file: SaveFile) -> Iterator[None]:
+        """
+        Create all Sprites of the map, one step at a time. Every step sets up
+        at most a row of tiles or a single object, bakes a single chunk or
+        creates a single pathfinding Grid, so that building the map can be
+        spread across multiple frames.
+        :param save_file: SaveFile to load the soil of farmable layers from
+        :return: Iterator that has to be exhausted to build the map
+        """
+        yield from self._setup_layers(save_file, self._selected_map)
+        yield from self._setup_static_chunks()
 
         if SETUP_PATHFINDING:
-            AIData.update(self._pf_matrix, self.player, [*self.npcs, *self.animals])
+            self._pf_grid = Grid(matrix=self._pf_matrix)
+            yield
+            if ENABLE_NPCS:
+                for grid in _setup_animal_ranges(
+                    self._pf_matrix, self.interaction_sprites
+                ):
+                    self._range_grids.append(grid)
+                    yield
+
+    def activate(self, scene_ani: SceneAnimation, zoom_man: ZoomManager):
+        """
+        Set up everything that is shared between all maps (cutscene targets,
+        zoom areas, pathfinding data and emote interactions) for this map.
+        This has to be done again whenever the map becomes the current map
+        after another map has been active.
+        """
+        # We clear the target data first so that the cutscene from the previous
+        # room doesn't play again if the current one
+        # doesn't have any camera targets
+        scene_ani.reset()
+        scene_ani.clear()
+        for layer in self._camera_target_layers:
+            scene_ani.set_target_points(_setup_camera_layer(layer))
+
+        # Clearing the zoom manager in advance, in case no zoom areas exist for the current map
+        zoom_man.clear()
+        for layer in self._zoom_area_layers:
+            zoom_man.set_zoom_areas(_setup_zoom_layer(layer))
+
+        if SETUP_PATHFINDING:
+            AIData.update(
+                self._pf_matrix,
+                self.player,
+                [*self.npcs, *self.animals],
+                self._pf_grid,
+            )
 
             if ENABLE_NPCS:
                 self._setup_emote_interactions()
-                _setup_animal_ranges(self.interaction_sprites, self.animals)
-
-    @property
-    def size(self):
-        return self._tilemap_scaled_size
+                (
+                    CowIndividualContext.range_grid,
+                    ChickenIndividualContext.range_grid,
+                ) = self._range_grids
 
     # region tile layer setup methods
+    def _setup_static_tile(
+        self,
+        pos: tuple[int, int],
+        surf: pygame.Surface,
+        layer: Layer,
+    ):
+        """
+        Register a tile that never changes, so that it can be baked into the
+        chunks of its Layer instead of being created as a separate Sprite
+        :param pos: Position of the tile (x, y)
+        :param surf: Unscaled Surface of the tile
+        :param layer: z-Layer on which the tile should be displayed
+        """
+        self._static_tiles.setdefault(layer, []).append((pos, surf))
+
+    def _setup_static_chunks(self) -> Iterator[None]:
+        """
+        Bake all static tiles into chunk Sprites, one per chunk for each Layer.
+        Yields after each chunk
+        """
+        for layer, tiles in self._static_tiles.items():
+            for pos, surf in _bake_static_chunks(tiles, self._tilemap_size):
+                Sprite(pos, surf, z=layer).add(self.all_sprites)
+                yield
+
+        self._static_tiles.clear()
+
     def _setup_base_tile(
         self,
         pos: tuple[int, int],
@@ -377,7 +546,7 @@ class GameMap:
         :param layer: z-Layer on which the Sprite should be displayed
         :param groups: Groups the Sprite should be added to
         """
-        image = pygame.transform.scale_by(surf, SCALE_FACTOR)
+        image = get_scaled_tile_image(surf)
         Sprite(pos, image, z=layer).add(groups)
 
     def _setup_collideable_tile(
@@ -388,17 +557,12 @@ class GameMap:
         groups: tuple[pygame.sprite.Group, ...] | pygame.sprite.Group,
     ):
         """
-        Set up a base tile, and add it as collideable Tile to the pathfinding
-        matrix
+        Set up a base tile that collides with other Sprites. Its image is baked
+        into the static chunks of the given layer, so the tile should not be
+        added to AllSprites itself.
         """
         self._setup_base_tile(pos, surf, layer, groups)
-
-        if SETUP_PATHFINDING:
-            pf_add_matrix_collision(
-                self._pf_matrix,
-                (pos[0] / SCALE_FACTOR, pos[1] / SCALE_FACTOR),
-                surf.get_size(),
-            )
+        self._setup_static_tile(pos, surf, layer)
 
     def _setup_water_tile(
         self,
@@ -406,13 +570,15 @@ class GameMap:
         groups: tuple[pygame.sprite.Group, ...] | pygame.sprite.Group,
     ):
         """
-        Create a new AnimatedSprite and add it to the given groups.
-        This Sprite will be animated as Water and displayed on Layer.WATER
+        Create a new Sprite and add it to the given groups.
+        This Sprite will be animated as Water through the shared water
+        animation and displayed on Layer.WATER
         :param pos: Position of Sprite (x, y)
         :param groups: Groups the Sprite should be added to
         """
-        image = self.frames["level"]["animations"]["water"]
-        AnimatedSprite(pos, image, z=Layer.WATER).add(groups)
+        sprite = Sprite(pos, self.water_animation.image, z=Layer.WATER)
+        self.water_animation.add(sprite)
+        sprite.add(groups)
 
     # endregion
 
@@ -420,7 +586,7 @@ class GameMap:
     def _setup_base_object(
         self,
         pos: tuple[int, int],
-        obj: TiledObject,
+        obj: CompiledObject,
         layer: Layer,
         groups: tuple[pygame.sprite.Group, ...] | pygame.sprite.Group,
         name: str = None,
@@ -428,7 +594,7 @@ class GameMap:
         """
         Create a new rectangular hitbox and add it to the given groups.
         :param pos: Position of the hitbox Sprite (x, y)
-        :param obj: TiledObject from which the hitbox should be created
+        :param obj: CompiledObject from which the hitbox should be created
         :param layer: z-Layer on which the Sprite should be displayed
                       TODO: Should likely be removed / reworked since hitboxes
                        should not be displayed at all
@@ -444,26 +610,20 @@ class GameMap:
     def _setup_collision_rect(
         self,
         pos: tuple[int, int],
-        obj: TiledObject,
+        obj: CompiledObject,
         layer: Layer,
         groups: tuple[pygame.sprite.Group, ...] | pygame.sprite.Group,
         name: str = None,
     ):
         """
-        Set up a base object and add it as collideable object to the
-        pathfinding matrix
+        Set up a base object that collides with other Sprites
         """
         size = (obj.width * SCALE_FACTOR, obj.height * SCALE_FACTOR)
         image = pygame.Surface(size)
         Sprite(pos, image, z=layer, name=name).add(groups)
 
-        if SETUP_PATHFINDING:
-            pf_add_matrix_collision(
-                self._pf_matrix, (obj.x, obj.y), (obj.width, obj.height)
-            )
-
     def _setup_tree(
-        self, pos: tuple[int, int], obj: TiledObject, object_type: MapObjectType
+        self, pos: tuple[int, int], obj: CompiledObject, object_type: MapObjectType
     ):
         props = obj.properties
         if props.get("size") == "medium" and props.get("breakable"):
@@ -495,7 +655,7 @@ class GameMap:
             )
 
     def _setup_bush(
-        self, pos: tuple[int, int], obj: TiledObject, object_type: MapObjectType
+        self, pos: tuple[int, int], obj: CompiledObject, object_type: MapObjectType
     ):
         props = obj.properties
         if props.get("size") == "medium":
@@ -531,15 +691,15 @@ class GameMap:
     def _setup_map_object(
         self,
         pos: tuple[int, int],
-        obj: TiledObject,
+        obj: CompiledObject,
         layer: Layer,
     ):
         """
-        Create a new collideable Sprite from the given TiledObject.
+        Create a new collideable Sprite from the given CompiledObject.
         If the value of the object's "type" property equals "tree", this Sprite will be
         created from the Tree class and will take its assets from self.frames
         :param pos: Position of Sprite (x, y)
-        :param obj: TiledObject to create the Sprite from
+        :param obj: CompiledObject to create the Sprite from
         :param layer: z-Layer on which the Sprite should be displayed
                       (Trees will always be rendered on Layer.MAIN)
         """
@@ -558,24 +718,11 @@ class GameMap:
                         self.all_sprites,
                         self.collision_sprites,
                     )
-
-            if SETUP_PATHFINDING:
-                pf_add_matrix_collision(
-                    self._pf_matrix,
-                    (
-                        obj.x + object_type.hitbox.x / SCALE_FACTOR,
-                        obj.y + object_type.hitbox.y / SCALE_FACTOR,
-                    ),
-                    (
-                        object_type.hitbox.width / SCALE_FACTOR,
-                        object_type.hitbox.height / SCALE_FACTOR,
-                    ),
-                )
         else:
-            surf = pygame.transform.scale_by(object_type.image, SCALE_FACTOR)
+            surf = get_scaled_tile_image(object_type.image)
             Sprite(pos, surf, z=layer).add(self.all_sprites)
 
-    def _setup_player_warp(self, pos: tuple[int, int], obj: TiledObject):
+    def _setup_player_warp(self, pos: tuple[int, int], obj: CompiledObject):
         """
         Add a new Player warp point.
         The type of the warp will be retrieved from the object's name.
@@ -590,7 +737,7 @@ class GameMap:
         "to farm_new".
 
         :param pos: Position of the warp
-        :param obj: TiledObject to create the warp from
+        :param obj: CompiledObject to create the warp from
         """
         name = obj.name
         if name == "spawnpoint":
@@ -621,7 +768,7 @@ class GameMap:
             else:
                 warnings.warn(f'Invalid player warp "{name}"', GameMapWarning)
 
-    def _setup_npc(self, pos: tuple[int, int], obj: TiledObject, gmap: Map):
+    def _setup_npc(self, pos: tuple[int, int], obj: CompiledObject, gmap: Map):
         """
         Creates a new NPC sprite at the given position
 
@@ -651,7 +798,7 @@ class GameMap:
 
         npc = NPC(
             pos=pos,
-            assets=copy.deepcopy(ENTITY_ASSETS.RABBIT),
+            assets=ENTITY_ASSETS.RABBIT,
             groups=(self.all_sprites, self.collision_sprites),
             collision_sprites=self.collision_sprites,
             study_group=study_group,
@@ -680,7 +827,7 @@ class GameMap:
             npc.conditional_behaviour_tree = NPCBehaviourTree.Woodcutting
         return npc
 
-    def _setup_animal(self, pos: tuple[int, int], obj: TiledObject):
+    def _setup_animal(self, pos: tuple[int, int], obj: CompiledObject):
         """
         Creates a new Animal sprite at the given position.
         The animal type is determined by the object name, objects named
@@ -716,29 +863,17 @@ class GameMap:
 
     # endregion
 
-    def _setup_layers(
-        self,
-        save_file: SaveFile,
-        gmap: Map,
-        scene_ani: SceneAnimation,
-        zoom_man: ZoomManager,
-    ):
+    def _setup_layers(self, save_file: SaveFile, gmap: Map) -> Iterator[None]:
         """
         Iterates over all map layers, updates the GameMap state and creates
-        all Sprites for the map.
+        all Sprites for the map. Yields before each layer as well as while
+        setting up the tiles and objects of a layer. Static tiles are only
+        collected, and have to be baked into chunks afterwards.
         """
-
-        # We clear the target data first so that the cutscene from the previous
-        # room doesn't play again if the current one
-        # doesn't have any camera targets
-        scene_ani.reset()
-        scene_ani.clear()
-
-        # Clearing the zoom manager in advance, in case no zoom areas exist for the current map
-        zoom_man.clear()
-
         for tilemap_layer in self._tilemap.layers:
-            if isinstance(tilemap_layer, TiledTileLayer):
+            yield
+
+            if isinstance(tilemap_layer, CompiledTileLayer):
                 # create soil layer
                 if tilemap_layer.name == "farmable_ingroup":
                     self.soil_manager.load_area(
@@ -751,16 +886,13 @@ class GameMap:
                     )
                     continue
                 elif tilemap_layer.name == "Border":
-                    _setup_tile_layer(
+                    yield from _setup_tile_layer(
                         tilemap_layer,
                         lambda pos, image: self._setup_collideable_tile(
                             pos,
                             image,
                             Layer.BORDER,
-                            (
-                                self.all_sprites,
-                                self.collision_sprites,
-                            ),
+                            self.collision_sprites,
                         ),
                     )
                     continue
@@ -776,13 +908,24 @@ class GameMap:
 
                 if layer == Layer.WATER:
                     # tiles on the WATER layer will always be created as water
-                    _setup_tile_layer(
+                    yield from _setup_tile_layer(
                         tilemap_layer,
                         lambda pos, _: self._setup_water_tile(pos, self.all_sprites),
                     )
+                elif layer != Layer.MAIN:
+                    # decorative and ground tiles will be baked into chunks
+                    yield from _setup_tile_layer(
+                        tilemap_layer,
+                        lambda pos, image: self._setup_static_tile(
+                            pos,
+                            image,
+                            layer,  # noqa: B023 # TODO: Fix B023 to avoid potential UnboundLocalError
+                        ),
+                    )
                 else:
-                    # decorative and ground tiles will be created as base tile
-                    _setup_tile_layer(
+                    # tiles on the MAIN layer are y-sorted together with all
+                    # other Sprites, so they have to be created as base tile
+                    yield from _setup_tile_layer(
                         tilemap_layer,
                         lambda pos, image: self._setup_base_tile(
                             pos,
@@ -792,12 +935,12 @@ class GameMap:
                         ),
                     )
 
-            elif isinstance(tilemap_layer, TiledObjectGroup):
+            elif isinstance(tilemap_layer, CompiledObjectGroup):
                 match tilemap_layer.name:
                     case SpecialObjectLayer.MINIGAME:
                         self.minigame_layer = tilemap_layer
                     case SpecialObjectLayer.INTERACTIONS:
-                        _setup_object_layer(
+                        yield from _setup_object_layer(
                             tilemap_layer,
                             lambda pos, obj: self._setup_base_object(
                                 pos,
@@ -808,14 +951,14 @@ class GameMap:
                             ),
                         )
                     case SpecialObjectLayer.COLLISIONS:
-                        _setup_object_layer(
+                        yield from _setup_object_layer(
                             tilemap_layer,
                             lambda pos, obj: self._setup_collision_rect(
                                 pos, obj, Layer.MAIN, self.collision_sprites
                             ),
                         )
                     case SpecialObjectLayer.PLAYER:
-                        _setup_object_layer(
+                        yield from _setup_object_layer(
                             tilemap_layer,
                             lambda pos, obj: self._setup_player_warp(pos, obj),
                         )
@@ -828,20 +971,20 @@ class GameMap:
                     case SpecialObjectLayer.NPCS:
                         if not ENABLE_NPCS:
                             continue
-                        self.npcs = _setup_object_layer(
+                        self.npcs = yield from _setup_object_layer(
                             tilemap_layer,
                             lambda pos, obj: self._setup_npc(pos, obj, gmap),
                         )
                     case SpecialObjectLayer.ANIMALS:
                         if not TEST_ANIMALS:
                             continue
-                        self.animals = _setup_object_layer(
+                        self.animals = yield from _setup_object_layer(
                             tilemap_layer, lambda pos, obj: self._setup_animal(pos, obj)
                         )
                     case SpecialObjectLayer.CAMERA_TARGETS:
-                        scene_ani.set_target_points(_setup_camera_layer(tilemap_layer))
+                        self._camera_target_layers.append(tilemap_layer)
                     case SpecialObjectLayer.ZOOM_AREAS:
-                        zoom_man.set_zoom_areas(_setup_zoom_layer(tilemap_layer))
+                        self._zoom_area_layers.append(tilemap_layer)
                     case _:
                         # set layer if defined in the TileLayer properties
                         layer = _get_element_property(
@@ -849,7 +992,7 @@ class GameMap:
                         )
 
                         # decorative objects will be created as collideable object
-                        _setup_object_layer(
+                        yield from _setup_object_layer(
                             tilemap_layer,
                             lambda pos, obj, obj_layer=layer: self._setup_map_object(
                                 pos,
@@ -861,7 +1004,7 @@ class GameMap:
             else:
                 # This should be the case when an Image or Group layer is found
                 warnings.warn(
-                    f"Support for {tilemap_layer.__class__.__name__} layers is not (yet) "
+                    f"Support for {tilemap_layer.kind} layers is not (yet) "
                     f"implemented! Layer {tilemap_layer.name} will be skipped",
                     GameMapWarning,
                 )
@@ -7,6 +7,7 @@ from itertools import chain
 from operator import itemgetter
 from typing import Callable, Any
 from src.controls import Controls
+from src.support import render_text
 
 
 class _IMButton(ImageButton):
@@ -139,7 +140,7 @@ class InventoryMenu(AbstractMenu):
             img = self.overlay_frames[btn_name]
         calc_rect = img.get_frect(center=(32, 32))
         calc_img = pygame.Surface((64, 64), pygame.SRCALPHA)
-        amount = self.font.render(str(count), False, "black")
+        amount = render_text(self.font, str(count), False, "black")
         blit_list = ((img, calc_rect), (amount, amount.get_frect(bottomright=(64, 64))))
         calc_img.fblits(blit_list)  # faster than doing two separate blits
         return calc_img, btn_name
@@ -210,7 +211,7 @@ class InventoryMenu(AbstractMenu):
         # whatsoever, show only one button with "No Equipment" on it
         # and stop yielding buttons
         if not buttons_to_display:
-            text_rect = self.font.render("No equipment", False, "black").get_rect(
+            text_rect = render_text(self.font, "No equipment", False, "black").get_rect(
                 centerx=self.rect.width * 3 / 4, centery=self.rect.centery
             )
             yield Button("No equipment", text_rect, self.font)
@@ -261,7 +262,7 @@ class InventoryMenu(AbstractMenu):
         super().draw_title()
         top = SCREEN_HEIGHT / 20 + 75
         for i, section_name in enumerate(_SECTION_TITLES):
-            text_surf = self.font.render(section_name, False, "black")
+            text_surf = render_text(self.font, section_name, False, "black")
             text_rect = text_surf.get_frect(
                 top=top, centerx=(self.rect.width * (i + 1)) / 4
             )
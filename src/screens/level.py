@@ -1,8 +1,7 @@
-import copy
 import random
 import time
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from functools import partial
 
 import pygame
@@ -17,8 +16,10 @@ from src.exceptions import GameMapWarning
 from src.groups import AllSprites, PersistentSpriteGroup
 from src.gui.interface.emotes import NPCEmoteManager, PlayerEmoteManager
 from src.gui.scene_animation import SceneAnimation
+from src.map_registry import TmxMapRegistry
 from src.npc.setup import AIData
 from src.overlay.game_time import GameTime
+from src.overlay.lighting import Lighting
 from src.overlay.overlay import Overlay
 from src.overlay.sky import Rain, Sky
 from src.overlay.soil import SoilManager
@@ -27,6 +28,7 @@ from src.savefile import SaveFile
 from src.screens.game_map import GameMap
 from src.screens.minigames.base import Minigame
 from src.screens.minigames.cow_herding import CowHerding, CowHerdingState
+from src.screens.world_cache import MapWorld, WorldCache, estimate_world_size
 from src.settings import (
     DEFAULT_ANIMATION_NAME,
     GAME_MAP,
@@ -34,7 +36,7 @@ from src.settings import (
     SCALED_TILE_SIZE,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
-    MapDict,
+    WORLD_CACHE_BUDGET,
     SoundDict,
 )
 from src.sprites.base import Sprite
@@ -43,7 +45,13 @@ from src.sprites.entities.character import Character
 from src.sprites.entities.player import Player
 from src.sprites.particle import ParticleSprite
 from src.sprites.setup import ENTITY_ASSETS
-from src.support import load_data, map_coords_to_tile, resource_path, save_data
+from src.support import (
+    import_font,
+    load_data,
+    map_coords_to_tile,
+    render_text,
+    save_data,
+)
 
 _TO_PLAYER_SPEED_INCREASE_THRESHOLD = 200
 
@@ -56,9 +64,10 @@ class Level:
     font: pygame.Font
     frames: dict
     sounds: SoundDict
-    tmx_maps: MapDict
+    tmx_maps: TmxMapRegistry
     current_map: Map | None
     game_map: GameMap | None
+    world_cache: WorldCache
     save_file: SaveFile
 
     current_minigame: Minigame | None
@@ -101,7 +110,7 @@ class Level:
     def __init__(
         self,
         switch: Callable[[GameState], None],
-        tmx_maps: MapDict,
+        tmx_maps: TmxMapRegistry,
         frames: dict[str, dict],
         sounds: SoundDict,
         save_file: SaveFile,
@@ -122,12 +131,13 @@ class Level:
         self.zoom_manager = ZoomManager()
 
         # assets
-        self.font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), 30)
+        self.font = import_font(30, "font/LycheeSoda.ttf")
         self.frames = frames
         self.sounds = sounds
         self.tmx_maps = tmx_maps
         self.current_map = None
         self.game_map = None
+        self.world_cache = WorldCache(WORLD_CACHE_BUDGET)
 
         self.all_sprites = AllSprites()
         self.collision_sprites = PersistentSpriteGroup()
@@ -148,7 +158,7 @@ class Level:
 
         self.player = Player(
             pos=(0, 0),
-            assets=copy.deepcopy(ENTITY_ASSETS.RABBIT),
+            assets=ENTITY_ASSETS.RABBIT,
             groups=(),
             collision_sprites=self.collision_sprites,
             apply_tool=self.apply_tool,
@@ -207,45 +217,121 @@ class Level:
             self.finish_transition,
             dur=2400,
         )
+        self.lighting = Lighting(self.sky, self.day_transition, self.map_transition)
 
         # level
         self.current_level = 3
 
+    def _get_map_sprite_groups(self) -> tuple[pygame.sprite.Group, ...]:
+        """
+        :return: All sprite groups whose Sprites belong to the current map
+        """
+        return (
+            self.all_sprites,
+            self.collision_sprites,
+            self.interaction_sprites,
+            self.tree_sprites,
+            self.bush_sprites,
+            self.drop_sprites,
+            self.player_exit_warps,
+        )
+
+    def _detach_world(self) -> MapWorld | None:
+        """
+        Remove all Sprites of the current map from the sprite groups.
+        Persistent Sprites (e.g. the Player) stay in their groups.
+        :return: Everything that has been built for the current map, or None if
+                 no map has been loaded yet
+        """
+        # the Player's emotes should not reappear when returning to the map
+        self.player_emote_manager.clear()
+
+        sprites = []
+        for group in self._get_map_sprite_groups():
+            sprites.append(group.sprites())
+            group.empty()
+
+        if self.game_map is None:
+            return None
+        return MapWorld(self.game_map, sprites, estimate_world_size(sprites[0]))
+
+    def _attach_world(self, world: MapWorld):
+        """
+        Add all Sprites of a previously detached map back to the sprite groups,
+        and make its GameMap the current one.
+        """
+        for group, sprites in zip(
+            self._get_map_sprite_groups(), world.sprites, strict=True
+        ):
+            # Sprites are added in their original order, so that Sprites at
+            # the same position are still drawn in the same order
+            group.add(*sprites)
+
+        self.game_map = world.game_map
+        self.game_map.activate(self.cutscene_animation, self.zoom_manager)
+
     def load_map(self, game_map: Map, from_map: str = None):
+        """
+        Load the given map within a single call.
+        :param game_map: map to load
+        :param from_map: map the player came from, decides where they enter
+                         the new map
+        """
+        for _ in self._load_map_steps(game_map, from_map):
+            pass
+
+    def _load_map_steps(self, game_map: Map, from_map: str = None) -> Iterator[None]:
+        """
+        Load the given map step by step, so that building its world can be
+        spread across multiple frames.
+        :return: Iterator that has to be exhausted to load the map
+        """
         # prepare level state for new map
-        # clear all sprite groups
-        self.all_sprites.empty()
-        self.collision_sprites.empty()
-        self.interaction_sprites.empty()
-        self.tree_sprites.empty()
-        self.bush_sprites.empty()
-        self.player_exit_warps.empty()
+        # detach the current map from all sprite groups, and keep it so that it
+        # does not have to be built again when the player returns to it.
+        # The minigame map is always set up from scratch
+        world = self._detach_world()
+        if world is not None and self.current_map != Map.MINIGAME:
+            self.world_cache.put(self.current_map, world)
 
         # clear existing soil_layer (not done due to the fact we need to keep hoed tiles in memory)
         # self.soil_layer.reset()
         self.quaker.reset()
 
-        self.game_map = GameMap(
-            selected_map=game_map,
-            tilemap=self.tmx_maps[game_map],
-            scene_ani=self.cutscene_animation,
-            zoom_man=self.zoom_manager,
-            all_sprites=self.all_sprites,
-            collision_sprites=self.collision_sprites,
-            interaction_sprites=self.interaction_sprites,
-            tree_sprites=self.tree_sprites,
-            bush_sprites=self.bush_sprites,
-            player_exit_warps=self.player_exit_warps,
-            player=self.player,
-            player_emote_manager=self.player_emote_manager,
-            npc_emote_manager=self.npc_emote_manager,
-            drops_manager=self.drops_manager,
-            soil_manager=self.soil_manager,
-            apply_tool=self.apply_tool,
-            plant_collision=self.plant_collision,
-            frames=self.frames,
-            save_file=self.save_file,
-        )
+        yield
+
+        world = self.world_cache.pop(game_map)
+        if world is not None:
+            self._attach_world(world)
+        else:
+            # maps that have not been prefetched are loaded in the background
+            # as well, instead of within a single step
+            self.tmx_maps.prefetch([game_map])
+            while self.tmx_maps.is_loading(game_map):
+                # leave the loading thread some time to finish the map
+                time.sleep(0.001)
+                yield
+
+            self.game_map = GameMap(
+                selected_map=game_map,
+                tilemap=self.tmx_maps[game_map],
+                all_sprites=self.all_sprites,
+                collision_sprites=self.collision_sprites,
+                interaction_sprites=self.interaction_sprites,
+                tree_sprites=self.tree_sprites,
+                bush_sprites=self.bush_sprites,
+                player_exit_warps=self.player_exit_warps,
+                player=self.player,
+                player_emote_manager=self.player_emote_manager,
+                npc_emote_manager=self.npc_emote_manager,
+                drops_manager=self.drops_manager,
+                soil_manager=self.soil_manager,
+                apply_tool=self.apply_tool,
+                plant_collision=self.plant_collision,
+                frames=self.frames,
+            )
+            yield from self.game_map.build(self.save_file)
+            self.game_map.activate(self.cutscene_animation, self.zoom_manager)
 
         self.camera.change_size(*self.game_map.size)
 
@@ -295,6 +381,13 @@ class Level:
         self.rain.set_floor_size(self.game_map.get_size())
 
         self.current_map = game_map
+        # load the maps the player can walk to next while they are on this map,
+        # unless their world is still cached
+        self.tmx_maps.prefetch(
+            warp.name
+            for warp in self.player_exit_warps
+            if warp.name not in self.world_cache
+        )
 
         # show intro scripted sequence only once
         if not self.intro_shown.get(game_map, False):
@@ -346,26 +439,31 @@ class Level:
                     x, y = map_coords_to_tile(plant.rect.center)
                     area.harvest((x, y), character.add_resource, self.create_particle)
 
-    def switch_to_map(self, map_name: Map):
-        if self.tmx_maps.get(map_name):
-            self.load_map(map_name, from_map=self.current_map)
+    def switch_to_map(self, map_name: Map) -> Iterator[None]:
+        """
+        Load the map the player walked to step by step, see _load_map_steps.
+        Falls back to the current map if the given map does not exist.
+        """
+        if map_name in self.tmx_maps:
+            yield from self._load_map_steps(map_name, from_map=self.current_map)
         else:
             if map_name == "bathhouse" and self.player.hp < 80:
                 self.overlay.health_bar.apply_health(9999999)
                 self.player.bathstat = True
                 self.player.bath_time = time.time()
+                # the Player's emotes are cleared when the map is reloaded
+                yield from self._load_map_steps(self.current_map, from_map=map_name)
                 self.player.emote_manager.show_emote(self.player, "sad_ani")
-                self.load_map(self.current_map, from_map=map_name)
             elif map_name == "bathhouse":
                 # this is to prevent warning in the console
-                self.load_map(self.current_map, from_map=map_name)
+                yield from self._load_map_steps(self.current_map, from_map=map_name)
                 self.player.emote_manager.show_emote(self.player, "sad_ani")
             else:
                 warnings.warn(f'Error loading map: Map "{map_name}" not found')
 
                 # fallback which reloads the current map and sets the player to the
                 # entry warp of the map that should have been switched to
-                self.load_map(self.current_map, from_map=map_name)
+                yield from self._load_map_steps(self.current_map, from_map=map_name)
 
     def create_particle(self, sprite: pygame.sprite.Sprite):
         ParticleSprite(sprite.rect.topleft, sprite.image, self.all_sprites)
@@ -621,6 +719,10 @@ class Level:
     def reset(self):
         self.current_day += 1
 
+        # maps the player has left are set up from scratch on the new day, so
+        # that their trees and bushes grow new fruit as well
+        self.world_cache.clear()
+
         # plants + soil
         if self.current_map == Map.NEW_FARM:
             self.soil_manager.update()
@@ -696,6 +798,14 @@ class Level:
                     self.display_surface, "blue", drop.hitbox_rect.move(*offset), 2
                 )
 
+            culling_surf = render_text(
+                self.font,
+                f"Culled: {self.all_sprites.culled_sprites}/{len(self.all_sprites)}",
+                False,
+                "Black",
+            )
+            self.display_surface.blit(culling_surf, (10, SCREEN_HEIGHT - 40))
+
     def setup_pf_overlay(self):
         self.pf_overlay_non_walkable = pygame.Surface(
             (SCALED_TILE_SIZE, SCALED_TILE_SIZE), pygame.SRCALPHA
@@ -754,27 +864,38 @@ class Level:
     # endregion
 
     def draw_overlay(self):
-        self.sky.display(self.current_level)
         self.overlay.display()
 
     def draw(self, dt: float, move_things: bool):
         self.player.hp = self.overlay.health_bar.hp
-        self.display_surface.fill((130, 168, 132))
-        self.all_sprites.draw(self.camera)
-        self.zoom_manager.apply_zoom()
-        if move_things:
-            self.sky.display(self.current_level)
-
-        self.draw_pf_overlay()
-        self.draw_hitboxes()
+        self.camera.set_zoom(self.zoom_manager.zoom_factor)
+        world_surface = self.camera.get_render_surface(self.display_surface)
+        world_surface.fill((130, 168, 132))
+        # the world of a map that is still being built is hidden by the map
+        # transition anyway
+        if not self.map_transition.resetting:
+            self.all_sprites.draw(self.camera, world_surface)
+        self.camera.present(self.display_surface)
+        # while things are moving, the world is tinted by the sky twice. The
+        # debug overlays are only tinted by the second pass, so both passes can
+        # only be applied at once while the debug overlays are hidden
+        if self.show_pf_overlay or self.show_hitbox_active:
+            if move_things:
+                self.lighting.display_sky(self.current_level)
+            self.draw_pf_overlay()
+            self.draw_hitboxes()
+            self.lighting.display_sky(self.current_level)
+        else:
+            self.lighting.display_sky(
+                self.current_level, passes=2 if move_things else 1
+            )
         self.draw_overlay()
 
         if self.current_minigame and self.current_minigame.running:
             self.current_minigame.draw()
 
         # transitions
-        self.day_transition.draw()
-        self.map_transition.draw()
+        self.lighting.display_transitions()
 
     # update
     def update_rain(self):
@@ -797,11 +918,14 @@ class Level:
         self.update_rain()
         self.day_transition.update()
         self.map_transition.update()
-        if move_things:
+        # Sprites of a map that is still being built are not updated, as the
+        # map has not been activated yet
+        if move_things and not self.map_transition.resetting:
             if self.cutscene_animation.active:
                 self.all_sprites.update_blocked(dt)
             else:
                 self.all_sprites.update(dt)
+            self.game_map.water_animation.update(dt)
             self.drops_manager.update()
             self.update_cutscene(dt)
             self.quaker.update_quake(dt)
@@ -7,7 +7,7 @@ from src.gui.menu.components import Button
 from src.gui.menu.general_menu import GeneralMenu
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
 from src.sprites.entities.player import Player
-from src.support import resource_path
+from src.support import import_font, render_text
 
 
 class RoundMenu(GeneralMenu):
@@ -19,8 +19,8 @@ class RoundMenu(GeneralMenu):
         rect: pygame.Rect = None
 
         def __init__(self, text, rect):
-            font = pygame.font.Font(resource_path("font/LycheeSoda.ttf"), size=30)
-            self.img = font.render(text, False, "Black")
+            font = import_font(30, "font/LycheeSoda.ttf")
+            self.img = render_text(font, text, False, "Black")
             self.rect = rect
             self.imgRect = self.img.get_rect(midleft=rect.topleft)
             self.imgRect.y += 10
@@ -111,7 +111,7 @@ class RoundMenu(GeneralMenu):
         return False
 
     def draw_title(self):
-        text_surf = self.font.render(self.title, False, "Black")
+        text_surf = render_text(self.font, self.title, False, "Black")
         midtop = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 20)
         text_rect = text_surf.get_frect(midtop=midtop)
 
@@ -14,7 +14,7 @@ from src.screens.minigames.gui import (
     _ReturnButton,
 )
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
-from src.support import get_outline, import_font, import_freetype_font
+from src.support import get_outline, import_font, import_freetype_font, render_text
 
 
 class _CowHerdingScoreboard(AbstractMenu):
@@ -154,7 +154,7 @@ class _CowHerdingOverlay:
 
         # maps all chars in "01234567890.:" to pygame surfaces rendered with font_timer
         self.timer_chars = {
-            char: self.font_timer.render(char, True, SL_ORANGE_BRIGHTEST)
+            char: render_text(self.font_timer, char, True, SL_ORANGE_BRIGHTEST)
             for char in "0123456789.:"
         }
         # ensures that the timer numbers maintain their position by using equal spacing
@@ -162,7 +162,9 @@ class _CowHerdingOverlay:
         self.timer_char_height = max(char.height for char in self.timer_chars.values())
 
     def _render_countdown_text(self, text: str):
-        rendered_text = self.font_countdown.render(text, False, SL_ORANGE_BRIGHTEST)
+        rendered_text = render_text(
+            self.font_countdown, text, False, SL_ORANGE_BRIGHTEST
+        )
         rendered_text = get_outline(rendered_text, SL_ORANGE_BRIGHT, resize=True)
         return rendered_text
 
@@ -11,7 +11,7 @@ from src.colors import (
     SL_ORANGE_MEDIUM,
 )
 from src.gui.menu.components import AbstractButton
-from src.support import import_font
+from src.support import import_font, render_text
 
 
 def _draw_box(
@@ -158,7 +158,9 @@ class _ReturnButton(AbstractButton):
         super().__init__(name, pygame.Rect())
         self.font_button = import_font(28, "font/LycheeSoda.ttf")
         self.color = SL_ORANGE_MEDIUM
-        self.content = self.font_button.render(self._content, True, SL_ORANGE_BRIGHTEST)
+        self.content = render_text(
+            self.font_button, self._content, True, SL_ORANGE_BRIGHTEST
+        )
         self._content_rect = self.content.get_frect()
         self.rect = self._content_rect.copy()
 
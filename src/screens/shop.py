@@ -8,6 +8,7 @@ from src.settings import (
     SCREEN_WIDTH,
 )
 from src.sprites.entities.player import Player
+from src.support import render_text
 
 # TODO: Refactor this class
 
@@ -18,8 +19,8 @@ class ShopMenu:
     ):
         # general setup
 
-        self.buy_text = font.render("buy", False, "Black")
-        self.sell_text = font.render("sell", False, "Black")
+        self.buy_text = render_text(font, "buy", False, "Black")
+        self.sell_text = render_text(font, "sell", False, "Black")
         self.main_rect = None
         self.menu_top = None
         self.player = player
@@ -40,7 +41,7 @@ class ShopMenu:
         self.setup()
 
     def display_money(self):
-        text_surf = self.font.render(f"${self.player.money}", False, "Black")
+        text_surf = render_text(self.font, f"${self.player.money}", False, "Black")
         text_rect = text_surf.get_frect(
             midbottom=(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 20)
         )
@@ -52,7 +53,7 @@ class ShopMenu:
         # create the text surfaces
         for item in self.options:
             text = item.as_serialised_string()
-            text_surf = self.font.render(text, False, "Black")
+            text_surf = render_text(self.font, text, False, "Black")
             self.text_surfs.append(text_surf)
             self.total_height += text_surf.get_height() + (self.padding * 2)
 
@@ -121,7 +122,7 @@ class ShopMenu:
         self.display_surface.blit(text_surf, text_rect)
 
         # amount
-        amount_surf = self.font.render(str(amount), False, "Black")
+        amount_surf = render_text(self.font, str(amount), False, "Black")
         amount_rect = amount_surf.get_frect(
             midright=(self.main_rect.right - 20, bg_rect.centery)
         )
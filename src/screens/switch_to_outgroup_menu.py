@@ -5,6 +5,7 @@ import pygame
 from src.enums import GameState, StudyGroup
 from src.gui.menu.general_menu import GeneralMenu
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.support import render_text
 
 # This menu is for when the player decides whether they will join the outgroup.
 
@@ -37,7 +38,7 @@ class OutgroupMenu(GeneralMenu):
         return False
 
     def draw_title(self):
-        text_surf = self.font.render(self.title, False, "Black")
+        text_surf = render_text(self.font, self.title, False, "Black")
         midtop = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 20)
         text_rect = text_surf.get_frect(midtop=midtop)
 
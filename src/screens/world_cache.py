@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import pygame
+
+from src.enums import Map
+from src.screens.game_map import GameMap
+
+
+def estimate_world_size(sprites: Iterable[pygame.sprite.Sprite]) -> int:
+    """
+    :return: Estimated memory (in bytes) taken up by the images of the given
+             Sprites. Images shared by multiple Sprites are only counted once
+    """
+    images = {}
+    for sprite in sprites:
+        image = getattr(sprite, "image", None)
+        if image is not None:
+            images[id(image)] = image
+    return sum(
+        image.get_width() * image.get_height() * image.get_bytesize()
+        for image in images.values()
+    )
+
+
+@dataclass
+class MapWorld:
+    """
+    Everything that has been built for a map, kept while the player is on
+    another map.
+
+    Attributes:
+        game_map: GameMap that was built for the map
+        sprites: Sprites of each of the Level's sprite groups, in the order
+                 they were added to them
+        size: estimated memory (in bytes) taken up by the world
+    """
+
+    game_map: GameMap
+    sprites: list[list[pygame.sprite.Sprite]]
+    size: int
+
+
+class WorldCache:
+    """
+    Least recently used cache of the worlds of maps the player has left, so
+    that they do not have to be built again when the player returns.
+    Worlds are evicted once the total estimated size of all cached worlds
+    exceeds the memory budget.
+
+    Attributes:
+        budget: maximum total estimated size (in bytes) of all cached worlds.
+                With a budget of 0, no worlds are cached
+    """
+
+    budget: int
+
+    _worlds: OrderedDict[Map, MapWorld]
+
+    def __init__(self, budget: int):
+        self.budget = budget
+
+        self._worlds = OrderedDict()
+
+    def __contains__(self, game_map: object) -> bool:
+        return game_map in self._worlds
+
+    def __len__(self) -> int:
+        return len(self._worlds)
+
+    def get_size(self) -> int:
+        """
+        :return: Total estimated size (in bytes) of all cached worlds
+        """
+        return sum(world.size for world in self._worlds.values())
+
+    def put(self, game_map: Map, world: MapWorld):
+        """
+        Cache the world of the given map, evicting the least recently cached
+        worlds until all of them fit into the budget. Worlds that are larger
+        than the whole budget are not cached at all.
+        """
+        self._worlds.pop(game_map, None)
+        if world.size > self.budget:
+            return
+
+        self._worlds[game_map] = world
+        while self.get_size() > self.budget:
+            self._worlds.popitem(last=False)
+
+    def pop(self, game_map: Map) -> MapWorld | None:
+        """
+        Remove the world of the given map from the cache.
+        :return: The cached world, or None if the map's world is not cached
+        """
+        return self._worlds.pop(game_map, None)
+
+    def clear(self):
+        self._worlds.clear()
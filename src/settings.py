@@ -1,13 +1,11 @@
 import pygame  # noqa
 import pygame.freetype
-import pytmx
 
-from src.enums import Map
+from src.enums import BlurQuality, Map
 from src.import_checks import *  # noqa: F403
 
 type Coordinate = tuple[int | float, int | float]
 type SoundDict = dict[str, pygame.mixer.Sound]
-type MapDict = dict[str, pytmx.TiledMap]
 type AniFrames = dict[str, list[pygame.Surface]]
 type GogglesStatus = bool | None
 type NecklaceStatus = bool | None
@@ -21,6 +19,10 @@ CHAR_TILE_SIZE = 48
 SCALE_FACTOR = 4
 SCALED_TILE_SIZE = TILE_SIZE * SCALE_FACTOR
 
+# width and height (in tiles) of the pre-rendered chunks static tile layers are
+# baked into when a map is loaded
+STATIC_CHUNK_SIZE = 16
+
 RANDOM_SEED = 123456789
 
 GAME_MAP = Map.NEW_FARM
@@ -30,6 +32,49 @@ TEST_ANIMALS = True
 
 SETUP_PATHFINDING = any((ENABLE_NPCS, TEST_ANIMALS))
 
+# how much the last frame before pausing the game should be darkened while it is
+# shown behind the menus (0 - 255, 0 disables dimming)
+PAUSED_BACKGROUND_DIM = 0
+
+# quality of the blur effect shown to players wearing goggles. Lower qualities
+# blur a downscaled version of the screen, which is considerably faster. HIGH
+# blurs the full screen as the effect originally did, at the cost of a
+# noticeably lower frame rate while wearing goggles
+GOGGLES_BLUR_QUALITY = BlurQuality.MEDIUM
+
+# maximum number of rendered texts kept in the shared text cache
+TEXT_CACHE_SIZE = 512
+
+# maximum number of Character frames with their cosmetics drawn onto them that
+# are kept in memory
+COSMETIC_CACHE_SIZE = 256
+
+# directory scaled and sliced images are cached in between launches
+ASSET_CACHE_DIR = "data/cache"
+
+# maximum number of threads asset files are decoded in on startup
+ASSET_LOADER_THREADS = 4
+
+# maximum width and height of the pages of texture atlases
+ATLAS_PAGE_SIZE = 1024
+
+# maximum number of loaded maps kept in memory. Maps that have not been
+# visited recently are evicted, and loaded again once they are needed
+TMX_MAP_CACHE_SIZE = 4
+
+# directory maps are stored in once they have been compiled from their TMX files
+COMPILED_MAP_DIR = "data/cache/maps"
+
+# maximum estimated memory (in bytes) of the worlds of maps the player has
+# left, which are kept so that they do not have to be built again on return.
+# The least recently left worlds are evicted first
+WORLD_CACHE_BUDGET = 256 * 1024 * 1024
+
+# maximum time (in milliseconds) a Transition spends per frame on resetting,
+# e.g. on building the next map while the screen is faded out. Together with
+# the rest of the frame, this should stay well below 33 ms (30 FPS)
+TRANSITION_FRAME_BUDGET = 12
+
 EMOTE_SIZE = 48
 
 GROW_SPEED = {"corn": 1, "tomato": 0.7}
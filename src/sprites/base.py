@@ -4,8 +4,7 @@ from typing import Any
 import pygame
 
 from src.enums import Layer
-from src.map_objects import MapObjectType
-from src.settings import SCALE_FACTOR
+from src.map_objects import MapObjectType, get_scaled_tile_image
 
 
 class Sprite(pygame.sprite.Sprite):
@@ -49,7 +48,7 @@ class CollideableMapObject(CollideableSprite):
     ):
         self.object_type = object_type
 
-        surf = pygame.transform.scale_by(self.object_type.image, SCALE_FACTOR)
+        surf = get_scaled_tile_image(self.object_type.image)
 
         super().__init__(pos, surf, groups, z, name)
 
@@ -67,3 +66,38 @@ class AnimatedSprite(Sprite):
 
     def update(self, dt):
         self.animate(dt)
+
+
+class SharedAnimation:
+    """
+    Animation that is played in lockstep by multiple Sprites (e.g. water tiles).
+    The frame index is advanced only once per frame for all Sprites, and their
+    images are only swapped when the current animation frame changes, so the
+    Sprites themselves do not need to be updated.
+    """
+
+    frames: list[pygame.Surface]
+    frame_index: float
+    sprites: list[Sprite]
+
+    def __init__(self, frames: list[pygame.Surface]):
+        self.frames = frames
+        self.frame_index = 0
+        self.sprites = []
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.frames[int(self.frame_index) % len(self.frames)]
+
+    def add(self, sprite: Sprite):
+        sprite.image = self.image
+        self.sprites.append(sprite)
+
+    def update(self, dt: float):
+        image = self.image
+        self.frame_index += 2 * dt
+
+        if self.image is not image:
+            image = self.image
+            for sprite in self.sprites:
+                sprite.image = image
@@ -1,4 +1,5 @@
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Self
 
@@ -17,6 +18,84 @@ from src.enums import (
 from src.sprites.entities.entity import Entity
 from src.sprites.setup import EntityAsset
 
+# Alpha values are rounded to multiples of this before compositing, so that
+# slowly fading Characters do not need a new composite every frame
+_ALPHA_BUCKET_SIZE = 15
+
+type _CosmeticKey = tuple[
+    pygame.Surface, EntityState, Direction, int, bool, tuple[str, ...], int, int
+]
+
+
+def _get_alpha_bucket(alpha: int | None) -> int:
+    if alpha is None:
+        return 255
+    return round(alpha / _ALPHA_BUCKET_SIZE) * _ALPHA_BUCKET_SIZE
+
+
+def _premultiply(frame: pygame.Surface, alpha: int) -> pygame.Surface:
+    """
+    :return: A premultiplied copy of the frame, with its alpha channel scaled
+             by the given alpha value.
+    """
+    layer = frame.copy()
+    layer.set_alpha(None)
+    if alpha < 255:
+        layer.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return layer.premul_alpha()
+
+
+class CosmeticCompositor:
+    """
+    Least recently used cache of Character frames with all their cosmetics
+    (necklace, goggles, hat, outgroup skin and horn) already drawn onto them.
+
+    The layers are composited with premultiplied alpha, so a composite has to
+    be blitted with the BLEND_PREMULTIPLIED flag, which gives the same result
+    as blitting all layers one after another.
+    """
+
+    max_size: int
+
+    _composites: OrderedDict[_CosmeticKey, pygame.Surface]
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: maximum number of composites kept in the cache
+        """
+        self.max_size = max_size
+
+        self._composites = OrderedDict()
+
+    def get(
+        self,
+        key: _CosmeticKey,
+        layers: Callable[[], list[tuple[pygame.Surface, int]]],
+    ) -> pygame.Surface:
+        """
+        :param key: key that uniquely identifies the composite
+        :param layers: function returning all frames to composite, together
+                       with the alpha they should be drawn with
+        :return: the cached composite, if there is none it is created first
+        """
+        composite = self._composites.get(key)
+        if composite is not None:
+            self._composites.move_to_end(key)
+            return composite
+
+        frames = layers()
+        composite = pygame.Surface(frames[0][0].get_size(), pygame.SRCALPHA)
+        for frame, alpha in frames:
+            composite.blit(
+                _premultiply(frame, alpha),
+                (0, 0),
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+        self._composites[key] = composite
+        if len(self._composites) > self.max_size:
+            self._composites.popitem(last=False)
+        return composite
+
 
 class Character(Entity, ABC):
     current_tool: FarmingTool
@@ -28,6 +107,9 @@ class Character(Entity, ABC):
 
     current_seed: FarmingTool
 
+    # shared by all Characters, as they mostly use the same frames
+    _cosmetic_compositor = CosmeticCompositor(settings.COSMETIC_CACHE_SIZE)
+
     def __init__(
         self,
         pos: settings.Coordinate,
@@ -54,6 +136,13 @@ class Character(Entity, ABC):
         self.has_goggles = None
 
         self.facing_direction = Direction.DOWN
+
+        # Animation frames are shared between all Characters using the same
+        # assets and must not be modified, so transparency is applied when the
+        # Character is drawn instead:
+        # frame_alpha is the alpha of the Character itself,
+        # image_alpha the alpha of its cosmetics
+        self.frame_alpha = 255
         self.image_alpha = 255
 
         # tools
@@ -127,55 +216,82 @@ class Character(Entity, ABC):
             return True
         return False
 
-    def draw(self, display_surface: pygame.Surface, rect: pygame.Rect, camera):
-        # super().draw(display_surface, rect, camera)
-        blit_list = []
-
-        # Render the necklace if the character has it and is in the ingroup
+    def _get_cosmetics(self) -> tuple[str, ...]:
+        """
+        :return: The cosmetics that should be drawn on top of the Character, in
+                 the order they should be drawn in
+        """
+        cosmetics = []
         is_in_ingroup = self.study_group == StudyGroup.INGROUP
 
-        if is_in_ingroup:
-            super().draw(display_surface, rect, camera)
-            if self.has_necklace:
-                necklace_state = EntityState(f"necklace_{self.state.value}")
-                necklace_ani = self.assets[necklace_state][self.facing_direction]
-                necklace_frame = necklace_ani.get_frame(self.frame_index)
-                necklace_frame.set_alpha(self.image_alpha)
-                blit_list.append((necklace_frame, rect))
+        # Render the necklace if the character has it and is in the ingroup
+        if is_in_ingroup and self.has_necklace:
+            cosmetics.append("necklace")
 
         # Render the goggles
         if self.has_goggles:
-            goggles_state = EntityState(f"goggles_{self.state.value}")
-            goggles_ani = self.assets[goggles_state][self.facing_direction]
-            goggles_frame = goggles_ani.get_frame(self.frame_index)
-            goggles_frame.set_alpha(self.image_alpha)
-            blit_list.append((goggles_frame, rect))
+            cosmetics.append("goggles")
 
         # Render the hat/horn (depending on the group)
         if is_in_ingroup:
             if self.has_hat:
-                hat_state = EntityState(f"hat_{self.state.value}")
-                hat_ani = self.assets[hat_state][self.facing_direction]
-                hat_frame = hat_ani.get_frame(self.frame_index)
-                # hat_frame.set_alpha(self.image_alpha)  # hat is always visible, looks silly otherwise
-                blit_list.append((hat_frame, rect))
-
+                cosmetics.append("hat")
         elif self.study_group == StudyGroup.OUTGROUP:
             if self.has_outgroup_skin:
-                skin_state = EntityState(f"outgroup_{self.state.value}")
-                skin_ani = self.assets[skin_state][self.facing_direction]
-                skin_frame = skin_ani.get_frame(self.frame_index)
-                skin_frame.set_alpha(self.image_alpha)
-                blit_list.append((skin_frame, rect))
-
+                cosmetics.append("outgroup")
             if self.has_horn:
-                horn_state = EntityState(f"horn_{self.state.value}")
-                horn_ani = self.assets[horn_state][self.facing_direction]
-                horn_frame = horn_ani.get_frame(self.frame_index)
-                horn_frame.set_alpha(self.image_alpha)
-                blit_list.append((horn_frame, rect))
+                cosmetics.append("horn")
 
-        display_surface.fblits(blit_list)
+        return tuple(cosmetics)
+
+    def _get_cosmetic_layers(
+        self,
+        draw_base: bool,
+        cosmetics: tuple[str, ...],
+        base_alpha: int,
+        alpha: int,
+    ) -> list[tuple[pygame.Surface, int]]:
+        layers = []
+        if draw_base:
+            layers.append((self.image, base_alpha))
+
+        for cosmetic in cosmetics:
+            cosmetic_state = EntityState(f"{cosmetic}_{self.state.value}")
+            cosmetic_ani = self.assets[cosmetic_state][self.facing_direction]
+            cosmetic_frame = cosmetic_ani.get_frame(self.frame_index)
+            if cosmetic == "hat":
+                # hat is always visible, looks silly otherwise
+                layers.append((cosmetic_frame, 255))
+            else:
+                layers.append((cosmetic_frame, alpha))
+
+        return layers
+
+    def draw(self, display_surface: pygame.Surface, rect: pygame.Rect, camera):
+        # Only Characters in the ingroup are drawn below their cosmetics, all
+        # cosmetics are composited into a single Surface and cached
+        draw_base = self.study_group == StudyGroup.INGROUP
+        cosmetics = self._get_cosmetics()
+        if not draw_base and not cosmetics:
+            return
+
+        base_alpha = _get_alpha_bucket(self.frame_alpha)
+        alpha = _get_alpha_bucket(self.image_alpha)
+        key = (
+            self.image,
+            self.state,
+            self.facing_direction,
+            int(self.frame_index % len(self._current_ani)),
+            draw_base,
+            cosmetics,
+            base_alpha,
+            alpha,
+        )
+        composite = self._cosmetic_compositor.get(
+            key,
+            lambda: self._get_cosmetic_layers(draw_base, cosmetics, base_alpha, alpha),
+        )
+        display_surface.blit(composite, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
     def update(self, dt: float):
         super().update(dt)
@@ -4,6 +4,7 @@ import pygame
 
 from src import settings
 from src.enums import Direction, EntityState, Layer
+from src.groups import AllSprites
 from src.gui.interface import indicators
 from src.settings import SCALED_TILE_SIZE
 from src.sprites.base import CollideableSprite, Sprite
@@ -145,8 +146,14 @@ class Entity(CollideableSprite, ABC):
     def focus(self):
         self.focused = True
         self.focused_indicator = Sprite(
-            (0, 0), indicators.ENTITY_FOCUSED, (self.groups()[0],), Layer.EMOTES
+            (0, 0), indicators.ENTITY_FOCUSED, z=Layer.EMOTES
         )
+        group = self.groups()[0]
+        if isinstance(group, AllSprites):
+            # the indicator is moved along with the Entity
+            group.add_dynamic(self.focused_indicator)
+        else:
+            self.focused_indicator.add(group)
 
     def unfocus(self):
         self.focused = False
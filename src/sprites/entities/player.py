@@ -272,8 +272,7 @@ class Player(Character):
             self.speed = self.original_speed * (self.hp / 100)
 
     def set_transparency_asper_health(self):
-        alpha_value = int(255 * (self.hp / 100))
-        self.image.set_alpha(alpha_value)
+        self.frame_alpha = int(255 * (self.hp / 100))
 
     def check_bath_bool(self):
         if (round(time.time() - self.bath_time)) == BATH_STATUS_TIMEOUT:
@@ -1,17 +1,29 @@
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 import pygame
 
 from src.enums import Direction, EntityState
 from src.settings import CHAR_TILE_SIZE, SCALE_FACTOR
-from src.support import resource_path
+from src.support import (
+    asset_cache,
+    get_decoded_image,
+    resource_path,
+    start_decoding,
+)
 
 
-@dataclass
+@dataclass(frozen=True)
 class _AniFrames:
-    frames: list[pygame.Surface]
+    """
+    Animation frames of an Entity.
+    The frames are shared by all Entities using the same assets, so they must
+    not be modified; Entities apply e.g. transparency when they are drawn.
+    """
+
+    frames: tuple[pygame.Surface, ...]
     hitbox: pygame.Rect
 
     def get_frame(self, index: int) -> pygame.Surface:
@@ -24,7 +36,7 @@ class _AniFrames:
         return len(self.frames)
 
 
-type EntityAsset = dict[EntityState, dict[Direction, _AniFrames]]
+type EntityAsset = Mapping[EntityState, Mapping[Direction, _AniFrames]]
 
 
 class _Hitbox:
@@ -108,27 +120,37 @@ class _Hitbox:
                 )
 
 
+def _get_state_variant(size: int, directions: list[Direction]) -> str:
+    return f"size={size},rows={len(directions)},scale={SCALE_FACTOR}"
+
+
 def state_importer(
     path: str,
     size: int,
     state: EntityState,
     directions: list[Direction],
     hitbox: _Hitbox,
-) -> dict[Direction, _AniFrames]:
+) -> Mapping[Direction, _AniFrames]:
     directions_dict = {}
     full_path = os.path.join(path)
-    surf = pygame.image.load(full_path).convert_alpha()
 
-    for row, direction in enumerate(directions):
+    def build():
+        surf = get_decoded_image(full_path).convert_alpha()
         frames = []
+        for row in range(len(directions)):
+            for col in range(surf.get_width() // size):
+                subsurface = surf.subsurface(col * size, row * size, size, size)
+                frames.append(pygame.transform.scale_by(subsurface, SCALE_FACTOR))
+        return frames
 
-        for col in range(surf.get_width() // size):
-            subsurface = surf.subsurface(col * size, row * size, size, size)
-            subsurface = pygame.transform.scale_by(subsurface, SCALE_FACTOR)
-            frames.append(subsurface)
+    variant = _get_state_variant(size, directions)
+    all_frames = asset_cache.get(full_path, variant, build)
+    columns = len(all_frames) // len(directions)
 
+    for row, direction in enumerate(directions):
+        frames = all_frames[row * columns : (row + 1) * columns]
         current_hitbox = hitbox.get_hitbox(state, direction)
-        directions_dict[direction] = _AniFrames(frames, current_hitbox)
+        directions_dict[direction] = _AniFrames(tuple(frames), current_hitbox)
 
     if Direction.LEFT in directions and Direction.RIGHT not in directions:
         frames = []
@@ -137,7 +159,7 @@ def state_importer(
             frame = pygame.transform.flip(frame, True, False)
             frames.append(frame)
         hitbox = hitbox.get_hitbox(state, Direction.RIGHT)
-        directions_dict[Direction.RIGHT] = _AniFrames(frames, hitbox)
+        directions_dict[Direction.RIGHT] = _AniFrames(tuple(frames), hitbox)
     elif Direction.RIGHT in directions and Direction.LEFT not in directions:
         frames = []
         for i in range(len(directions_dict[Direction.RIGHT])):
@@ -145,26 +167,31 @@ def state_importer(
             frame = pygame.transform.flip(frame, True, False)
             frames.append(frame)
         hitbox = hitbox.get_hitbox(state, Direction.LEFT)
-        directions_dict[Direction.LEFT] = _AniFrames(frames, hitbox)
-    return directions_dict
+        directions_dict[Direction.LEFT] = _AniFrames(tuple(frames), hitbox)
+    return MappingProxyType(directions_dict)
 
 
 def entity_importer(
     path: str, size: int, directions: list[Direction], hitbox: _Hitbox
-) -> dict[EntityState, dict[Direction, _AniFrames]]:
+) -> EntityAsset:
     hitbox.scale_hitboxes(SCALE_FACTOR)
-    states = {}
+    full_paths = {}
     for folder_path, _sub_folders, file_names in os.walk(path):
         for file_name in file_names:
             current_state = EntityState(file_name.split(".")[0])
-            states[current_state] = state_importer(
-                path=os.path.join(folder_path, file_name),
-                size=size,
-                state=current_state,
-                directions=directions,
-                hitbox=hitbox,
-            )
-    return states
+            full_paths[current_state] = os.path.join(folder_path, file_name)
+
+    start_decoding(full_paths.values(), _get_state_variant(size, directions))
+    states = {}
+    for current_state, full_path in full_paths.items():
+        states[current_state] = state_importer(
+            path=full_path,
+            size=size,
+            state=current_state,
+            directions=directions,
+            hitbox=hitbox,
+        )
+    return MappingProxyType(states)
 
 
 ENTITY_ASSETS = SimpleNamespace()
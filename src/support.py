@@ -3,17 +3,37 @@ import math
 import os
 import random
 import sys
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass
 
 import pygame
 import pygame.freetype
 import pygame.gfxdraw
-import pytmx
 
 from src import settings
+from src.asset_cache import AssetCache
+from src.asset_loader import AssetLoader
+from src.atlas import TextureAtlas
 from src.enums import Direction
-from src.settings import SCALE_FACTOR, SCALED_TILE_SIZE, TILE_SIZE, Coordinate
+from src.map_registry import TmxMapRegistry
+from src.settings import (
+    ASSET_CACHE_DIR,
+    ASSET_LOADER_THREADS,
+    ATLAS_PAGE_SIZE,
+    COMPILED_MAP_DIR,
+    SCALE_FACTOR,
+    SCALED_TILE_SIZE,
+    TEXT_CACHE_SIZE,
+    TILE_SIZE,
+    TMX_MAP_CACHE_SIZE,
+    Coordinate,
+)
+
+# pygbag runtime environment (the browser), in which neither threads nor a
+# persistent file system are available
+_IS_WEB = sys.platform in ("emscripten", "wasm")
 
 
 def resource_path(relative_path: str):
@@ -21,7 +41,7 @@ def resource_path(relative_path: str):
     relative_path = relative_path.replace("/", os.sep)
 
     # Needed for pygbag runtime environment compatibility:
-    if sys.platform in ("emscripten", "wasm"):
+    if _IS_WEB:
         return relative_path
 
     try:
@@ -31,92 +51,339 @@ def resource_path(relative_path: str):
     return os.path.join(base_path, relative_path)
 
 
+# All fonts that have been loaded so far, keyed on (font_path, size).
+# Fonts are shared between everyone importing them, so they must not be modified
+_fonts: dict[tuple[str, int], pygame.font.Font] = {}
+_freetype_fonts: dict[tuple[str, int], pygame.freetype.Font] = {}
+
+
 # Might be changed later on if we use pygame.freetype instead
 def import_font(size: int, font_path: str) -> pygame.font.Font:
-    return pygame.font.Font(resource_path(font_path), size)
+    key = (font_path, size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.Font(resource_path(font_path), size)
+    return _fonts[key]
 
 
 def import_freetype_font(size: int, font_path: str) -> pygame.freetype.Font:
-    return pygame.freetype.Font(resource_path(font_path), size)
+    key = (font_path, size)
+    if key not in _freetype_fonts:
+        _freetype_fonts[key] = pygame.freetype.Font(resource_path(font_path), size)
+    return _freetype_fonts[key]
+
+
+type _ColorValue = pygame.Color | str | tuple[int, ...]
+
+
+class TextCache:
+    """
+    Least recently used cache of text rendered with pygame.font.Font.render.
+    The rendered Surfaces are shared between all callers, so they must not be
+    modified.
+
+    Attributes:
+        hits: number of renders that could be served from the cache
+        misses: number of renders that had to be rendered with the font
+    """
+
+    max_size: int
+    hits: int
+    misses: int
+
+    _surfaces: OrderedDict[tuple, pygame.Surface]
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: maximum number of rendered texts kept in the cache
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @staticmethod
+    def _get_color_key(color: _ColorValue | None):
+        # pygame.Color is not hashable
+        return tuple(color) if isinstance(color, pygame.Color) else color
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color: _ColorValue,
+        bgcolor: _ColorValue | None = None,
+    ) -> pygame.Surface:
+        key = (
+            font,
+            text,
+            antialias,
+            self._get_color_key(color),
+            self._get_color_key(bgcolor),
+        )
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color, bgcolor)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+text_cache = TextCache(TEXT_CACHE_SIZE)
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    antialias: bool,
+    color: _ColorValue,
+    bgcolor: _ColorValue | None = None,
+) -> pygame.Surface:
+    """
+    Render text through the shared text cache. The returned Surface must not be
+    modified, copy it first if needed.
+    """
+    return text_cache.render(font, text, antialias, color, bgcolor)
+
+
+# The file system of the pygbag runtime environment does not persist between
+# launches, so caching assets there would only slow down the first launch
+asset_cache = AssetCache(resource_path(ASSET_CACHE_DIR), enabled=not _IS_WEB)
+
+# Threads are not available in the pygbag runtime environment
+asset_loader = AssetLoader(
+    0 if _IS_WEB else min(ASSET_LOADER_THREADS, os.cpu_count() or 1)
+)
+
+# Images that are being decoded by the asset loader, keyed on their path
+_decoding_images: dict[str, Future[pygame.Surface]] = {}
+
+
+def start_decoding(full_paths: Iterable[str], variant: str):
+    """
+    Start decoding all images whose frames cannot be loaded from the asset
+    cache in the background, so that they can be decoded in parallel.
+    The decoded images can be retrieved with get_decoded_image.
+    :param variant: variant the frames are stored under in the asset cache
+    """
+    for full_path in full_paths:
+        if full_path not in _decoding_images and asset_cache.is_stale(
+            full_path, variant
+        ):
+            _decoding_images[full_path] = asset_loader.submit(
+                pygame.image.load, full_path
+            )
+
+
+def get_decoded_image(full_path: str) -> pygame.Surface:
+    """
+    :return: The image decoded in the background by start_decoding. Images that
+             have not been passed to start_decoding are decoded right away.
+             The image has not been converted to the display format yet
+    """
+    future = _decoding_images.pop(full_path, None)
+    return future.result() if future else pygame.image.load(full_path)
+
+
+def _get_scaled_image_variant(alpha: bool) -> str:
+    return f"scale={SCALE_FACTOR},alpha={alpha}"
+
+
+def _import_scaled_image(full_path: str, alpha: bool = True) -> pygame.Surface:
+    def build():
+        surf = get_decoded_image(full_path)
+        surf = surf.convert_alpha() if alpha else surf.convert()
+        return [pygame.transform.scale_by(surf, SCALE_FACTOR)]
+
+    variant = _get_scaled_image_variant(alpha)
+    return asset_cache.get(full_path, variant, build)[0]
 
 
 def import_image(img_path: str, alpha: bool = True) -> pygame.Surface:
+    return _import_scaled_image(resource_path(img_path), alpha)
+
+
+def import_resized_image(img_path: str, size: tuple[int, int]) -> pygame.Surface:
     full_path = resource_path(img_path)
-    surf = (
-        pygame.image.load(full_path).convert_alpha()
-        if alpha
-        else pygame.image.load(full_path).convert()
-    )
-    return pygame.transform.scale_by(surf, SCALE_FACTOR)
+
+    def build():
+        surf = pygame.image.load(full_path).convert_alpha()
+        return [pygame.transform.scale(surf, size)]
+
+    return asset_cache.get(full_path, f"size={size[0]}x{size[1]}", build)[0]
+
+
+# All texture atlases that imported assets have been packed into so far, keyed on
+# the path the assets were imported from
+_atlases: dict[str, TextureAtlas] = {}
 
 
-def import_folder(fold_path: str) -> list[pygame.Surface]:
-    frames = []
+def _pack(atlas_name: str, surfaces: dict[str, pygame.Surface]):
+    atlas = TextureAtlas(atlas_name, ATLAS_PAGE_SIZE)
+    _atlases[atlas_name] = atlas
+    return atlas.pack(surfaces)
+
+
+def get_atlas(atlas_name: str) -> TextureAtlas:
+    """
+    :param atlas_name: path the assets of the atlas were imported from
+    :return: The atlas the assets imported from this path have been packed into
+    """
+    return _atlases[atlas_name]
+
+
+def get_atlas_report() -> str:
+    """
+    :return: Occupancy report of all texture atlases imported assets have been
+             packed into
+    """
+    return "\n".join(atlas.get_report() for atlas in _atlases.values())
+
+
+def import_folder(fold_path: str, pack: bool = False) -> list[pygame.Surface]:
+    """
+    :param pack: Whether the images should be packed into a texture atlas.
+                 They can then also be looked up through get_atlas(fold_path),
+                 by their file name without extension
+    """
+    full_paths = {}
     for folder_path, _, file_names in os.walk(resource_path(fold_path)):
         for file_name in sorted(file_names, key=lambda name: int(name.split(".")[0])):
-            full_path = os.path.join(folder_path, file_name)
-            frames.append(
-                pygame.transform.scale_by(
-                    pygame.image.load(full_path).convert_alpha(), SCALE_FACTOR
-                )
-            )
-    return frames
+            full_paths[file_name.split(".")[0]] = os.path.join(folder_path, file_name)
+
+    start_decoding(full_paths.values(), _get_scaled_image_variant(True))
+    frames = {
+        name: _import_scaled_image(full_path) for name, full_path in full_paths.items()
+    }
 
+    if pack:
+        frames = _pack(fold_path, frames)
+    return list(frames.values())
 
-def import_folder_dict(fold_path: str) -> dict[str, pygame.Surface]:
-    frames = {}
+
+def import_folder_dict(fold_path: str, pack: bool = False) -> dict[str, pygame.Surface]:
+    """
+    :param pack: Whether the images should be packed into a texture atlas.
+                 They can then also be looked up through get_atlas(fold_path),
+                 by their file name without extension
+    """
+    full_paths = {}
     for folder_path, _, file_names in os.walk(resource_path(fold_path)):
         for file_name in file_names:
-            full_path = os.path.join(folder_path, file_name)
-            frames[file_name.split(".")[0]] = pygame.transform.scale_by(
-                pygame.image.load(full_path).convert_alpha(), SCALE_FACTOR
-            )
+            full_paths[file_name.split(".")[0]] = os.path.join(folder_path, file_name)
+
+    start_decoding(full_paths.values(), _get_scaled_image_variant(True))
+    frames = {
+        name: _import_scaled_image(full_path) for name, full_path in full_paths.items()
+    }
+
+    if pack:
+        frames = _pack(fold_path, frames)
     return frames
 
 
-def tmx_importer(tmx_path: str) -> settings.MapDict:
-    files = {}
-    for folder_path, _, file_names in os.walk(resource_path(tmx_path)):
-        for file_name in file_names:
-            full_path = os.path.join(folder_path, file_name)
-            files[file_name.split(".")[0]] = pytmx.util_pygame.load_pygame(full_path)
-    return files
+def tmx_importer(tmx_path: str) -> TmxMapRegistry:
+    """
+    :return: Registry of all maps in the folder, which are only loaded once
+             they are needed
+    """
+    return TmxMapRegistry(
+        resource_path(tmx_path),
+        TMX_MAP_CACHE_SIZE,
+        background_loading=not _IS_WEB,
+        compiled_path=resource_path(COMPILED_MAP_DIR),
+    )
+
+
+def _get_animation_variant(frame_size: int, resize: int | None) -> str:
+    return f"frame_size={frame_size},resize={resize},scale={SCALE_FACTOR}"
+
+
+def _import_animation_frames(
+    full_path: str, frame_size: int, resize: int | None
+) -> list[pygame.Surface]:
+    def build():
+        surf = get_decoded_image(full_path).convert_alpha()
+        frames = []
+        for col in range(surf.get_width() // frame_size):
+            subsurf_rect = pygame.Rect(col * frame_size, 0, frame_size, frame_size)
+            cutout_surf = surf.subsurface(subsurf_rect)
+
+            if resize:
+                frames.append(pygame.transform.scale(cutout_surf, (resize, resize)))
+            else:
+                frames.append(pygame.transform.scale_by(cutout_surf, SCALE_FACTOR))
+        return frames
+
+    variant = _get_animation_variant(frame_size, resize)
+    return asset_cache.get(full_path, variant, build)
 
 
 def animation_importer(
-    *ani_path: str, frame_size: int = None, resize: int = None
+    *ani_path: str, frame_size: int = None, resize: int = None, pack: bool = False
 ) -> settings.AniFrames:
+    """
+    :param pack: Whether the frames should be packed into a texture atlas.
+                 They can then also be looked up through
+                 get_atlas(os.path.join(*ani_path)), by the file name of their
+                 animation without extension and their index, e.g. "water/0"
+    """
     if frame_size is None:
         frame_size = TILE_SIZE
 
-    animation_dict = {}
+    full_paths = {}
     for folder_path, _, file_names in os.walk(os.path.join(*ani_path)):
         for file_name in file_names:
-            full_path = os.path.join(folder_path, file_name)
-            surf = pygame.image.load(full_path).convert_alpha()
-            animation_dict[str(file_name.split(".")[0])] = []
-            for col in range(surf.get_width() // frame_size):
-                subsurf_rect = pygame.Rect(col * frame_size, 0, frame_size, frame_size)
-                cutout_surf = surf.subsurface(subsurf_rect)
-
-                if resize:
-                    animation_dict[str(file_name.split(".")[0])].append(
-                        pygame.transform.scale(cutout_surf, (resize, resize))
-                    )
-                else:
-                    animation_dict[str(file_name.split(".")[0])].append(
-                        pygame.transform.scale_by(cutout_surf, SCALE_FACTOR)
-                    )
+            full_paths[file_name.split(".")[0]] = os.path.join(folder_path, file_name)
+
+    start_decoding(full_paths.values(), _get_animation_variant(frame_size, resize))
+    animation_dict = {
+        name: _import_animation_frames(full_path, frame_size, resize)
+        for name, full_path in full_paths.items()
+    }
+
+    if pack:
+        packed = _pack(
+            os.path.join(*ani_path),
+            {
+                f"{name}/{index}": frame
+                for name, frames in animation_dict.items()
+                for index, frame in enumerate(frames)
+            },
+        )
+        animation_dict = {
+            name: [packed[f"{name}/{index}"] for index in range(len(frames))]
+            for name, frames in animation_dict.items()
+        }
 
     return animation_dict
 
 
 def sound_importer(*snd_path: str, default_volume: float = 0.5) -> settings.SoundDict:
-    sounds_dict = {}
-
+    decoding = {}
     for sound_name in os.listdir(resource_path(os.path.join(*snd_path))):
-        key = sound_name.split(".")[0]
-        value = pygame.mixer.Sound(os.path.join(*snd_path, sound_name))
+        decoding[sound_name.split(".")[0]] = asset_loader.submit(
+            pygame.mixer.Sound, os.path.join(*snd_path, sound_name)
+        )
+
+    sounds_dict = {}
+    for key, future in decoding.items():
+        value = future.result()
         value.set_volume(default_volume)
         sounds_dict[key] = value
     return sounds_dict
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.asset_cache import AssetCache
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.source_path = os.path.join(self.temp_dir.name, "source.png")
+        self.source = pygame.Surface((2, 1), pygame.SRCALPHA)
+        self.source.set_at((0, 0), (10, 20, 30, 40))
+        self.source.set_at((1, 0), (50, 60, 70, 255))
+        pygame.image.save(self.source, self.source_path)
+
+        self.builds = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build(self):
+        self.builds += 1
+        surf = pygame.image.load(self.source_path).convert_alpha()
+        return [surf, pygame.transform.scale_by(surf, 2)]
+
+    def test_frames_are_loaded_from_disk(self):
+        cache = AssetCache(self.cache_dir)
+        cache.get(self.source_path, "", self.build)
+        cache.save()
+
+        cache = AssetCache(self.cache_dir)
+        frames = cache.get(self.source_path, "", self.build)
+
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+        self.assertEqual(1, self.builds)
+        self.assertEqual([(2, 1), (4, 2)], [frame.get_size() for frame in frames])
+        self.assertEqual((10, 20, 30, 40), frames[0].get_at((0, 0)))
+        self.assertEqual((50, 60, 70, 255), frames[1].get_at((3, 1)))
+
+    def test_stale_entries_are_rebuilt(self):
+        cache = AssetCache(self.cache_dir)
+        cache.get(self.source_path, "", self.build)
+        stat = os.stat(self.source_path)
+        os.utime(self.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        cache.get(self.source_path, "", self.build)
+        self.assertEqual(2, self.builds)
+        cache.get(self.source_path, "other variant", self.build)
+        self.assertEqual(3, self.builds)
+
+    def test_manifest_is_only_written_on_save(self):
+        cache = AssetCache(self.cache_dir)
+        cache.get(self.source_path, "", self.build)
+        AssetCache(self.cache_dir).get(self.source_path, "", self.build)
+        self.assertEqual(2, self.builds)
+
+        cache.save()
+        AssetCache(self.cache_dir).get(self.source_path, "", self.build)
+        self.assertEqual(2, self.builds)
@@ -0,0 +1,22 @@
+import threading
+import unittest
+
+from src.asset_loader import AssetLoader
+
+
+class TestAssetLoader(unittest.TestCase):
+    def test_tasks_run_in_worker_threads(self):
+        loader = AssetLoader(2)
+        futures = [loader.submit(threading.current_thread) for _ in range(4)]
+
+        for future in futures:
+            self.assertIsNot(threading.main_thread(), future.result())
+
+    def test_tasks_run_inline_without_workers(self):
+        loader = AssetLoader(0)
+        future = loader.submit(threading.current_thread)
+        self.assertTrue(future.done())
+        self.assertIs(threading.main_thread(), future.result())
+
+        future = loader.submit(int, "not a number")
+        self.assertIsInstance(future.exception(), ValueError)
@@ -0,0 +1,55 @@
+import os
+import unittest
+
+import pygame
+
+from src.atlas import TextureAtlas
+
+
+def _surface(width: int, height: int, color: tuple[int, int, int, int]):
+    surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self.atlas = TextureAtlas("test", 64)
+
+    def test_surfaces_are_copied_exactly(self):
+        surfaces = {
+            "opaque": _surface(16, 16, (10, 20, 30, 255)),
+            "translucent": _surface(8, 32, (200, 100, 50, 60)),
+        }
+        packed = self.atlas.pack(surfaces)
+
+        self.assertEqual(list(surfaces), list(packed))
+        for name, surf in surfaces.items():
+            self.assertIs(packed[name], self.atlas.get(name))
+            self.assertEqual(
+                pygame.image.tobytes(surf, "RGBA"),
+                pygame.image.tobytes(packed[name], "RGBA"),
+            )
+
+    def test_surfaces_share_pages(self):
+        self.atlas.pack({str(i): _surface(16, 16, (i, 0, 0, 255)) for i in range(8)})
+
+        self.assertEqual(1, len(self.atlas.pages))
+        self.assertEqual((64, 32), self.atlas.pages[0].get_size())
+        self.assertEqual([1.0], self.atlas.get_occupancy())
+
+    def test_pages_grow_to_fit_large_surfaces(self):
+        self.atlas.pack(
+            {
+                "large": _surface(100, 80, (0, 0, 0, 255)),
+                "small": _surface(8, 8, (0, 0, 0, 255)),
+            }
+        )
+
+        self.assertEqual(2, len(self.atlas.pages))
+        self.assertEqual((100, 80), self.atlas.pages[0].get_size())
+        self.assertEqual((8, 8), self.atlas.pages[1].get_size())
@@ -0,0 +1,27 @@
+import unittest
+
+from src.boot import BootTimer
+
+
+class TestBootTimer(unittest.TestCase):
+    def test_timings_of_a_stage_are_added_up(self):
+        timer = BootTimer()
+        for _ in range(2):
+            with timer.timed("images"):
+                pass
+        with timer.timed("sounds"):
+            pass
+
+        self.assertEqual(["images", "sounds"], list(timer.stages))
+        self.assertIn("total:", timer.get_report())
+
+    def test_only_the_first_frame_is_recorded(self):
+        timer = BootTimer()
+        self.assertNotIn("first frame", timer.get_report())
+
+        timer.mark_first_frame()
+        first_frame = timer.first_frame
+        timer.mark_first_frame()
+
+        self.assertEqual(first_frame, timer.first_frame)
+        self.assertIn("first frame", timer.get_report())
@@ -0,0 +1,57 @@
+import unittest
+
+import pygame
+
+from src.groups import SpatialGrid
+
+
+def _sprite(x: float, y: float, width: float = 16, height: float = 16):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.FRect(x, y, width, height)
+    return sprite
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialGrid(64)
+
+    def test_query_returns_overlapping_sprites(self):
+        inside = _sprite(10, 10)
+        spanning = _sprite(50, 50, 100, 100)
+        outside = _sprite(500, 500)
+        for sprite in (inside, spanning, outside):
+            self.grid.insert(sprite)
+
+        actual = self.grid.query(pygame.FRect(0, 0, 128, 128))
+        self.assertEqual({inside, spanning}, actual)
+
+    def test_query_is_exact_within_cell(self):
+        sprite = _sprite(40, 40)
+        self.grid.insert(sprite)
+
+        self.assertEqual(set(), self.grid.query(pygame.FRect(0, 0, 32, 32)))
+
+    def test_update_moves_sprite(self):
+        sprite = _sprite(0, 0)
+        self.grid.insert(sprite)
+
+        sprite.rect.topleft = (300, 300)
+        self.grid.update(sprite)
+
+        self.assertEqual(set(), self.grid.query(pygame.FRect(0, 0, 64, 64)))
+        self.assertEqual({sprite}, self.grid.query(pygame.FRect(256, 256, 64, 64)))
+
+    def test_remove(self):
+        sprite = _sprite(0, 0, 200, 200)
+        self.grid.insert(sprite)
+        self.grid.remove(sprite)
+
+        self.assertEqual(set(), self.grid.query(pygame.FRect(0, 0, 256, 256)))
+        # removing a Sprite twice should be a no-op
+        self.grid.remove(sprite)
+
+    def test_update_ignores_unknown_sprites(self):
+        sprite = _sprite(0, 0)
+        self.grid.update(sprite)
+
+        self.assertEqual(set(), self.grid.query(pygame.FRect(0, 0, 64, 64)))
@@ -0,0 +1,39 @@
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+from src.gui.health_bar import HealthProgressBar
+
+
+class TestHealthProgressBar(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        # resource paths are resolved relative to the game, not the tests
+        image = pygame.Surface((70, 14), pygame.SRCALPHA)
+        with mock.patch("src.gui.health_bar.import_image", return_value=image):
+            self.health_bar = HealthProgressBar(100)
+
+    def test_small_damage_does_not_re_render(self):
+        self.health_bar.apply_damage(10)
+        self.health_bar.get_blit()
+
+        with mock.patch("pygame.draw.rect") as draw_rect:
+            for _ in range(10):
+                self.health_bar.apply_damage(0.002)
+                self.health_bar.get_blit()
+
+        draw_rect.assert_not_called()
+
+    def test_visible_damage_re_renders(self):
+        self.health_bar.get_blit()
+
+        with mock.patch("pygame.draw.rect") as draw_rect:
+            self.health_bar.apply_damage(10)
+            self.health_bar.get_blit()
+
+        draw_rect.assert_called_once()
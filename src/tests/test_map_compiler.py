@@ -0,0 +1,76 @@
+import os
+import unittest
+
+import pygame
+import pytmx
+
+from src.compiled_map import (
+    CompiledObjectGroup,
+    CompiledTileLayer,
+    load_compiled_map,
+)
+from src.map_compiler import compile_map
+
+_MAPS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "maps")
+_TMX_PATH = os.path.join(_MAPS_PATH, "town.tmx")
+
+
+class TestMapCompiler(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self.tiled_map = pytmx.util_pygame.load_pygame(_TMX_PATH)
+        self.data = compile_map(_TMX_PATH)
+
+    def test_compiled_map_matches_tmx(self):
+        compiled_map = load_compiled_map(self.data, _MAPS_PATH)
+        self.assertFalse(compiled_map.converted)
+        compiled_map.convert()
+
+        self.assertEqual(
+            (self.tiled_map.width, self.tiled_map.height),
+            (compiled_map.width, compiled_map.height),
+        )
+        self.assertEqual(list(self.tiled_map.layernames), list(compiled_map.layernames))
+
+        for tiled_layer, layer in zip(
+            self.tiled_map.layers, compiled_map.layers, strict=True
+        ):
+            if isinstance(tiled_layer, pytmx.TiledTileLayer):
+                self.assertIsInstance(layer, CompiledTileLayer)
+                self.assertEqual(
+                    [(x, y) for x, y, _ in tiled_layer.tiles()],
+                    [(x, y) for x, y, _ in layer.tiles()],
+                )
+            elif isinstance(tiled_layer, pytmx.TiledObjectGroup):
+                self.assertIsInstance(layer, CompiledObjectGroup)
+                self.assertEqual(
+                    [(obj.name, obj.x, obj.y, obj.gid) for obj in tiled_layer],
+                    [(obj.name, obj.x, obj.y, obj.gid) for obj in layer],
+                )
+
+        for gid, image in enumerate(self.tiled_map.images):
+            if image is not None:
+                compiled_image = compiled_map.get_tile_image_by_gid(gid)
+                self.assertEqual(image.get_size(), compiled_image.get_size())
+                self.assertEqual(
+                    pygame.image.tobytes(image, "RGBA"),
+                    pygame.image.tobytes(compiled_image, "RGBA"),
+                )
+
+    def test_compiled_maps_load_without_display(self):
+        # loading must not depend on the display, so that maps can be loaded in
+        # a background thread
+        pygame.display.quit()
+        compiled_map = load_compiled_map(self.data, _MAPS_PATH)
+
+        self.assertIsNotNone(compiled_map)
+        self.assertFalse(compiled_map.converted)
+
+    def test_outdated_compiled_maps_are_rejected(self):
+        # the sources of the compiled map cannot be found relative to another
+        # folder, as if they had been changed since the map was compiled
+        self.assertIsNone(load_compiled_map(self.data, os.path.dirname(__file__)))
+        self.assertIsNone(load_compiled_map(b"not a compiled map", _MAPS_PATH))
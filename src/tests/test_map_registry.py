@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pygame
+
+from src import compiled_map
+from src.map_registry import TmxMapRegistry
+
+_MAPS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "maps")
+
+
+class TestTmxMapRegistry(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self.registry = TmxMapRegistry(_MAPS_PATH, 2)
+
+    def test_maps_are_parsed_on_demand(self):
+        self.assertIn("town", self.registry)
+        self.assertFalse(self.registry.is_loaded("town"))
+
+        tilemap = self.registry["town"]
+        self.assertTrue(self.registry.is_loaded("town"))
+        self.assertIs(tilemap, self.registry["town"])
+        self.assertIsNone(self.registry.get("bathhouse"))
+
+    def test_prefetched_maps_are_reused(self):
+        self.registry.prefetch(["forest", "bathhouse"])
+        tilemap = self.registry["forest"]
+
+        self.assertIs(tilemap, self.registry["forest"])
+        self.assertFalse(self.registry.is_loaded("bathhouse"))
+
+    def test_prefetched_maps_are_converted_on_the_main_thread(self):
+        converting_threads = set()
+        convert_tile = compiled_map._convert_tile
+
+        def record_thread(*args):
+            converting_threads.add(threading.current_thread())
+            return convert_tile(*args)
+
+        with mock.patch("src.compiled_map._convert_tile", record_thread):
+            self.registry.prefetch(["forest"])
+            while self.registry.is_loading("forest"):
+                time.sleep(0.001)
+            self.assertEqual(set(), converting_threads)
+
+            self.assertTrue(self.registry["forest"].converted)
+        self.assertEqual({threading.main_thread()}, converting_threads)
+
+    def test_least_recently_visited_maps_are_evicted(self):
+        self.registry["town"]
+        self.registry["forest"]
+        self.registry["minigame"]
+
+        self.assertFalse(self.registry.is_loaded("town"))
+        self.assertTrue(self.registry.is_loaded("forest"))
+        self.assertTrue(self.registry.is_loaded("minigame"))
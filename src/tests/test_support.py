@@ -0,0 +1,37 @@
+import unittest
+
+import pygame
+
+from src.support import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+        self.cache = TextCache(2)
+
+    def test_repeated_render_is_a_hit(self):
+        first = self.cache.render(self.font, "foo", False, "black")
+        second = self.cache.render(self.font, "foo", False, "black")
+
+        self.assertIs(first, second)
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    def test_color_objects_are_cached(self):
+        first = self.cache.render(self.font, "foo", True, pygame.Color("black"))
+        second = self.cache.render(self.font, "foo", True, pygame.Color("black"))
+
+        self.assertIs(first, second)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.render(self.font, "foo", False, "black")
+        self.cache.render(self.font, "bar", False, "black")
+        self.cache.render(self.font, "foo", False, "black")
+        self.cache.render(self.font, "baz", False, "black")
+
+        self.assertEqual(2, len(self.cache))
+        self.cache.render(self.font, "foo", False, "black")
+        self.assertEqual(2, self.cache.hits)
+        self.cache.render(self.font, "bar", False, "black")
+        self.assertEqual(4, self.cache.misses)
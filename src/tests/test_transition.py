@@ -0,0 +1,109 @@
+import gc
+import unittest
+from unittest import mock
+
+from src.overlay.transition import Transition
+from src.settings import TRANSITION_FRAME_BUDGET
+
+
+class _Clock:
+    """
+    Clock that only advances when told to, in place of both time.perf_counter
+    and pygame.time.get_ticks.
+    """
+
+    def __init__(self):
+        self.ms = 1000
+
+    def advance(self, ms: int):
+        self.ms += ms
+
+    def perf_counter(self) -> float:
+        return self.ms / 1000
+
+    def get_ticks(self) -> int:
+        return self.ms
+
+
+class TestTransition(unittest.TestCase):
+    def setUp(self):
+        self.gc_was_enabled = gc.isenabled()
+        gc.enable()
+
+        self.clock = _Clock()
+        for target, fake in (
+            ("time.perf_counter", self.clock.perf_counter),
+            ("pygame.time.get_ticks", self.clock.get_ticks),
+        ):
+            patcher = mock.patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.steps_done = []
+        self.fail_at_step = None
+        self.transition = Transition(self._reset, lambda: None, dur=100)
+
+    def tearDown(self):
+        if self.gc_was_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+    def _reset(self):
+        for step in range(3):
+            if step == self.fail_at_step:
+                raise RuntimeError("step failed")
+            # every step takes up the whole frame budget
+            self.clock.advance(TRANSITION_FRAME_BUDGET)
+            self.steps_done.append(step)
+            yield
+
+    def _update_until_peak(self):
+        self.transition.activate()
+        self.clock.advance(60)
+        self.transition.update()
+
+    def test_reset_steps_are_spread_across_frames(self):
+        self._update_until_peak()
+        self.assertEqual([0], self.steps_done)
+        self.assertTrue(self.transition.resetting)
+
+        self.transition.update()
+        self.assertEqual([0, 1], self.steps_done)
+
+    def test_transition_is_held_until_all_reset_steps_are_done(self):
+        self._update_until_peak()
+        while self.transition.resetting:
+            # the transition would have finished long ago if it was not held
+            self.clock.advance(200)
+            self.assertTrue(self.transition)
+            self.assertFalse(gc.isenabled())
+            self.transition.update()
+
+        self.assertEqual([0, 1, 2], self.steps_done)
+        self.assertTrue(gc.isenabled())
+
+    def test_failing_reset_step_restores_gc(self):
+        self.fail_at_step = 1
+        self._update_until_peak()
+
+        with self.assertRaises(RuntimeError):
+            self.transition.update()
+
+        self.assertFalse(self.transition.resetting)
+        self.assertTrue(gc.isenabled())
+
+    def test_abandoned_reset_restores_gc(self):
+        self._update_until_peak()
+        self.transition.activate()
+
+        self.assertFalse(self.transition.resetting)
+        self.assertTrue(gc.isenabled())
+
+    def test_gc_stays_disabled_if_it_was_before(self):
+        gc.disable()
+        self._update_until_peak()
+        while self.transition.resetting:
+            self.transition.update()
+
+        self.assertFalse(gc.isenabled())
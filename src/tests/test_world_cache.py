@@ -0,0 +1,47 @@
+import unittest
+
+import pygame
+
+from src.enums import Map
+from src.screens.world_cache import MapWorld, WorldCache, estimate_world_size
+
+
+def _create_world(size: int) -> MapWorld:
+    return MapWorld(game_map=None, sprites=[], size=size)
+
+
+class TestWorldCache(unittest.TestCase):
+    def test_least_recently_left_worlds_are_evicted(self):
+        cache = WorldCache(budget=100)
+        cache.put(Map.TOWN, _create_world(40))
+        cache.put(Map.FOREST, _create_world(40))
+        cache.put(Map.NEW_FARM, _create_world(40))
+
+        self.assertNotIn(Map.TOWN, cache)
+        self.assertIn(Map.FOREST, cache)
+        self.assertIn(Map.NEW_FARM, cache)
+        self.assertEqual(80, cache.get_size())
+
+    def test_worlds_larger_than_the_budget_are_not_cached(self):
+        cache = WorldCache(budget=100)
+        cache.put(Map.TOWN, _create_world(40))
+        cache.put(Map.FOREST, _create_world(120))
+
+        self.assertIn(Map.TOWN, cache)
+        self.assertNotIn(Map.FOREST, cache)
+
+    def test_worlds_are_removed_once_reentered(self):
+        cache = WorldCache(budget=100)
+        world = _create_world(40)
+        cache.put(Map.TOWN, world)
+
+        self.assertIs(world, cache.pop(Map.TOWN))
+        self.assertIsNone(cache.pop(Map.TOWN))
+
+    def test_shared_images_are_counted_once(self):
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        sprites = [pygame.sprite.Sprite(), pygame.sprite.Sprite()]
+        for sprite in sprites:
+            sprite.image = image
+
+        self.assertEqual(10 * 10 * 4, estimate_world_size(sprites))